@@ -0,0 +1,287 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import functools
+import math
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from geometry import lineIntersections, ringPoints
+
+# ******************************************************************************
+Tolerance: float = 1e-7  # distance under which points are merged
+
+# ==============================================================================
+@dataclass(frozen=True)
+class Arrangement:
+    """Planar graph of a set of chords of a circle, cut at all their crossings.
+
+    The arrays are read-only when the arrangement comes from the cache.
+
+    Attributes:
+        vertices (NDArray[np.float64]): `(v, 3)` vertices, the chord endpoints
+            on the circle first and then the crossings.
+        edges (NDArray[np.int_]): `(e, 2)` vertex indices of the pieces of the
+            chords between consecutive vertices, each piece once.
+        faces (tuple[NDArray[np.int_], ...]): The bounded faces, as vertex
+            indices counterclockwise around each.
+        areas (NDArray[np.float64]): `(f,)` area of each face.
+        centroids (NDArray[np.float64]): `(f, 3)` centroid of each face.
+    """
+    vertices: NDArray[np.float64]
+    edges: NDArray[np.int_]
+    faces: tuple[NDArray[np.int_], ...]
+    areas: NDArray[np.float64]
+    centroids: NDArray[np.float64]
+
+    def polygon(self, face: int) -> NDArray[np.float64]:
+        """Get the corners of a face, counterclockwise, e.g. for a `Polygon`."""
+        return self.vertices[self.faces[face]]
+
+    def faceAt(self, point: Sequence[float] | NDArray[np.float64]) -> int | None:
+        """Find the face containing a point, or None outside all of them."""
+        x, y = point[0], point[1]
+        for i, face in enumerate(self.faces):
+            corners = self.vertices[face]
+            x1, y1 = corners[:, 0], corners[:, 1]
+            x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+            crosses = (y1 > y) != (y2 > y)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                xs = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+            if np.count_nonzero(crosses & (xs > x)) % 2:
+                return i
+        return None
+
+# ******************************************************************************
+def starChords(n: int, interval: int) -> NDArray[np.int_]:
+    """Get the chords of an `{n/interval}` star as `(n, 2)` pairs of point indices."""
+    i = np.arange(n)
+    return np.stack([i, (i + interval) % n], axis=-1)
+
+# ******************************************************************************
+def mergePoints(xy: NDArray[np.float64], tolerance: float = Tolerance
+                ) -> tuple[NDArray[np.int_], NDArray[np.float64]]:
+    """Merge points closer than a tolerance, without comparing all pairs.
+
+    The points are binned into a grid with cells of the tolerance; points in
+    the same or neighbouring cells are merged, transitively.
+
+    Args:
+        xy (NDArray[np.float64]): `(m, 2)` points.
+        tolerance (float, optional): The merging distance. Default is `Tolerance`.
+
+    Returns:
+        tuple: `(m,)` index of the merged point of each point, and the `(k, 2)`
+            merged points, the means of the points merged into each.
+    """
+    if len(xy) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros((0, 2))
+    cells = np.floor(xy / tolerance).astype(np.int64)
+    cells, cellOf = np.unique(cells, axis=0, return_inverse=True)
+    cellOf = cellOf.reshape(-1)
+
+    # link each occupied cell to its occupied neighbours, looked up by binary
+    # search in the cells, which `np.unique` leaves sorted row by row
+    keys = _rows(cells)
+    a, b = [], []
+    for dx, dy in ((1, -1), (1, 0), (1, 1), (0, 1)):
+        wanted = _rows(cells + (dx, dy))
+        found = np.minimum(np.searchsorted(keys, wanted), len(keys) - 1)
+        hit = keys[found] == wanted
+        a.append(np.flatnonzero(hit))
+        b.append(found[hit])
+    a, b = np.concatenate(a), np.concatenate(b)
+
+    # connected components, by propagating the smallest cell index
+    labels = np.arange(len(cells))
+    while True:
+        updated = labels.copy()
+        np.minimum.at(updated, a, labels[b])
+        np.minimum.at(updated, b, labels[a])
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+
+    _, merged = np.unique(labels[cellOf], return_inverse=True)
+    merged = merged.reshape(-1)
+    counts = np.bincount(merged)
+    centers = np.stack([np.bincount(merged, xy[:, 0]), np.bincount(merged, xy[:, 1])], axis=-1)
+    return merged, centers / counts[:, None]
+
+# ******************************************************************************
+def _rows(cells: NDArray[np.int64]) -> NDArray[np.void]:
+    """View `(m, 2)` grid cells as `(m,)` records, compared and sorted by row."""
+    return np.ascontiguousarray(cells).view([("x", np.int64), ("y", np.int64)]).reshape(-1)
+
+# ******************************************************************************
+def chordCrossings(lo: NDArray[np.int_], hi: NDArray[np.int_]) -> tuple[NDArray[np.int_], NDArray[np.int_]]:
+    """Find every pair of crossing chords, from the order of their endpoints on the circle.
+
+    Two chords cross inside the circle if and only if their endpoints
+    interleave, `lo[i] < lo[j] < hi[i] < hi[j]`. With the chords sorted by
+    `lo`, the chords starting inside chord `i` are a contiguous run, so only
+    those are tested instead of all pairs.
+
+    Args:
+        lo, hi (NDArray[np.int_]): `(m,)` ranks of the endpoints of each chord
+            in counterclockwise order, with `lo < hi`.
+
+    Returns:
+        tuple: The indices `i` and `j` of each pair of crossing chords.
+    """
+    order = np.argsort(lo, kind="stable")
+    sortedLo = lo[order]
+    first = np.searchsorted(sortedLo, lo, side="right")
+    last = np.searchsorted(sortedLo, hi, side="left")
+    counts = np.maximum(last - first, 0)
+    i = np.repeat(np.arange(len(lo)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    j = order[np.repeat(first, counts) + offsets]
+    crossing = hi[j] > hi[i]
+    return i[crossing], j[crossing]
+
+# ******************************************************************************
+def arrangement(points: NDArray[np.float64], chords: NDArray[np.int_], *,
+                center: Sequence[float] | NDArray[np.float64] = (0.0, 0.0, 0.0),
+                tolerance: float = Tolerance) -> Arrangement:
+    """Cut chords of a circle at all their crossings into a planar graph.
+
+    Coincident endpoints, duplicate chords and crossings of three or more
+    chords at one point are merged within the tolerance.
+
+    Args:
+        points (NDArray[np.float64]): `(p, 3)` points on a circle.
+        chords (NDArray[np.int_]): `(m, 2)` indices of the points joined by each chord.
+        center (Sequence[float], optional): The center of the circle. Default is the origin.
+        tolerance (float, optional): The merging distance. Default is `Tolerance`.
+
+    Returns:
+        Arrangement: The vertices, edges and bounded faces.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    chords = np.asarray(chords, dtype=np.int64).reshape(-1, 2)
+    center = np.asarray(center, dtype=np.float64)
+
+    # rank the points counterclockwise, merging coincident ones
+    rel = points[:, :2] - center[:2]
+    angles = np.arctan2(rel[:, 1], rel[:, 0]) % math.tau
+    order = np.argsort(angles)
+    radius = float(np.hypot(rel[:, 0], rel[:, 1]).max())
+    gaps = np.diff(angles[order]) * radius > tolerance
+    ranks = np.empty(len(points), dtype=np.int64)
+    ranks[order] = np.concatenate([[0], np.cumsum(gaps)])
+    if len(points) > 1 and (angles[order[0]] + math.tau - angles[order[-1]]) * radius <= tolerance:
+        ranks[ranks == ranks[order[-1]]] = 0
+        ranks = np.unique(ranks, return_inverse=True)[1].reshape(-1)
+    ends = np.zeros((ranks.max() + 1, 3))
+    ends[ranks] = points
+
+    # unique chords as (lo, hi) ranks
+    r = ranks[chords]
+    r = np.unique(np.sort(r, axis=1), axis=0)
+    lo, hi = r[r[:, 0] != r[:, 1]].T
+
+    i, j = chordCrossings(lo, hi)
+    crossings = lineIntersections(ends[lo[i]], ends[hi[i]], ends[lo[j]], ends[hi[j]])
+    merged, xy = mergePoints(crossings[:, :2], tolerance)
+    vertices = np.concatenate([ends, np.concatenate([xy, np.zeros((len(xy), 1))], axis=-1)])
+    crossingVertex = len(ends) + merged
+
+    # order the vertices along each chord, joining consecutive ones
+    chord = np.concatenate([np.arange(len(lo)), np.arange(len(lo)), i, j])
+    vertex = np.concatenate([lo, hi, crossingVertex, crossingVertex])
+    a, b = ends[lo[chord], :2], ends[hi[chord], :2]
+    t = np.einsum("ij,ij->i", vertices[vertex, :2] - a, b - a)
+    order = np.lexsort((t, chord))
+    chord, vertex = chord[order], vertex[order]
+    link = (chord[1:] == chord[:-1]) & (vertex[1:] != vertex[:-1])
+    edges = np.unique(np.sort(np.stack([vertex[:-1][link], vertex[1:][link]], axis=-1), axis=1), axis=0)
+
+    faces, areas, centroids = _faces(vertices, edges)
+    return Arrangement(vertices, edges, faces, areas, centroids)
+
+# ******************************************************************************
+def _faces(vertices: NDArray[np.float64], edges: NDArray[np.int_]
+           ) -> tuple[tuple[NDArray[np.int_], ...], NDArray[np.float64], NDArray[np.float64]]:
+    """Trace the bounded faces of a planar graph, counterclockwise, with their areas and centroids.
+
+    Each edge is split into two half-edges. Arriving at a vertex, a face turns
+    into the next half-edge clockwise from the one going back, so it keeps to
+    its left; the unbounded faces come out clockwise and are dropped.
+    """
+    origin = np.concatenate([edges[:, 0], edges[:, 1]])
+    target = np.concatenate([edges[:, 1], edges[:, 0]])
+    direction = vertices[target, :2] - vertices[origin, :2]
+    angle = np.arctan2(direction[:, 1], direction[:, 0])
+    order = np.lexsort((angle, origin))  # half-edges counterclockwise around each vertex
+    position = np.empty_like(order)
+    position[order] = np.arange(len(order))
+    start = np.searchsorted(origin[order], np.arange(len(vertices)))
+    degree = np.bincount(origin, minlength=len(vertices))
+
+    twin = np.concatenate([np.arange(len(edges)) + len(edges), np.arange(len(edges))])
+    back = position[twin]
+    v = origin[twin]
+    following = order[start[v] + (back - start[v] - 1) % degree[v]]
+
+    # follow the cycles of half-edges in plain Python, the only sequential part
+    following = following.tolist()
+    face = np.empty(len(origin), dtype=np.int64)
+    cycles: list[list[int]] = []
+    visited = [False] * len(origin)
+    for h in range(len(origin)):
+        if visited[h]:
+            continue
+        cycle = []
+        while not visited[h]:
+            visited[h] = True
+            cycle.append(h)
+            h = following[h]
+        face[cycle] = len(cycles)
+        cycles.append(cycle)
+
+    # shoelace sums of all faces at once
+    (x1, y1), (x2, y2) = vertices[origin, :2].T, vertices[target, :2].T
+    cross = x1 * y2 - x2 * y1
+    areas = np.bincount(face, cross, len(cycles)) / 2
+    bounded = np.flatnonzero(areas > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cx = np.bincount(face, (x1 + x2) * cross, len(cycles)) / (6 * areas)
+        cy = np.bincount(face, (y1 + y2) * cross, len(cycles)) / (6 * areas)
+    centroids = np.stack([cx, cy, np.zeros(len(cycles))], axis=-1)[bounded]
+    return tuple(origin[cycles[f]] for f in bounded), areas[bounded], centroids
+
+# ******************************************************************************
+@functools.lru_cache(maxsize=64)
+def starArrangement(families: tuple[tuple[int, int], ...], radius: float = 1.0,
+                    tolerance: float = Tolerance) -> Arrangement:
+    """Get the arrangement of the chords of several stars on one circle, once per process.
+
+    Args:
+        families (tuple[tuple[int, int], ...]): The `(n, interval)` of each star,
+            e.g. `((12, 5), (12, 3))` for a rosette; stars of different `n` share
+            the points they have in common.
+        radius (float, optional): The radius of the circle. Default is 1.
+        tolerance (float, optional): The merging distance. Default is `Tolerance`.
+
+    Returns:
+        Arrangement: The read-only vertices, edges and faces.
+    """
+    points, chords, offset = [], [], 0
+    for n, interval in families:
+        points.append(ringPoints(radius, n))
+        chords.append(starChords(n, interval) + offset)
+        offset += n
+    result = arrangement(np.concatenate(points), np.concatenate(chords), tolerance=tolerance)
+    for a in (result.vertices, result.edges, result.areas, result.centroids, *result.faces):
+        a.setflags(write=False)
+    return result
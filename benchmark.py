@@ -0,0 +1,286 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import argparse
+import datetime
+import fnmatch
+import json
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+import arrangement
+import geometry
+
+# ******************************************************************************
+# A benchmark is a setup function returning the callable to be timed. Setups
+# run once per benchmark, outside the timing, and may return a cleanup too.
+# Benchmarks that need manim and the scenes are registered by loaders, which
+# import them only when a benchmark of theirs is asked for, so the geometry
+# benchmarks run without loading manim.
+Setup = Callable[[], Callable[[], object] | tuple[Callable[[], object], Callable[[], None]]]
+Benchmarks: dict[str, Setup] = {}
+Loaders: dict[str, Callable[[], None]] = {}
+
+# ******************************************************************************
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """Register a benchmark setup under the given name."""
+    def register(setup: Setup) -> Setup:
+        Benchmarks[name] = setup
+        return setup
+    return register
+
+# ******************************************************************************
+def benchmarks(prefix: str) -> Callable[[Callable[[], None]], Callable[[], None]]:
+    """Register a loader of the benchmarks whose names start with the given prefix."""
+    def register(loader: Callable[[], None]) -> Callable[[], None]:
+        Loaders[prefix] = loader
+        return loader
+    return register
+
+# ******************************************************************************
+def load(patterns: list[str] | None = None) -> None:
+    """Run the loaders of the benchmarks that may match any of the patterns, or all of them.
+
+    A loader runs if the literal start of a pattern, up to its first wildcard,
+    and the loader's prefix agree as far as the shorter of the two goes.
+    """
+    starts = [re.split(r"[*?\[]", p, maxsplit=1)[0] for p in patterns or [""]]
+    for prefix in [prefix for prefix in Loaders
+                   if any(prefix.startswith(start) or start.startswith(prefix) for start in starts)]:
+        Loaders.pop(prefix)()
+
+# ******************************************************************************
+def timeit(func: Callable[[], object], repeat: int = 5, minTime: float = 0.2) -> dict:
+    """Time a callable, calling it enough times in each repeat to last at least `minTime`.
+
+    Returns:
+        dict: The best and median time of one call in seconds, with the number
+            of calls in each repeat and the number of repeats.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= minTime or number >= 1 << 20:
+            break
+        number *= 10 if elapsed < minTime / 10 else 2
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return {"min": min(times), "median": float(np.median(times)), "number": number, "repeat": repeat}
+
+# ******************************************************************************
+# Geometry
+for _n in (6, 8, 12, 16, 24, 32, 48, 64, 96):
+    @benchmark(f"intersections.regular[{_n}]")
+    def _(n: int = _n):
+        points, interval = list(geometry.ringPoints(3.0, n)), max(2, n // 4)
+        return lambda: geometry.intersections(points, interval, n)
+
+    @benchmark(f"intersections.general[{_n}]")
+    def _(n: int = _n):
+        # jitter the radii so the closed form for regular rings does not apply
+        radii = 3.0 + 1e-3 * np.random.default_rng(n).standard_normal(n)
+        angles = np.linspace(0.0, 2 * np.pi, n, endpoint=False)
+        points = list(np.stack([radii * np.cos(angles), radii * np.sin(angles), np.zeros(n)], axis=1))
+        interval = max(2, n // 4)
+        return lambda: geometry.intersections(points, interval, n)
+
+    @benchmark(f"arrangement[{_n}]")
+    def _(n: int = _n):
+        # a rosette of three interleaved stars, uncached
+        families = ((n, max(2, n // 4)), (n, max(2, n // 3)), (n, max(2, n // 8)))
+        points = np.concatenate([geometry.ringPoints(3.0, n)] * len(families))
+        chords = np.concatenate([arrangement.starChords(n, k) + i * n for i, (_, k) in enumerate(families)])
+        return lambda: arrangement.arrangement(points, chords)
+
+# ******************************************************************************
+# Scene construction, without rendering
+@benchmarks("construct")
+def _():
+    import npointstars
+    import render
+    import texcache
+
+    for scene in render.sceneClasses(npointstars):
+        @benchmark(f"construct[{scene.__name__}]")
+        def _(sceneClass: type = scene):
+            texcache.constructScene(sceneClass)  # fill the TeX cache outside the timing
+            return lambda: texcache.constructScene(sceneClass)
+
+# ******************************************************************************
+# TeX, cold compiles into an empty cache and warm cache hits
+@benchmarks("TexWrappedText")
+def _():
+    import npointstars
+    import texcache
+
+    @benchmark("TexWrappedText.cold")
+    def _():
+        directory = tempfile.TemporaryDirectory(prefix="texbench-")
+        previous, texcache.texCache.directory = texcache.texCache.directory, Path(directory.name)
+
+        def restore():
+            texcache.texCache.directory = previous
+            directory.cleanup()
+        # a new string every call, so neither cache nor manim's SVG files are hit
+        return lambda: npointstars.TexWrappedText(f"Join every second dot ({time.time_ns()})"), restore
+
+    @benchmark("TexWrappedText.warm")
+    def _():
+        npointstars.TexWrappedText("Join every second dot")
+        return lambda: npointstars.TexWrappedText("Join every second dot")
+
+# ******************************************************************************
+# Dashes
+@benchmarks("dashed")
+def _():
+    from manim import DEGREES, Arc, Circle, Line
+
+    import npointstars
+
+    for name, make in (("circle", lambda: Circle(radius=3.0)),
+                       ("arc", lambda: Arc(radius=2.0, angle=10 * DEGREES)),
+                       ("line", lambda: Line((-3, 0, 0), (3, 0, 0)))):
+        @benchmark(f"dashed.cold[{name}]")
+        def _(make: Callable = make):
+            mobject = make()
+
+            def run():
+                npointstars._dashPrototype.cache_clear()
+                return npointstars.dashed(mobject)
+            return run
+
+        @benchmark(f"dashed.warm[{name}]")
+        def _(make: Callable = make):
+            mobject = make()
+            return lambda: npointstars.dashed(mobject)
+
+# ******************************************************************************
+# One frame of the final state of a scene at each quality
+@benchmarks("frame")
+def _():
+    from manim import QUALITIES, tempconfig
+
+    import npointstars
+    import render
+    import texcache
+
+    for quality in [name for name, q in QUALITIES.items() if q["flag"]]:
+        @benchmark(f"frame[{quality}]")
+        def _(quality: str = quality):
+            with tempconfig({}):
+                render.applyQuality(quality)
+                scene = texcache.constructScene(npointstars.SixPointStar)
+            return lambda: scene.renderer.update_frame(scene)
+
+# ******************************************************************************
+def run(patterns: list[str] | None = None, repeat: int = 5, minTime: float = 0.2) -> dict:
+    """Run the benchmarks matching any of the patterns, or all of them.
+
+    Args:
+        patterns (list[str], optional): Shell-style patterns of benchmark names.
+        repeat (int, optional): Number of timed repeats. Default is 5.
+        minTime (float, optional): Shortest time of one repeat in seconds. Default is 0.2.
+
+    Returns:
+        dict: The environment the benchmarks ran in and the timing of each.
+    """
+    load(patterns)
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    results = {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "commit": commit,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "manim": getattr(sys.modules.get("manim"), "__version__", None),
+            "machine": platform.platform(),
+        },
+        "results": {},
+    }
+    for name, setup in Benchmarks.items():
+        if patterns and not any(fnmatch.fnmatchcase(name, p) for p in patterns):
+            continue
+        prepared = setup()
+        func, cleanup = prepared if isinstance(prepared, tuple) else (prepared, None)
+        try:
+            results["results"][name] = timeit(func, repeat, minTime)
+        finally:
+            if cleanup is not None:
+                cleanup()
+        print(f"{name:<40} {results['results'][name]['min'] * 1e3:12.3f} ms", flush=True)
+    return results
+
+# ******************************************************************************
+def compare(results: dict, baseline: dict, threshold: float = 0.2) -> list[str]:
+    """Find the benchmarks that got slower than the baseline.
+
+    The best times are compared, as they are the least affected by noise.
+
+    Args:
+        results (dict): Results of `run`.
+        baseline (dict): Earlier results of `run`.
+        threshold (float, optional): Allowed slow down, as a fraction. Default is 0.2.
+
+    Returns:
+        list[str]: A description of each regression.
+    """
+    regressions = []
+    for name, result in results["results"].items():
+        before = baseline["results"].get(name)
+        if before and result["min"] > before["min"] * (1 + threshold):
+            regressions.append(f"{name}: {before['min'] * 1e3:.3f} ms -> {result['min'] * 1e3:.3f} ms "
+                               f"({result['min'] / before['min'] - 1:+.0%})")
+    return regressions
+
+# ******************************************************************************
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark geometry, construction, TeX and frame rendering.")
+    parser.add_argument("patterns", nargs="*", help="only run benchmarks matching these patterns, e.g. 'dashed.*'")
+    parser.add_argument("-o", "--output", type=Path, help="results file, default media/benchmarks/<commit>.json")
+    parser.add_argument("-b", "--baseline", type=Path, help="fail on regressions against these results")
+    parser.add_argument("-t", "--threshold", type=float, default=0.2, help="allowed slow down, default 0.2")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="number of timed repeats")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        load(args.patterns)
+        print("\n".join(name for name in Benchmarks
+                        if not args.patterns or any(fnmatch.fnmatchcase(name, p) for p in args.patterns)))
+        sys.exit(0)
+    results = run(args.patterns, args.repeat)
+    mediaDir = Path(sys.modules["manim"].config.media_dir) if "manim" in sys.modules else Path("media")
+    output = args.output or mediaDir / "benchmarks" / f"{results['meta']['commit'] or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"Results written to {output}")
+
+    if args.baseline is not None:
+        regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        sys.exit(1 if regressions else 0)
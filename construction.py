@@ -0,0 +1,312 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from geometry import circleIntersections, lineCircleIntersections, lineIntersections
+
+# ******************************************************************************
+# Choosing one of the two intersections of a circle: by index in the order the
+# geometry routines return them, or by position
+_Which = int | str
+_Sides: dict[str, tuple[int, Callable]] = {
+    "upper": (1, np.argmax), "lower": (1, np.argmin),
+    "right": (0, np.argmax), "left": (0, np.argmin),
+}
+
+# ==============================================================================
+@dataclass
+class Node:
+    """A node of a `Construction`: a parameter, point, line, circle or arc.
+
+    Attributes:
+        name (str): The unique name of the node.
+        kind (str): "parameter", "point", "derived", "line", "circle",
+            "intersection" or "arc".
+        inputs (tuple[str, ...]): The names of the nodes it is constructed from.
+        level (int): One more than the highest level of its inputs; 0 for inputs.
+        func (Callable, optional): The function computing a derived node.
+        which (int | str): The intersection to take, for circle intersections.
+    """
+    name: str
+    kind: str
+    inputs: tuple[str, ...] = ()
+    level: int = 0
+    func: Callable | None = None
+    which: _Which = 0
+    dependents: list[str] = field(default_factory=list)
+
+# ==============================================================================
+class Construction:
+    """A compass and straightedge construction, as a DAG of geometric nodes.
+
+    Points are arrays of shape `(..., 3)`, lines are `(..., 2, 3)` pairs of
+    points, circles are `(center, radius)` pairs and arcs are `(center, radius,
+    startAngle, angle)`. The leading dimensions come from the parameters, so
+    setting a parameter to an array evaluates the whole construction for every
+    value at once.
+
+    Nodes are evaluated level by level, and all the intersections of one kind
+    on a level are solved in a single vectorized call. Setting a parameter only
+    marks the nodes depending on it, and the next evaluation recomputes just
+    those.
+
+    Example:
+        c = Construction()
+        radius = c.parameter("radius", 2.0)
+        center = c.point("O", (0, 0, 0))
+        circle = c.circle("circle", center, radius)
+        baseline = c.line("baseline", center, c.point("X", (1, 0, 0)))
+        a = c.intersect("A", baseline, circle, which="right")
+        c["A"]  # array([2., 0., 0.])
+    """
+    def __init__(self):
+        self.nodes: dict[str, Node] = {}
+        self.values: dict[str, Any] = {}
+        self.dirty: set[str] = set()
+        self.evaluations = 0
+
+    def __getitem__(self, node: Node | str) -> Any:
+        """Get the value of a node, evaluating the construction if needed."""
+        if self.dirty:
+            self.evaluate()
+        return self.values[_name(node)]
+
+    def __contains__(self, node: Node | str) -> bool:
+        return _name(node) in self.nodes
+
+    def _add(self, name: str, kind: str, inputs: Sequence[Node | str] = (), **options) -> Node:
+        if name in self.nodes:
+            raise ValueError(f"The construction already has a node named {name!r}.")
+        inputs = tuple(_name(i) for i in inputs)
+        for i in inputs:
+            if i not in self.nodes:
+                raise KeyError(f"Unknown node {i!r} in the inputs of {name!r}.")
+        level = 1 + max((self.nodes[i].level for i in inputs), default=-1)
+        node = Node(name, kind, inputs, level, **options)
+        self.nodes[name] = node
+        for i in inputs:
+            self.nodes[i].dependents.append(name)
+        self.dirty.add(name)
+        return node
+
+    def _constant(self, name: str, value: float | Node | str) -> Node | str:
+        return value if isinstance(value, (Node, str)) else self.parameter(name, value)
+
+    def parameter(self, name: str, value: float | NDArray[np.float64]) -> Node:
+        """Add an input value, such as a radius; an array of values sweeps over them."""
+        node = self._add(name, "parameter")
+        self.set(name, value)
+        return node
+
+    def point(self, name: str, xyz: Sequence[float] | NDArray[np.float64]) -> Node:
+        """Add a fixed point."""
+        node = self._add(name, "point")
+        self.set(name, xyz)
+        return node
+
+    def derive(self, name: str, func: Callable, *inputs: Node | str) -> Node:
+        """Add a node computed by a function of the values of other nodes."""
+        return self._add(name, "derived", inputs, func=func)
+
+    def line(self, name: str, a: Node | str, b: Node | str) -> Node:
+        """Add the line through two points."""
+        return self._add(name, "line", (a, b))
+
+    def circle(self, name: str, center: Node | str, radius: float | Node | str) -> Node:
+        """Add a circle around a center, with a radius given as a number, a
+        parameter, or a point the circle passes through."""
+        return self._add(name, "circle", (center, self._constant(f"{name}.radius", radius)))
+
+    def intersect(self, name: str, a: Node | str, b: Node | str, which: _Which = 0) -> Node:
+        """Add the intersection of two lines, a line and a circle, or two circles.
+
+        Args:
+            name (str): The name of the point.
+            a (Node | str): A line or circle.
+            b (Node | str): A line or circle.
+            which (int | str, optional): For a circle, which of the two
+                intersections to take: "upper", "lower", "left" or "right", or
+                0 or 1 in the order of `lineCircleIntersections` and
+                `circleIntersections`. Default is 0.
+        """
+        kinds = {self.nodes[_name(a)].kind, self.nodes[_name(b)].kind}
+        if not kinds <= {"line", "circle"}:
+            raise TypeError(f"Can only intersect lines and circles, not {' and '.join(sorted(kinds))}.")
+        if isinstance(which, str) and which not in _Sides:
+            raise ValueError(f"Unknown intersection {which!r}, use one of {', '.join(_Sides)}.")
+        return self._add(name, "intersection", (a, b), which=which)
+
+    def arc(self, name: str, circle: Node | str, start: Node | str, end: Node | str) -> Node:
+        """Add the counterclockwise arc of a circle from one of its points to another.
+
+        Its value is the center, radius, start angle and counterclockwise angle
+        of the arc; the angle is 0 when both ends are the same point.
+        """
+        return self._add(name, "arc", (circle, start, end))
+
+    def set(self, name: Node | str, value: Any) -> None:
+        """Change the value of a parameter or fixed point, marking the nodes depending on it."""
+        name = _name(name)
+        if self.nodes[name].kind not in ("parameter", "point"):
+            raise ValueError(f"{name!r} is constructed, only parameters and points can be set.")
+        self.values[name] = np.asarray(value, dtype=np.float64)
+        self.dirty.discard(name)
+        pending = list(self.nodes[name].dependents)
+        while pending:
+            dependent = pending.pop()
+            if dependent not in self.dirty:
+                self.dirty.add(dependent)
+                pending.extend(self.nodes[dependent].dependents)
+
+    def evaluate(self) -> int:
+        """Recompute the nodes whose inputs changed.
+
+        Returns:
+            int: The number of nodes recomputed.
+        """
+        levels: dict[int, list[Node]] = {}
+        for name in self.dirty:
+            levels.setdefault(self.nodes[name].level, []).append(self.nodes[name])
+        for level in sorted(levels):
+            intersections: dict[tuple[str, str], list[Node]] = {}
+            for node in levels[level]:
+                if node.kind == "intersection":
+                    kinds = tuple(sorted(self.nodes[i].kind for i in node.inputs))
+                    intersections.setdefault(kinds, []).append(node)
+                else:
+                    self.values[node.name] = self._compute(node)
+            for kinds, nodes in intersections.items():
+                self._intersect(kinds, nodes)
+        count = len(self.dirty)
+        self.evaluations += count
+        self.dirty.clear()
+        return count
+
+    def _compute(self, node: Node) -> Any:
+        values = [self.values[i] for i in node.inputs]
+        if node.kind == "derived":
+            return node.func(*values)
+        if node.kind == "line":
+            a, b = np.broadcast_arrays(*values)
+            return np.stack([a, b], axis=-2)
+        if node.kind == "circle":
+            center, radius = values
+            if self.nodes[node.inputs[1]].kind in ("point", "intersection"):
+                radius = np.linalg.norm(radius - center, axis=-1)
+            shape = np.broadcast_shapes(center.shape[:-1], radius.shape)
+            return np.broadcast_to(center, shape + (3,)), np.broadcast_to(radius, shape)
+        if node.kind == "arc":
+            (center, radius), start, end = values
+            startAngle = np.arctan2(start[..., 1] - center[..., 1], start[..., 0] - center[..., 0])
+            endAngle = np.arctan2(end[..., 1] - center[..., 1], end[..., 0] - center[..., 0])
+            return center, radius, startAngle, (endAngle - startAngle) % math.tau
+        raise ValueError(f"Cannot compute a {node.kind} node.")
+
+    def _intersect(self, kinds: tuple[str, str], nodes: list[Node]) -> None:
+        # order each pair as the routine takes it, lines before circles
+        pairs = [sorted((self.values[i] for i in node.inputs),
+                        key=lambda v: isinstance(v, tuple)) for node in nodes]
+        batch = np.broadcast_shapes(*(_batchShape(v) for pair in pairs for v in pair))
+        pairs = [[_broadcast(v, batch) for v in pair] for pair in pairs]
+        if kinds == ("line", "line"):
+            a, b = _stack([p[0] for p in pairs]), _stack([p[1] for p in pairs])
+            points = lineIntersections(a[..., 0, :], a[..., 1, :], b[..., 0, :], b[..., 1, :])
+        elif kinds == ("circle", "line"):
+            line = _stack([p[0] for p in pairs])
+            center, radius = _stack([p[1][0] for p in pairs]), _stack([p[1][1] for p in pairs])
+            points = lineCircleIntersections(line[..., 0, :], line[..., 1, :], center, radius)
+        else:
+            c1, r1 = _stack([p[0][0] for p in pairs]), _stack([p[0][1] for p in pairs])
+            c2, r2 = _stack([p[1][0] for p in pairs]), _stack([p[1][1] for p in pairs])
+            points = circleIntersections(c1, r1, c2, r2)
+        for node, value in zip(nodes, points):
+            self.values[node.name] = value if kinds == ("line", "line") else _choose(value, node.which)
+
+# ******************************************************************************
+def eightPointConstruction(radius: float) -> Construction:
+    """Construct the points of `EightPointStar` with compass and straightedge.
+
+    A and B are where the baseline meets the central circle; the circles of the
+    same radius around them cut it at the four points a, b, c and d. The arcs
+    around those meet at C and D, on the perpendicular through the center, which
+    meets the central circle at E and F; the circles around A, B, E and F meet
+    at the four corners, counterclockwise from the upper right.
+
+    The arcs drawn to find the points are arc nodes too: those around A, B, E
+    and F from one corner to the next, and those around a, b, c and d, each
+    just marking C or D, from that point to itself.
+
+    Args:
+        radius (float): The radius of the central circle.
+
+    Returns:
+        Construction: The construction, with a "radius" parameter.
+    """
+    c = Construction()
+    r = c.parameter("radius", radius)
+    center = c.point("O", (0, 0, 0))
+    central = c.circle("central", center, r)
+    baseline = c.line("baseline", center, c.point("X", (1, 0, 0)))
+    circleA = c.circle("circleA", c.intersect("A", baseline, central, "right"), r)
+    circleB = c.circle("circleB", c.intersect("B", baseline, central, "left"), r)
+    four = [c.intersect(name, circle, central, side) for name, circle, side in (
+        ("a", circleA, "upper"), ("b", circleB, "upper"), ("c", circleB, "lower"), ("d", circleA, "lower"))]
+    circles = [c.circle(f"circle{p.name}", p, r) for p in four]
+    pointC = c.intersect("C", circles[0], circles[1], "upper")
+    pointD = c.intersect("D", circles[2], circles[3], "lower")
+    perpendicular = c.line("perpendicular", pointC, pointD)
+    circleE = c.circle("circleE", c.intersect("E", perpendicular, central, "upper"), r)
+    circleF = c.circle("circleF", c.intersect("F", perpendicular, central, "lower"), r)
+    corners = [c.intersect(f"corner{i}", a, b, side) for i, (a, b, side) in enumerate((
+        (circleA, circleE, "right"), (circleB, circleE, "left"),
+        (circleB, circleF, "left"), (circleA, circleF, "right")))]
+
+    for name, circle, start, end in (("arcA", circleA, corners[0], corners[3]),
+                                     ("arcB", circleB, corners[2], corners[1]),
+                                     ("arcE", circleE, corners[1], corners[0]),
+                                     ("arcF", circleF, corners[3], corners[2])):
+        c.arc(name, circle, start, end)
+    for circle, point in zip(circles, (pointC, pointC, pointD, pointD)):
+        c.arc(f"arc{point.name}{circle.name[-1]}", circle, point, point)
+    return c
+
+# ******************************************************************************
+def _name(node: Node | str) -> str:
+    return node.name if isinstance(node, Node) else node
+
+# ******************************************************************************
+def _batchShape(value: Any) -> tuple[int, ...]:
+    """Get the leading dimensions of a line or circle value."""
+    return value[1].shape if isinstance(value, tuple) else value.shape[:-2]
+
+# ******************************************************************************
+def _broadcast(value: Any, batch: tuple[int, ...]) -> Any:
+    """Broadcast a line or circle value to the given leading dimensions."""
+    if isinstance(value, tuple):
+        return np.broadcast_to(value[0], batch + (3,)), np.broadcast_to(value[1], batch)
+    return np.broadcast_to(value, batch + (2, 3))
+
+# ******************************************************************************
+def _stack(arrays: list[NDArray[np.float64]]) -> NDArray[np.float64]:
+    """Stack arrays of the same shape along a new first axis."""
+    return np.stack(arrays)
+
+# ******************************************************************************
+def _choose(candidates: NDArray[np.float64], which: _Which) -> NDArray[np.float64]:
+    """Pick one of `(..., 2, 3)` candidate intersections."""
+    if isinstance(which, int):
+        return candidates[..., which, :]
+    axis, pick = _Sides[which]
+    index = pick(candidates[..., axis], axis=-1)[..., None, None]
+    return np.take_along_axis(candidates, index, axis=-2)[..., 0, :]
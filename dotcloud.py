@@ -0,0 +1,184 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import functools
+import math
+from typing import Sequence
+
+import numpy as np
+from manim import (DEFAULT_DOT_RADIUS, WHITE, YELLOW, Animation, Circle, ManimColor, ParsableManimColor,
+                   VGroup, VMobject, there_and_back)
+from numpy.typing import NDArray
+
+from prototypes import glyphOutline
+
+# ******************************************************************************
+@functools.lru_cache(maxsize=1)
+def _unitCircle() -> NDArray[np.float64]:
+    """Control points of the outline of a `Dot` of radius 1 at the origin."""
+    points = Circle(radius=1.0).points
+    points.setflags(write=False)
+    return points
+
+# ==============================================================================
+class DotCloud(VMobject):
+    """Many dots drawn as the subpaths of a single VMobject.
+
+    A cloud is rasterized, styled and animated as one mobject, so its cost per
+    frame barely depends on the number of dots. All dots share one style; use
+    separate clouds for dots animated or colored differently.
+
+    Args:
+        points (NDArray[np.float64]): `(n, 3)` centers of the dots.
+        radius (float | NDArray[np.float64], optional): The radius of the dots,
+            or an `(n,)` array of radii. Default is `DEFAULT_DOT_RADIUS`.
+        color (ParsableManimColor, optional): The color of the dots. Default is white.
+        **kwargs: Further arguments for `VMobject`.
+    """
+    def __init__(self, points: Sequence[NDArray[np.float64]] | NDArray[np.float64],
+                 radius: float | NDArray[np.float64] = DEFAULT_DOT_RADIUS,
+                 color: ParsableManimColor = WHITE, stroke_width: float = 0, fill_opacity: float = 1.0,
+                 **kwargs):
+        self.centers = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        self.radii = np.broadcast_to(np.asarray(radius, dtype=np.float64), self.centers.shape[:1])
+        super().__init__(color=color, stroke_width=stroke_width, fill_opacity=fill_opacity, **kwargs)
+
+    def generate_points(self) -> None:
+        outline = _unitCircle()
+        self.points = (self.centers[:, None, :] + self.radii[:, None, None] * outline).reshape(-1, 3)
+
+    @property
+    def numDots(self) -> int:
+        return len(self.centers)
+
+    def dotCenters(self) -> NDArray[np.float64]:
+        """Get the current centers of the dots, following any transformations of the cloud."""
+        return self.points.reshape(self.numDots, -1, 3).mean(axis=1)
+
+    def scaleDots(self, factor: float | NDArray[np.float64]) -> "DotCloud":
+        """Scale each dot about its own center, by one factor or an `(n,)` array of them."""
+        dots = self.points.reshape(self.numDots, -1, 3)
+        centers = dots.mean(axis=1, keepdims=True)
+        factor = np.broadcast_to(np.asarray(factor, dtype=np.float64), self.centers.shape[:1])
+        self.points = (centers + factor[:, None, None] * (dots - centers)).reshape(-1, 3)
+        return self
+
+# ******************************************************************************
+def LabelCloud(labels: Sequence[str], points: Sequence[NDArray[np.float64]] | NDArray[np.float64], *,
+               color: ParsableManimColor, fill_color: ParsableManimColor, font_size: float) -> VGroup:
+    """Labeled dots as two mobjects: a cloud of backgrounds and one path of all the glyphs.
+
+    Looks the same as a `VGroup` of `LabeledDot`s, sized to their labels the
+    same way, at the cost of two mobjects instead of three per label. The
+    glyphs of each label are laid out once per process, see `glyphOutline`.
+
+    Args:
+        labels (Sequence[str]): The text of each label.
+        points (NDArray[np.float64]): `(n, 3)` centers of the labels.
+        color (ParsableManimColor): The color of the text.
+        fill_color (ParsableManimColor): The color of the dots behind the text.
+        font_size (float): The font size of the text.
+
+    Returns:
+        VGroup: The dot cloud and the glyphs.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    texts = [glyphOutline(label, font_size) for label in labels]
+    radii = np.array([0.1 + max(width, height) / 2 for _, width, height in texts])
+    glyphs = VMobject(fill_color=color, fill_opacity=1.0, stroke_width=0)
+    outlines = [outline + p for (outline, _, _), p in zip(texts, points) if len(outline)]
+    if outlines:
+        glyphs.set_points(np.concatenate(outlines))
+    return VGroup(DotCloud(points, radius=radii, color=fill_color), glyphs)
+
+# ==============================================================================
+class FadeInDots(Animation):
+    """Fade in every dot of a cloud, each growing or shrinking about its own center.
+
+    Args:
+        cloud (DotCloud): The dots.
+        scale (float, optional): The size of the dots when they start fading in,
+            relative to their final size. Default is 1.
+    """
+    def __init__(self, cloud: DotCloud, scale: float = 1.0, **kwargs):
+        self.scale = scale
+        super().__init__(cloud, introducer=True, **kwargs)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        t = self.rate_func(alpha)
+        start = self.starting_mobject
+        self.mobject.points = start.points
+        self.mobject.scaleDots(self.scale + (1 - self.scale) * t)
+        self.mobject.fill_rgbas = start.fill_rgbas * (1, 1, 1, t)
+        self.mobject.stroke_rgbas = start.stroke_rgbas * (1, 1, 1, t)
+
+# ==============================================================================
+class IndicateDots(Animation):
+    """Indicate every dot of a cloud, each growing about its own center and changing color.
+
+    Args:
+        cloud (DotCloud): The dots.
+        scale_factor (float, optional): The size of the dots at the peak. Default is 1.2.
+        color (ParsableManimColor, optional): The color of the dots at the peak.
+            Default is yellow.
+    """
+    def __init__(self, cloud: DotCloud, scale_factor: float = 1.2, color: ParsableManimColor = YELLOW,
+                 rate_func=there_and_back, **kwargs):
+        self.scale_factor = scale_factor
+        self.color = ManimColor(color)
+        super().__init__(cloud, rate_func=rate_func, **kwargs)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        t = self.rate_func(alpha)
+        start = self.starting_mobject
+        self.mobject.points = start.points
+        self.mobject.scaleDots(1 + (self.scale_factor - 1) * t)
+        rgb = self.color.to_rgb()
+        for attr in ("fill_rgbas", "stroke_rgbas"):
+            rgbas = getattr(start, attr).copy()
+            rgbas[:, :3] += t * (rgb - rgbas[:, :3])
+            setattr(self.mobject, attr, rgbas)
+
+# ==============================================================================
+class FlashDots(Animation):
+    """Send out lines in all directions from every dot of a cloud, as `Flash` does from one.
+
+    All the lines are the subpaths of one VMobject, moved in one array operation
+    per frame.
+
+    Args:
+        cloud (DotCloud | NDArray[np.float64]): The dots, or an `(n, 3)` array of centers.
+        line_length (float, optional): The length of the lines. Default is 0.2.
+        num_lines (int, optional): The number of lines around each dot. Default is 12.
+        flash_radius (float, optional): The distance from the centers at which
+            the lines start. Default is 0.1.
+        line_stroke_width (float, optional): The stroke width of the lines. Default is 3.
+        color (ParsableManimColor, optional): The color of the lines. Default is yellow.
+        time_width (float, optional): The length of the visible part of the lines,
+            relative to their length, as for `ShowPassingFlash`. Default is 1.
+    """
+    def __init__(self, cloud: DotCloud | NDArray[np.float64], line_length: float = 0.2, num_lines: int = 12,
+                 flash_radius: float = 0.1, line_stroke_width: float = 3, color: ParsableManimColor = YELLOW,
+                 time_width: float = 1, run_time: float = 1.0, **kwargs):
+        centers = cloud.dotCenters() if isinstance(cloud, DotCloud) else np.asarray(cloud, dtype=np.float64)
+        angles = np.arange(num_lines) * (math.tau / num_lines)
+        directions = np.stack([np.cos(angles), np.sin(angles), np.zeros(num_lines)], axis=-1)
+        self.starts = (centers[:, None, :] + flash_radius * directions).reshape(-1, 1, 3)
+        self.vectors = np.broadcast_to(line_length * directions, (len(centers), num_lines, 3)).reshape(-1, 1, 3)
+        self.line_length = line_length
+        self.time_width = time_width
+        lines = VMobject(stroke_color=color, stroke_width=line_stroke_width)
+        super().__init__(lines, run_time=run_time, remover=True, introducer=True, **kwargs)
+        self.interpolate_mobject(0)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        upper = self.rate_func(alpha) * (1 + self.time_width)
+        lower, upper = max(upper - self.time_width, 0.0), min(upper, 1.0)
+        # each line is one straight cubic curve from `lower` to `upper` along it
+        t = np.linspace(lower, max(lower, upper), 4)[None, :, None]
+        self.mobject.points = (self.starts + t * self.vectors).reshape(-1, 3)
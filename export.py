@@ -0,0 +1,219 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import argparse
+import itertools
+import math
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import cairo
+import numpy as np
+from numpy.typing import NDArray
+
+from geometry import StarGeometry, starGeometry
+from style import ConstructionLineColor, FinalColor, GridColor, LabelFillColor, starName
+
+# ******************************************************************************
+TitleFont: str = "Palatino"
+
+# ******************************************************************************
+@dataclass(frozen=True)
+class Palette:
+    """Colors of an exported star.
+
+    Attributes:
+        name (str): The name of the palette, used in file names.
+        star (str): The fill and outline of the star.
+        construction (str): The construction circle and polygons.
+        text (str): The title.
+        background (str | None): The page, or None for transparent.
+
+    Colors are hex strings, "#RRGGBB" or "#RRGGBBAA".
+    """
+    name: str
+    star: str
+    construction: str
+    text: str
+    background: str | None
+
+
+Palettes: dict[str, Palette] = {p.name: p for p in (
+    Palette("classic", FinalColor, ConstructionLineColor, FinalColor, LabelFillColor),
+    Palette("night", LabelFillColor, ConstructionLineColor, LabelFillColor, GridColor),
+    Palette("print", "#000000", "#999999", "#000000", "#FFFFFF"),
+    Palette("clear", FinalColor, ConstructionLineColor, FinalColor, None),
+)}
+
+# ******************************************************************************
+def _setColor(ctx: cairo.Context, color: str) -> None:
+    digits = color.lstrip("#")
+    if len(digits) not in (6, 8):
+        raise ValueError(f"Expected a color as #RRGGBB or #RRGGBBAA, got {color!r}")
+    ctx.set_source_rgba(*(int(digits[i:i + 2], 16) / 255 for i in range(0, len(digits), 2)))
+
+# ******************************************************************************
+def _polygon(ctx: cairo.Context, corners: NDArray[np.float64], center: tuple[float, float], scale: float) -> None:
+    cx, cy = center
+    for i, (x, y, _) in enumerate(corners):
+        (ctx.move_to if i == 0 else ctx.line_to)(cx + scale * x, cy - scale * y)
+    ctx.close_path()
+
+# ******************************************************************************
+def drawStar(ctx: cairo.Context, geometry: StarGeometry, size: tuple[int, int], *,
+             palette: Palette = Palettes["classic"],
+             title: str | None = None,
+             construction: bool = False) -> None:
+    """Draw a finished star, with its title below it, on a cairo context.
+
+    The layout follows the opening frame of the scenes: "how to draw a" above
+    the star and the title below it, both left out without a title.
+
+    Args:
+        ctx (cairo.Context): The context to draw on.
+        geometry (StarGeometry): The star.
+        size (tuple[int, int]): The size of the page, width and height.
+        palette (Palette, optional): The colors. Default is "classic".
+        title (str, optional): The title, or None for the star alone.
+        construction (bool, optional): If True, also draw the dashed circle and
+            polygons the star is constructed from. Default is False.
+    """
+    width, height = size
+    margin = 0.08 * min(width, height)
+    above, below = (0.08 * height, 0.16 * height) if title else (0.0, 0.0)
+    radius = min(width - 2 * margin, height - 2 * margin - above - below) / 2
+    center = (width / 2, margin + above + radius)
+    scale = radius / geometry.radius
+
+    if palette.background is not None:
+        _setColor(ctx, palette.background)
+        ctx.paint()
+
+    if construction:
+        _setColor(ctx, palette.construction)
+        ctx.set_line_width(max(radius / 150, 0.5))
+        ctx.set_dash([radius / 40, radius / 60])
+        ctx.arc(*center, radius, 0, math.tau)
+        for corners in geometry.polygons:
+            _polygon(ctx, corners, center, scale)
+        ctx.stroke()
+        ctx.set_dash([])
+
+    _polygon(ctx, geometry.vertices, center, scale)
+    _setColor(ctx, palette.star)
+    ctx.fill_preserve()
+    ctx.set_line_width(max(radius / 100, 0.5))
+    ctx.set_line_join(cairo.LINE_JOIN_MITER)
+    ctx.stroke()
+
+    if title:
+        _setColor(ctx, palette.text)
+        for text, slant, weight, fontSize, y in (
+                ("how to draw a", cairo.FONT_SLANT_ITALIC, cairo.FONT_WEIGHT_NORMAL,
+                 0.45 * above, margin + 0.6 * above),
+                (title, cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD,
+                 0.45 * below, center[1] + radius + 0.6 * below)):
+            ctx.select_font_face(TitleFont, slant, weight)
+            ctx.set_font_size(fontSize)
+            extents = ctx.text_extents(text)
+            ctx.move_to((width - extents.width) / 2 - extents.x_bearing, y)
+            ctx.show_text(text)
+
+# ******************************************************************************
+def exportStar(path: str | Path, n: int, interval: int, *,
+               size: tuple[int, int] = (1024, 1024),
+               palette: Palette | str = "classic",
+               title: str | bool = True,
+               construction: bool = False) -> Path:
+    """Write a finished star as SVG or PNG, without constructing a scene.
+
+    Args:
+        path (Path): The output file; its suffix, ".svg" or ".png", picks the format.
+        n (int): The number of points of the star.
+        interval (int): The interval between the joined points.
+        size (tuple[int, int], optional): Width and height in pixels, or points
+            for SVG. Default is 1024 by 1024.
+        palette (Palette | str, optional): The colors, or the name of one of
+            `Palettes`. Default is "classic".
+        title (str | bool, optional): The title, True for the scenes' title,
+            or False for none. Default is True.
+        construction (bool, optional): If True, also draw the construction
+            circle and polygons. Default is False.
+
+    Returns:
+        Path: The written file.
+    """
+    path = Path(path)
+    palette = Palettes[palette] if isinstance(palette, str) else palette
+    title = f"{starName(n)}-Point Star" if title is True else (title or None)
+    geometry = starGeometry(n, interval, 1.0)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if path.suffix.lower() == ".svg":
+        with cairo.SVGSurface(str(path), *size) as surface:
+            drawStar(cairo.Context(surface), geometry, size, palette=palette, title=title,
+                     construction=construction)
+    elif path.suffix.lower() == ".png":
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, *size)
+        drawStar(cairo.Context(surface), geometry, size, palette=palette, title=title,
+                 construction=construction)
+        surface.write_to_png(str(path))
+        surface.finish()
+    else:
+        raise ValueError(f"Cannot export to {path.suffix!r}, use '.svg' or '.png'")
+    return path
+
+# ******************************************************************************
+def exportCatalogue(variants: Iterable[tuple[int, int, Palette | str]], directory: str | Path, *,
+                    formats: Iterable[str] = ("svg", "png"),
+                    **kwargs) -> list[Path]:
+    """Export a catalogue of star variants in one go.
+
+    Each variant is written as `star-{n}-{interval}-{palette}` in every format.
+
+    Args:
+        variants (Iterable[tuple[int, int, Palette | str]]): The `(n, interval, palette)`
+            of each star.
+        directory (Path): The output directory.
+        formats (Iterable[str], optional): The file formats. Default is SVG and PNG.
+        **kwargs: Further arguments for `exportStar`.
+
+    Returns:
+        list[Path]: The written files.
+    """
+    directory = Path(directory)
+    formats = list(formats)
+    written = []
+    for n, interval, palette in variants:
+        name = palette if isinstance(palette, str) else palette.name
+        for extension in formats:
+            written.append(exportStar(directory / f"star-{n}-{interval}-{name}.{extension}",
+                                      n, interval, palette=palette, **kwargs))
+    return written
+
+# ******************************************************************************
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export finished stars as SVG and PNG, without rendering scenes.")
+    parser.add_argument("stars", nargs="+", help="stars as n/interval, e.g. 6/2 8/2 12/3")
+    parser.add_argument("-p", "--palette", nargs="+", default=["classic"], choices=sorted(Palettes),
+                        help="palettes to export each star in")
+    parser.add_argument("-f", "--format", nargs="+", default=["svg", "png"], choices=["svg", "png"])
+    parser.add_argument("-s", "--size", type=int, nargs="+", default=[1024], help="width [height] in pixels")
+    parser.add_argument("-o", "--output", type=Path, default=Path("media") / "stars", help="output directory")
+    parser.add_argument("--no-title", action="store_true", help="leave out the title")
+    parser.add_argument("--construction", action="store_true", help="also draw the construction lines")
+    args = parser.parse_args()
+
+    stars = [tuple(int(v) for v in star.split("/")) for star in args.stars]
+    start = time.perf_counter()
+    files = exportCatalogue([(n, k, p) for (n, k), p in itertools.product(stars, args.palette)], args.output,
+                            formats=args.format, size=(args.size[0], args.size[-1]),
+                            title=not args.no_title, construction=args.construction)
+    print(f"Exported {len(files)} files to {args.output} in {time.perf_counter() - start:.3f}s")
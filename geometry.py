@@ -0,0 +1,338 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import functools
+import math
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+# ******************************************************************************
+def XY(point: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Get X, Y coordinates of the point, discarding the Z coordinate"""
+    return np.array([point[0], point[1], 0])
+
+# ******************************************************************************
+def ringPoints(radius: float | Sequence[float] | NDArray[np.float64], n: int,
+               startAngle: float = 0.0,
+               center: Sequence[float] | NDArray[np.float64] = (0.0, 0.0, 0.0)) -> NDArray[np.float64]:
+    """Get `n` points spaced evenly on a circle, counterclockwise from `startAngle`
+
+    Args:
+        radius (float | Sequence[float]): Radius of the circle, or a sequence of
+            radii to get a stack of rings.
+        n (int): The number of points on the circle.
+        startAngle (float, optional): Angle of the first point in radians. Default is 0.
+        center (Sequence[float], optional): Center of the circle. Default is the origin.
+
+    Returns:
+        NDArray[np.float64]: An `(n, 3)` array of points, or a `(batch, n, 3)`
+            stack of them when a sequence of radii is given.
+    """
+    theta = startAngle + np.arange(n) * (2 * np.pi / n)
+    unit = np.stack([np.cos(theta), np.sin(theta), np.zeros(n)], axis=-1)
+    r = np.asarray(radius, dtype=np.float64)
+    return np.asarray(center, dtype=np.float64) + r[..., None, None] * unit
+
+# ******************************************************************************
+def _regularRing(xy: NDArray[np.float64], rtol: float = 1e-9):
+    """Detect stacks of points spaced evenly on a circle
+
+    Args:
+        xy (NDArray[np.float64]): An `(m, n, 2)` stack of points.
+        rtol (float, optional): Tolerance relative to the radius. Default is 1e-9.
+
+    Returns:
+        tuple: Boolean mask of the regular rings, and their centers, radii,
+            start angles and angular steps, each of leading shape `(m,)`.
+    """
+    n = xy.shape[-2]
+    center = xy.mean(axis=-2)
+    rel = xy - center[:, None, :]
+    radii = np.hypot(rel[..., 0], rel[..., 1])
+    angles = np.arctan2(rel[..., 1], rel[..., 0])
+    radius = radii[:, 0]
+    start = angles[:, 0]
+    wrap: Callable[[NDArray[np.float64]], NDArray[np.float64]] = \
+        lambda a: (a + np.pi) % (2 * np.pi) - np.pi
+    step = wrap(angles[:, 1] - start) if n > 1 else np.zeros_like(start)
+    expected = start[:, None] + np.arange(n) * step[:, None]
+    tol = rtol * np.maximum(radius, np.finfo(np.float64).tiny)
+    regular = ((n > 2)
+               & (radius > 0)
+               & np.all(np.abs(radii - radius[:, None]) <= tol[:, None], axis=-1)
+               & np.all(np.abs(wrap(angles - expected)) <= rtol, axis=-1)
+               & (np.abs(wrap(n * step)) <= n * rtol)
+               & (np.abs(step) > rtol))
+    return regular, center, radius, start, step
+
+# ******************************************************************************
+def lineIntersections(a1: NDArray[np.float64], a2: NDArray[np.float64],
+                      b1: NDArray[np.float64], b2: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Get the intersections of the lines through `a1, a2` and through `b1, b2`, elementwise
+
+    Args:
+        a1, a2 (NDArray[np.float64]): Two points on each first line, `(..., 2)` or `(..., 3)`.
+        b1, b2 (NDArray[np.float64]): Two points on each second line, broadcast
+            against the first. The Z coordinate is discarded.
+
+    Returns:
+        NDArray[np.float64]: The intersection of each pair of lines, in the
+            dimension of the inputs, with Z set to 0 for 3D points.
+
+    Raises:
+        ValueError: If any pair of lines is parallel.
+    """
+    a1, a2, b1, b2 = (np.asarray(p, dtype=np.float64) for p in (a1, a2, b1, b2))
+    da, db, ab = a2[..., :2] - a1[..., :2], b2[..., :2] - b1[..., :2], b1[..., :2] - a1[..., :2]
+    denominator = da[..., 0] * db[..., 1] - da[..., 1] * db[..., 0]
+    if np.any(denominator == 0):
+        raise ValueError("The lines are parallel, there is no unique intersection point.")
+    t = (ab[..., 0] * db[..., 1] - ab[..., 1] * db[..., 0]) / denominator
+    xy = a1[..., :2] + t[..., None] * da
+    if a1.shape[-1] == 2:
+        return xy
+    return np.concatenate([xy, np.zeros(xy.shape[:-1] + (1,))], axis=-1)
+
+# ******************************************************************************
+def lineCircleIntersections(p1: NDArray[np.float64], p2: NDArray[np.float64],
+                            center: NDArray[np.float64], radius: float | NDArray[np.float64]
+                            ) -> NDArray[np.float64]:
+    """Get the two intersections of the lines through `p1, p2` with circles, elementwise
+
+    Args:
+        p1, p2 (NDArray[np.float64]): Two points on each line, `(..., 3)`.
+        center (NDArray[np.float64]): The centers of the circles, `(..., 3)`.
+        radius (float | NDArray[np.float64]): The radii of the circles, `(...)`.
+
+    Returns:
+        NDArray[np.float64]: `(..., 2, 3)` intersections, ordered along the
+            direction from `p1` to `p2`; NaN where a line misses its circle.
+    """
+    p1, p2, center = (np.asarray(p, dtype=np.float64) for p in (p1, p2, center))
+    d = p2[..., :2] - p1[..., :2]
+    f = p1[..., :2] - center[..., :2]
+    a = np.einsum("...i,...i", d, d)
+    b = np.einsum("...i,...i", f, d)
+    c = np.einsum("...i,...i", f, f) - np.asarray(radius, dtype=np.float64) ** 2
+    root = np.sqrt(np.where(b * b - a * c >= 0, b * b - a * c, np.nan))
+    t = np.stack([(-b - root) / a, (-b + root) / a], axis=-1)
+    xy = p1[..., None, :2] + t[..., None] * d[..., None, :]
+    return np.concatenate([xy, np.zeros(xy.shape[:-1] + (1,))], axis=-1)
+
+# ******************************************************************************
+def circleIntersections(c1: NDArray[np.float64], r1: float | NDArray[np.float64],
+                        c2: NDArray[np.float64], r2: float | NDArray[np.float64]) -> NDArray[np.float64]:
+    """Get the two intersections of pairs of circles, elementwise
+
+    Args:
+        c1 (NDArray[np.float64]): The centers of the first circles, `(..., 3)`.
+        r1 (float | NDArray[np.float64]): Their radii, `(...)`.
+        c2 (NDArray[np.float64]): The centers of the second circles, `(..., 3)`.
+        r2 (float | NDArray[np.float64]): Their radii, `(...)`.
+
+    Returns:
+        NDArray[np.float64]: `(..., 2, 3)` intersections, the first to the
+            right of the line from `c1` to `c2` and the second to its left;
+            NaN where the circles do not meet.
+    """
+    c1, c2 = np.asarray(c1, dtype=np.float64), np.asarray(c2, dtype=np.float64)
+    r1, r2 = np.asarray(r1, dtype=np.float64), np.asarray(r2, dtype=np.float64)
+    d = c2[..., :2] - c1[..., :2]
+    distance = np.hypot(d[..., 0], d[..., 1])
+    a = (r1 ** 2 - r2 ** 2 + distance ** 2) / (2 * distance)
+    h = np.sqrt(np.where(r1 ** 2 - a ** 2 >= 0, r1 ** 2 - a ** 2, np.nan))
+    unit = d / distance[..., None]
+    normal = np.stack([-unit[..., 1], unit[..., 0]], axis=-1)
+    base = c1[..., :2] + a[..., None] * unit
+    xy = np.stack([base - h[..., None] * normal, base + h[..., None] * normal], axis=-2)
+    return np.concatenate([xy, np.zeros(xy.shape[:-1] + (1,))], axis=-1)
+
+# ******************************************************************************
+def starIntersections(points: Sequence[NDArray[np.float64]] | NDArray[np.float64],
+                      interval: int | Sequence[int] | NDArray[np.int_],
+                      sides: int | None = None) -> NDArray[np.float64]:
+    """Get intersections of the lines joining points at given intervals, in one vectorized solve
+
+    The `i`-th intersection is the crossing of the line joining the points `i`
+    and `i + interval` with the line joining the points `i + 1` and
+    `i + 1 - interval`, the indices wrapping around the number of points.
+    Points spaced evenly on a circle are solved exactly in closed form, any
+    other points by a batched line-line intersection.
+
+    Args:
+        points (NDArray[np.float64]): An `(n, 3)` array of points, or a
+            `(batch, n, 3)` stack of them. The Z coordinate is discarded.
+        interval (int | Sequence[int]): The interval between the points to be
+            joined, or an array of intervals broadcast against the batch
+            dimensions of `points`.
+        sides (int, optional): The number of intersections to compute. Default
+            is the number of points.
+
+    Returns:
+        NDArray[np.float64]: A `(sides, 3)` array of intersection points, or a
+            `(batch, sides, 3)` stack of them.
+
+    Raises:
+        ValueError: If the points are not an array of 2D or 3D points, if an
+            interval is 0, 1 or -1 modulo the number of points, so the lines
+            to be intersected coincide, or if any pair of joining lines is parallel.
+    """
+    pts = np.asarray(points, dtype=np.float64)
+    if pts.ndim < 2 or pts.shape[-1] not in (2, 3) or pts.shape[-2] < 2:
+        raise ValueError(f"Expected an (n, 3) array of points or a stack of them, got shape {pts.shape}.")
+    n = pts.shape[-2]
+    sides = n if sides is None else sides
+    k = np.asarray(interval, dtype=np.int64)
+    if np.any(np.isin(k % n, (0, 1, n - 1))):
+        raise ValueError(f"The interval must not be 0, 1 or -1 modulo the {n} points, "
+                         f"the lines joining the points would coincide.")
+    batchShape = np.broadcast_shapes(pts.shape[:-2], k.shape)
+
+    xy = np.broadcast_to(pts[..., :2], batchShape + (n, 2)).reshape(-1, n, 2)
+    k = np.broadcast_to(k, batchShape).reshape(-1, 1)
+    i = np.arange(sides)
+    result = np.zeros((xy.shape[0], sides, 3))
+
+    regular, center, radius, start, step = _regularRing(xy)
+    if regular.any():
+        kr, half = k[regular], step[regular, None] / 2
+        denominator = np.cos((kr - 1) * half)
+        if np.any(np.isclose(denominator, 0.0, rtol=0.0, atol=1e-12)):
+            raise ValueError("The lines are parallel, there is no unique intersection point.")
+        r = radius[regular, None] * np.cos(kr * half) / denominator
+        phi = start[regular, None] + (2 * i + 1) * half
+        result[regular, :, 0] = center[regular, 0, None] + r * np.cos(phi)
+        result[regular, :, 1] = center[regular, 1, None] + r * np.sin(phi)
+
+    irregular = ~regular
+    if irregular.any():
+        xyi, ki = xy[irregular], k[irregular]
+        take: Callable[[NDArray[np.int_]], NDArray[np.float64]] = \
+            lambda idx: np.take_along_axis(xyi, np.broadcast_to(idx % n, ki.shape[:1] + (sides,))[..., None], axis=-2)
+        result[irregular, :, :2] = lineIntersections(take(i), take(i + ki), take(i + 1), take(i + 1 - ki))
+
+    return result.reshape(batchShape + (sides, 3))
+
+# ******************************************************************************
+def intersections(points: Sequence[NDArray[np.float64]],
+                  interval: int, sides: int) -> list[NDArray[np.float64]]:
+    """Get intersections of the lines joining the list of points on a circle at given interval
+
+    Thin wrapper over `starIntersections` for a single sequence of points.
+
+    Args:
+        points (Sequence[NDArray[np.float64]]): A sequence of points that lie on a circle.
+        interval (int): The interval between the points to be joined.
+        sides (int): The number of sides of the polygon formed by joining every `interval`-th point.
+
+    Returns:
+        list[NDArray[np.float64]]: A list of intersection points of the lines joining every `interval`-th pair of points.
+    """
+    return list(starIntersections(np.asarray(points), interval, sides))
+
+# ******************************************************************************
+def starVertices(points: NDArray[np.float64], inter: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Assemble the outline of stars from their ring points and intersections
+
+    Args:
+        points (NDArray[np.float64]): `(..., n, 3)` points of the stars.
+        inter (NDArray[np.float64]): `(..., n, 3)` intersections, as from `starIntersections`.
+
+    Returns:
+        NDArray[np.float64]: `(..., 2n, 3)` outlines, alternating points and intersections.
+    """
+    return np.stack([points, inter], axis=-2).reshape(points.shape[:-2] + (2 * points.shape[-2], 3))
+
+# ******************************************************************************
+def starPolygons(points: NDArray[np.float64], interval: int) -> tuple[NDArray[np.float64], ...]:
+    """Get the polygons formed by joining every `interval`-th point
+
+    Args:
+        points (NDArray[np.float64]): `(n, 3)` points spaced evenly on a circle.
+        interval (int): The interval between the joined points.
+
+    Returns:
+        tuple[NDArray[np.float64], ...]: The `gcd(n, interval)` polygons, as
+            arrays of `n / gcd(n, interval)` corners.
+    """
+    n = len(points)
+    count = math.gcd(n, interval)
+    return tuple(points[(j + interval * np.arange(n // count)) % n] for j in range(count))
+
+# ******************************************************************************
+@dataclass(frozen=True)
+class StarGeometry:
+    """Cached geometry of an `{n/interval}` star drawn on a circle of given radius.
+
+    The arrays are shared between every user of the cache and are read-only.
+
+    Attributes:
+        n (int): The number of points of the star.
+        interval (int): The interval between the joined points.
+        radius (float): The radius of the circle the points lie on.
+        ringPoints (NDArray[np.float64]): `(n, 3)` points spaced evenly on the circle.
+        labelPoints (NDArray[np.float64]): `(n, 3)` label positions just outside the circle.
+        intersectionPoints (NDArray[np.float64]): `(n, 3)` intersections of the joining lines.
+        vertices (NDArray[np.float64]): `(2n, 3)` star outline, alternating ring and
+            intersection points.
+        polygons (tuple[NDArray[np.float64], ...]): The overlapping polygons
+            formed by joining every `interval`-th point, as arrays of corners.
+    """
+    n: int
+    interval: int
+    radius: float
+    ringPoints: NDArray[np.float64]
+    labelPoints: NDArray[np.float64]
+    intersectionPoints: NDArray[np.float64]
+    vertices: NDArray[np.float64]
+    polygons: tuple[NDArray[np.float64], ...]
+
+# ******************************************************************************
+@functools.lru_cache(maxsize=128)
+def starGeometry(n: int, interval: int, radius: float, labelOffset: float = 0.5) -> StarGeometry:
+    """Get the geometry of an `{n/interval}` star, computing it only once per process.
+
+    Args:
+        n (int): The number of points of the star.
+        interval (int): The interval between the points to be joined.
+        radius (float): The radius of the circle the points lie on.
+        labelOffset (float, optional): Distance of the labels outside the circle.
+            Default is 0.5.
+
+    Returns:
+        StarGeometry: The ring, label, intersection and outline points of the star.
+    """
+    points = ringPoints(radius, n)
+    labels = ringPoints(radius + labelOffset, n)
+    inter = starIntersections(points, interval)
+    vertices = starVertices(points, inter)
+    polygons = starPolygons(points, interval)
+    for a in (points, labels, inter, vertices, *polygons):
+        a.setflags(write=False)
+    return StarGeometry(n, interval, radius, points, labels, inter, vertices, polygons)
+
+# ******************************************************************************
+def bezierLength(points: NDArray[np.float64], samples: int = 16) -> float:
+    """Approximate the length of a path of cubic Bezier curves by sampling each curve.
+
+    Args:
+        points (NDArray[np.float64]): The control points, four for each curve,
+            as a VMobject holds them.
+        samples (int, optional): The number of samples on each curve. Default is 16.
+
+    Returns:
+        float: The length of the path.
+    """
+    t = np.linspace(0.0, 1.0, samples)[:, None]
+    bernstein = np.hstack([(1 - t) ** 3, 3 * t * (1 - t) ** 2, 3 * t ** 2 * (1 - t), t ** 3])
+    curves = points[:len(points) // 4 * 4].reshape(-1, 4, points.shape[-1])
+    sampled = np.einsum("sk,ckd->csd", bernstein, curves)
+    return float(np.linalg.norm(np.diff(sampled, axis=1), axis=-1).sum())
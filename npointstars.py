@@ -6,25 +6,44 @@
 # visit # http://creativecommons.org/licenses/by/4.0/.
 # Author: roximn <roximn@rixir.org>
 # ******************************************************************************
-from typing import Callable, Sequence
+import functools
+from typing import Callable
 
 from manim import *
 from manim import SVGNAMES
+from manim.utils.exceptions import EndSceneEarlyException
 from numpy.typing import NDArray
 
+import outputs
+import preview
+import profiling
+import prototypes
+import sectioncache
+import streaming
+import texbatch
+from construction import Construction, eightPointConstruction
+from dotcloud import DotCloud, FadeInDots, FlashDots, IndicateDots, LabelCloud
+from geometry import (XY, StarGeometry, bezierLength, circleIntersections, intersections,
+                      lineCircleIntersections, lineIntersections, ringPoints, starGeometry,
+                      starIntersections, starPolygons, starVertices)
+from steps import (Beat, Hold, Step, animate, change, compileSteps, create, dismissInstruction, fade, fadeIn,
+                   fadeOut, instantly, introduce, remove, transcript)
+from style import (ConstructionLineColor, FinalColor, GridColor, IndicateDotColor, LabelFillColor, NumberNames,
+                   ReferenceDotColor, starName)
+from texcache import cachedTex, texCache
+from textures import textureCache
+from tiling import hexLattice, squareLattice, tessellate
+
 # ******************************************************************************
 config.frame_width = 9
 config.frame_height = 16
 config.frame_size = (1080, 1920)
+PlaneRange: tuple[float, float] = (-4, +4)  # x and y range of the scenes' plane
 
-GridColor: ParsableManimColor = "#003049"
-ConstructionLineColor: ParsableManimColor = "#FF9911"
-ReferenceDotColor: ParsableManimColor = "#D62828"
-IndicateDotColor: ParsableManimColor = "#9DD9D2"
 LabelSize: float = 24.0
-LabelFillColor: ParsableManimColor = "#EAE2B7"
-FinalColor: ParsableManimColor = "#392F5A"
+SmallLabelSize: float = 16.0  # the labels of the eight-point construction
 InstructionColor: ParsableManimColor = SVGNAMES.BROWN
+DashLength: float = 0.15
 
 # ******************************************************************************
 def TexWrappedText(txt: str, *,
@@ -34,7 +53,7 @@ def TexWrappedText(txt: str, *,
                    bold: bool = False,
                    center: bool = True,
                    color: ParsableManimColor = BLACK,
-                   width: int = 170) -> Tex:
+                   width: int = 170) -> VMobject:
     """Create a wrapped text with specified font size, style and alignment.
 
     Args:
@@ -52,7 +71,9 @@ def TexWrappedText(txt: str, *,
         width (int, optional): The width of the text box. Default is 180.
 
     Returns:
-        Tex: A Tex MObject with the wrapped text and specified attributes.
+        VMobject: A Tex MObject with the wrapped text and specified attributes,
+            rebuilt from the TeX cache when it was typeset before. A placeholder
+            box in previews.
     """
     assert fontSize in ('tiny', 'small', 'normalsize', 'large', 'Large', 'LARGE', 'huge', 'Huge')
     texText = txt
@@ -63,13 +84,18 @@ def TexWrappedText(txt: str, *,
     if center:
         texText = r"\centering" + texText
     texText = fr"\{fontSize} {texText}"
-    texText = Tex(r"\parbox{" f"{width}" "px}{" f"{texText}" "}",
-                  tex_template=TexFontTemplates.palatino, color=color)
+    texString = r"\parbox{" f"{width}" "px}{" f"{texText}" "}"
+    if preview.enabled():
+        texText = preview.textBox(texString, tex_template=TexFontTemplates.palatino, color=color,
+                                  characters=len(txt), fontSize=fontSize, width=width)
+    else:
+        texText = cachedTex(texString, tex_template=TexFontTemplates.palatino, color=color)
     if parent is not None:
         texText.next_to(parent, DOWN)
     return texText
 
 # ******************************************************************************
+@profiling.traced("instruction")
 def createInstruction(txt: str, continued: bool = False, parent: Mobject | None = None):
     if hasattr(createInstruction, "instructionCount"):
         n = createInstruction.instructionCount
@@ -88,117 +114,237 @@ def createInstruction(txt: str, continued: bool = False, parent: Mobject | None
     return instruction
 
 # ******************************************************************************
-def XY(point: NDArray[np.float64]) -> NDArray[np.float64]:
-    """Get X, Y coordinates of the point, discarding the Z coordinate"""
-    return np.array([point[0], point[1], 0])
+@functools.lru_cache(maxsize=256)
+def _dashPrototype(signature: bytes, shape: tuple[int, ...], numDashes: int,
+                   dashedRatio: float) -> DashedVMobject:
+    points = np.frombuffer(signature, dtype=np.float64).reshape(shape)
+    return DashedVMobject(VMobject().set_points(points), num_dashes=numDashes, dashed_ratio=dashedRatio)
 
 # ******************************************************************************
-def intersections(points: Sequence[NDArray[np.float64]],
-                  interval: int, sides: int) -> list[NDArray[np.float64]]:
-    """Get intersections of the lines joining the list of points on a circle at given interval
+def dashed(mobject: VMobject, dashLength: float = DashLength, dashedRatio: float = 0.6) -> VMobject:
+    """Return a dashed version of the given VMobject.
+
+    The number of dashes follows the length of the path, so short arcs and full
+    circles get the same dash density. The dashes of a path are computed once
+    and copied for every path of the same shape, wherever it is placed.
 
     Args:
-        points (Sequence[NDArray[np.float64]]): A sequence of points that lie on a circle.
-        interval (int): The interval between the points to be joined.
-        sides (int): The number of sides of the polygon formed by joining every `interval`-th point.
+        mobject (VMobject): The Mobject to be dashed.
+        dashLength (float, optional): The length of each dash in scene units.
+            Default is `DashLength`.
+        dashedRatio (float, optional): The ratio of the dash length to the
+            length of a dash and the space after it. Default is 0.6.
 
     Returns:
-        list[NDArray[np.float64]]: A list of intersection points of the lines joining every `interval`-th pair of points.
+        VMobject: A new `DashedVMobject` that is a dashed version of the input.
+            A plain copy of the input in previews.
     """
-    CAP: Callable[[int], int] = lambda x: x % len(points)
-    pp: list[NDArray[np.float64]] = []
-    for i in range(sides):
-        a1 = points[CAP(i)]
-        a2 = points[CAP(i + interval)]
-        b1 = points[CAP(i + 1)]
-        b2 = points[CAP(i + 1 - interval)]
-        intersection = line_intersection([XY(a1), XY(a2)], [XY(b1), XY(b2)])
-        pp.append(intersection)
-    return pp
+    if preview.enabled():
+        return mobject.copy()
+    points = mobject.points
+    numDashes = max(1, round(bezierLength(points) * dashedRatio / dashLength))
+    if mobject.submobjects or len(points) == 0:
+        return DashedVMobject(mobject, num_dashes=numDashes, dashed_ratio=dashedRatio)
+    signature = np.round(points - points[0], 9) + 0.0  # also folds -0.0 into 0.0
+    prototype = _dashPrototype(signature.tobytes(), signature.shape, numDashes, dashedRatio)
+    return prototype.copy().shift(points[0]).match_style(mobject)
 
 # ******************************************************************************
-def dashed(mobject: VMobject, factor: float=1.0) -> DashedVMobject:
-    """Return a dashed version of the given VMobject.
+def constructionArc(construction: Construction, name: str, overshoot: float = 5 * DEGREES) -> VMobject:
+    """Return an arc node of a construction as a dashed construction line.
 
     Args:
-        mobject (VMobject): The Mobject to be dashed.
-        factor (float, optional): A scaling factor for the number of dashes,
-            for base value of 64 dashes and a ratio of 0.6 for
-            the dash length to space length. Default is 1.0.
+        construction (Construction): The construction.
+        name (str): The name of the arc node.
+        overshoot (float, optional): How far the arc is drawn past each of its
+            ends, in radians. Default is 5 degrees.
 
     Returns:
-        DashedVMobject: A new Mobject that is a dashed version of the input.
+        VMobject: The dashed arc.
+    """
+    center, radius, startAngle, angle = construction[name]
+    return dashed(Arc(radius=float(radius), arc_center=center, start_angle=float(startAngle) - overshoot,
+                      angle=float(angle) + 2 * overshoot, color=ConstructionLineColor))
+
+# ==============================================================================
+class StarScene(Scene):
+    """Base of the star tutorials.
+
+    Numbers the instructions of every scene from 1, and typesets all the TeX
+    of the scene in one batched LaTeX run before it is constructed. Set
+    `BATCH_TEX` to False to compile each text on its own instead.
+
+    The scene is split into sections, an "Intro" followed by one for each
+    instruction step. Setting `RENDER_SECTIONS` to a set of section indices
+    renders only those; the animations of the other sections are skipped,
+    which still brings the mobjects to the same state, and the scene ends
+    after the last section to be rendered. With `KEY_SECTIONS` set, each
+    section is hashed for `sectioncache` as it is played.
+
+    When profiling is enabled, see `profiling.start`, the setup, each step,
+    `play` and `wait` are recorded on a timeline of the render. As a preview,
+    see `preview.enabled`, the scene is drawn in wireframe at a lower frame
+    rate, with boxes in place of its texts. When streaming, see
+    `streaming.enabled`, the frames go through one encoder, pipe or callback
+    instead of partial movie files. With several outputs, see `outputs.enabled`,
+    the frame covers all their framings and each frame is encoded into all of
+    them.
     """
-    return DashedVMobject(mobject, num_dashes=int(64 * factor), dashed_ratio=0.6)
+    BATCH_TEX: bool = True
+    RENDER_SECTIONS: set[int] | None = None
+    KEY_SECTIONS: bool = False
+    profiler: profiling.Profiler | None = None
+    replacedConfig: dict | None = None  # the frame settings to restore after a multi-output render
+
+    def __init__(self, *args, **kwargs):
+        if preview.enabled():
+            preview.configure()
+            kwargs.setdefault("camera_class", preview.WireframeCamera)
+        writerClass = None
+        if outputs.enabled():
+            self.replacedConfig = outputs.configure(PlaneRange[1] - PlaneRange[0])
+            writerClass = outputs.MultiOutputFileWriter
+        elif streaming.enabled():
+            writerClass = streaming.StreamingFileWriter
+        if writerClass is not None and config.renderer == RendererType.CAIRO:
+            kwargs.setdefault("renderer", CairoRenderer(file_writer_class=writerClass,
+                                                        camera_class=kwargs.get("camera_class", Camera),
+                                                        skip_animations=kwargs.get("skip_animations", False)))
+        super().__init__(*args, **kwargs)
+
+    def render(self, preview: bool = False):
+        try:
+            return super().render(preview)
+        except BaseException:
+            if isinstance(self.renderer.file_writer, streaming.StreamingFileWriter):
+                self.renderer.file_writer.abort()
+            raise
+        finally:
+            profiling.finish(self.profiler)
+            if self.replacedConfig is not None:
+                config.update(self.replacedConfig)
+
+    def setup(self):
+        self.profiler = profiling.start(self)
+        if self.profiler is not None:
+            self.profiler.begin("setup", "setup")
+        if self.BATCH_TEX and not texbatch.collecting() and not preview.enabled():
+            # constructs the scene once more, recorded as a whole
+            with profiling.collapsed(self.profiler, "prepare TeX", "setup"):
+                texbatch.prepareScene(type(self))
+        createInstruction.instructionCount = 0
+        self._texMisses = texCache.misses
+        self.sectionNames: list[str] = []
+        self.sectionHashes: list = []
+        if self.profiler is not None:
+            self.profiler.end()
+            self.profiler.begin("construct", "construct")
+        self.next_section("Intro")
+
+    def next_section(self, name: str = "unnamed",
+                     section_type: str = DefaultSectionType.NORMAL,
+                     skip_animations: bool = False) -> None:
+        index = len(self.sectionNames)
+        if self.RENDER_SECTIONS is not None and not texbatch.collecting():
+            if index > max(self.RENDER_SECTIONS, default=-1):
+                raise EndSceneEarlyException()
+            skip_animations = skip_animations or index not in self.RENDER_SECTIONS
+        self.sectionNames.append(name)
+        if self.profiler is not None:
+            self.profiler.endCategory("step")
+            self.profiler.begin(name, "step")
+        if self.KEY_SECTIONS:
+            if self.sectionHashes:
+                # the state the section before ends in, removals and all
+                sectioncache.stateDigest(self, self.sectionHashes[-1])
+            self.sectionHashes.append(sectioncache.newSectionHash())
+        super().next_section(name, section_type, skip_animations)
+
+    def play(self, *args, **kwargs) -> None:
+        if self.KEY_SECTIONS:
+            args = tuple(self.compile_animations(*args, **kwargs))
+            sectioncache.playDigest(self, list(args), self.sectionHashes[-1])
+        if self.profiler is None:
+            super().play(*args, **kwargs)
+        else:
+            name = ", ".join(type(a).__name__.strip("_") for a in args)
+            self.profiler.call(f"play {name}", "play", super().play, *args, **kwargs)
+
+    def wait(self, duration: float = DEFAULT_WAIT_TIME, stop_condition: Callable[[], bool] | None = None,
+             frozen_frame: bool | None = None) -> None:
+        if self.KEY_SECTIONS:
+            sectioncache.waitDigest(self, duration, stop_condition, frozen_frame, self.sectionHashes[-1])
+        if self.profiler is None:
+            super().wait(duration, stop_condition, frozen_frame)
+        else:
+            self.profiler.call("wait", "wait", super().wait, duration, stop_condition, frozen_frame)
+
+    def setBackground(self, image: str) -> None:
+        """Use an image, scaled to the frame height, as the background of every frame.
+
+        The image comes decoded and scaled from the texture cache and becomes the
+        camera's base frame, so frames start from it instead of blending it in.
+
+        Previews keep the plain background color.
+
+        Args:
+            image (str): The image file.
+        """
+        if preview.enabled():
+            return
+        self.camera.background = textureCache.frame(
+            image, (self.camera.pixel_width, self.camera.pixel_height), self.camera.background_color)
+
+    def tear_down(self):
+        # texts compiled one by one are missing from the batch manifest
+        if texCache.misses != self._texMisses and not texbatch.collecting():
+            texbatch.forgetScene(type(self))
+        if self.profiler is not None:
+            self.profiler.endCategory("construct")
+            self.profiler.begin("finish", "finish")
 
 # ==============================================================================
-class SixPointStar(Scene):
+class SixPointStar(StarScene):
     def construct(self):
         # **********************************************************************
         # Configuration
         # **********************************************************************
         RADIUS: float = 3.0
 
-        background = ImageMobject("assets/paper-texture-02.jpg")
-        background.scale_to_fit_height(self.camera.frame_height)
-        background.set_z_index(-100)
-        self.add(background)
+        self.setBackground("assets/paper-texture-02.jpg")
 
         # **********************************************************************
         # Construction
         # **********************************************************************
-        plane = NumberPlane(
-            x_range=(-4, +4), y_range=(-4, +4),
-            axis_config={'stroke_color': GridColor},
-            background_line_style={
-                "stroke_color": GridColor,
-                "stroke_opacity": 0.25
-            })
+        plane = prototypes.numberPlane(PlaneRange, PlaneRange, GridColor, lineOpacity=0.25)
         baseline = Line(np.array([-4, 0, 0]), np.array([+4, 0, 0]),
                         color=ConstructionLineColor)
 
-        centralDot = (Dot(color=ReferenceDotColor)
-                      .move_to(np.array([0, 0, 0])))
-        centralCircle = (Circle(radius=RADIUS, color=ConstructionLineColor)
-                         .move_to(np.array([0, 0, 0])))
+        centralDot = prototypes.dot(ORIGIN, ReferenceDotColor)
+        centralCircle = prototypes.circle(RADIUS, ConstructionLineColor)
 
-        dotA = Dot(color=ReferenceDotColor).move_to(np.array([-RADIUS, 0, 0]))
+        dotA = prototypes.dot(np.array([-RADIUS, 0, 0]), ReferenceDotColor)
         arcA = dashed(Arc(radius=RADIUS, arc_center=np.array([-RADIUS, 0, 0]),
                           start_angle=PI * 3 / 2, angle=PI,
                           color=ConstructionLineColor))
-        dotB = (Dot(color=ReferenceDotColor)
-                .move_to(np.array([+RADIUS, 0, 0])))
+        dotB = prototypes.dot(np.array([+RADIUS, 0, 0]), ReferenceDotColor)
         arcB = dashed(Arc(radius=RADIUS,  arc_center=np.array([+RADIUS, 0, 0]),
                           start_angle=PI * 1 / 2, angle=PI,
                           color=ConstructionLineColor))
 
-        sixPoints: list[NDArray[np.float64]] = [
-            spherical_to_cartesian([RADIUS, n * DEGREES, 90 * DEGREES])
-            for n in range(0, 360, 60)
-        ]
-        sixDots = VGroup(*[Dot(p, color=ReferenceDotColor) for p in sixPoints])
-        enumeratedLocations: list[tuple[int, NDArray[np.float64]]] = [
-            (i, p) for i, p in enumerate(
-                spherical_to_cartesian([RADIUS + 0.5, n * DEGREES, 90 * DEGREES])
-                for n in range(0, 360, 60))
-        ]
-        sixLabels = VGroup(*[
-            LabeledDot(label=Text(str(i + 1), color=ReferenceDotColor, font_size=LabelSize),
-                       point=p, fill_color=LabelFillColor)
-            for i, p in enumeratedLocations
-        ])
+        geometry = starGeometry(6, 2, RADIUS)
+        sixPoints: list[NDArray[np.float64]] = list(geometry.ringPoints)
+        sixDots = DotCloud(geometry.ringPoints, color=ReferenceDotColor)
+        sixLabels = LabelCloud([str(i + 1) for i in range(6)], geometry.labelPoints,
+                               color=ReferenceDotColor, fill_color=LabelFillColor, font_size=LabelSize)
 
         triPoints = sixPoints[:]
         triPoints.append(sixPoints[0])
         tri1 = dashed(Polygon(*triPoints[0::2], color=ConstructionLineColor))
         tri2 = dashed(Polygon(*triPoints[1::2], color=ConstructionLineColor))
 
-        interPoints: list[NDArray[np.float64]] = intersections(sixPoints, interval=2, sides=6)
-        sixPointStarVertices: list[NDArray[np.float64]] = []
-        for a, b in zip(sixPoints, interPoints):
-            sixPointStarVertices.extend([a, b])
-        sixPointVertexDots = [Dot(p, radius=DEFAULT_DOT_RADIUS*0.75, color=FinalColor)
-                              for p in sixPointStarVertices]
+        sixPointStarVertices: list[NDArray[np.float64]] = list(geometry.vertices)
+        sixPointVertexDots = DotCloud(geometry.vertices, radius=DEFAULT_DOT_RADIUS*0.75, color=FinalColor)
         sixPointStar = Polygon(*sixPointStarVertices, color=FinalColor, fill_opacity=1)
 
         howto = (TexWrappedText('how to draw a', fontSize='Large', color=FinalColor, italic=True, bold=False)
@@ -210,182 +356,124 @@ class SixPointStar(Scene):
         # **********************************************************************
         # Animation
         # **********************************************************************
-        self.add(title, howto, sixPointStar)
-        self.wait(2)
-
-        self.play(FadeOut(title), FadeOut(howto),
-                  FadeOut(sixPointStar), FadeIn(plane))
-        self.wait(1)
-
-        # Step 1
-        ins1 = createInstruction('Draw a straight line', parent=plane)
-        self.play(FadeIn(ins1, shift=UP))
-        self.play(Create(baseline))
-
-        # Step 2
-        ins2 = createInstruction('Draw a circle on the line', parent=plane)
-        self.play(Transform(ins1, ins2))
-        self.play(FadeIn(centralDot))
-        self.play(Create(centralCircle))
-        self.wait(1)
-
-        # Step 3A
-        ins3A = createInstruction('From the intersection of the line and circle, draw arcs cutting the circle.', parent=plane)
-        self.play(Transform(ins1, ins3A), FadeIn(dotA), FadeIn(dotB))
-        self.play(FadeIn(dotA), FadeIn(dotB))
-        self.play(Flash(dotA, color=ReferenceDotColor), Flash(dotB, color=ReferenceDotColor))
-        self.play(Create(arcA), Create(arcB))
-        self.wait(1)
-
-        # Step 3B
-
-        ins3B = createInstruction('this creates six points on the circle', continued=True, parent=plane)
-        self.play(baseline.animate.fade(0.5), Transform(ins1, ins3B))
-        self.play(baseline.animate.fade(0.75), centralDot.animate.fade(0.75),
-                  FadeIn(sixDots), FadeIn(sixLabels),
-                  FadeOut(dotA), FadeOut(dotB))
-        self.play(*[Flash(d, color=ReferenceDotColor) for d in sixDots])
-        self.wait(1)
-
-        # Step 4
-        ins4 = createInstruction('Join the alternate dots,\ncreating two triangles', parent=plane)
-        self.play(centralCircle.animate.fade(0.5), arcA.animate.fade(0.5), arcB.animate.fade(0.5),
-                  Transform(ins1, ins4))
-        self.play(centralCircle.animate.fade(0.75), arcA.animate.fade(0.75), arcB.animate.fade(0.75))
-        self.play(Create(tri1), run_time=2)
-        self.play(Create(tri2), run_time=2)
-        self.wait(1)
-
-        # Step 5
-        ins5 = createInstruction('Draw along the outline of the two triangles to create the 6-point star', parent=plane)
-        self.play(tri1.animate.fade(0.5), tri2.animate.fade(0.5), FadeOut(sixLabels), FadeOut(sixDots), Transform(ins1, ins5),
-                  *[FadeIn(d, scale=1.5) for d in sixPointVertexDots])
-        sixPointStar.set_fill(FinalColor, opacity=0)
-        self.play(Create(sixPointStar), run_time=5)
-        self.play(*[FadeOut(d) for d in sixPointVertexDots],
-                  FadeOut(arcA), FadeOut(arcB),
-                  FadeOut(tri1), FadeOut(tri2), FadeOut(ins1),
-                  FadeOut(baseline), FadeOut(centralCircle), FadeOut(centralDot), FadeOut(plane),
-                  FadeIn(title), sixPointStar.animate.set_fill(FinalColor, opacity=1), run_time=2)
-
-        self.wait(2)
+        timings = transcript("video/SixPointStar.md")
+        script = [
+            Step("Intro", duration=timings["Video Title"].duration, objects=(title, howto, sixPointStar), beats=[
+                Hold(2),
+                [fadeOut(title), fadeOut(howto), fadeOut(sixPointStar), fadeIn(plane)],
+            ]),
+            Step("Step 1", duration=timings["Instruction 1"].duration, instruction='Draw a straight line', beats=[
+                [create(baseline)],
+            ]),
+            Step("Step 2", duration=timings["Instruction 2"].duration, instruction='Draw a circle on the line', beats=[
+                [fadeIn(centralDot)],
+                [create(centralCircle)],
+            ]),
+            Step("Step 3A", duration=timings["Instruction 3A"].duration,
+                 instruction='From the intersection of the line and circle, draw arcs cutting the circle.', beats=[
+                [fadeIn(dotA), fadeIn(dotB)],
+                [animate(Flash, dotA, color=ReferenceDotColor), animate(Flash, dotB, color=ReferenceDotColor)],
+                [create(arcA), create(arcB)],
+            ]),
+            Step("Step 3B", duration=timings["Instruction 3B"].duration,
+                 instruction='this creates six points on the circle', continued=True, beats=[
+                [fade(baseline, 0.5)],
+                [fade(baseline, 0.75), fade(centralDot, 0.75), fadeIn(sixDots), fadeIn(sixLabels),
+                 fadeOut(dotA), fadeOut(dotB)],
+                [animate(FlashDots, sixDots, color=ReferenceDotColor)],
+            ]),
+            Step("Step 4", duration=timings["Instruction 4"].duration,
+                 instruction='Join the alternate dots,\ncreating two triangles', beats=[
+                [fade(centralCircle, 0.5), fade(arcA, 0.5), fade(arcB, 0.5)],
+                [fade(centralCircle, 0.75), fade(arcA, 0.75), fade(arcB, 0.75)],
+                Beat([create(tri1)], run_time=2),
+                Beat([create(tri2)], run_time=2),
+            ]),
+            Step("Step 5", duration=timings["Instruction 5 + Closing"].duration,
+                 instruction='Draw along the outline of the two triangles to create the 6-point star', beats=[
+                [fade(tri1, 0.5), fade(tri2, 0.5), fadeOut(sixLabels), fadeOut(sixDots),
+                 introduce(FadeInDots, sixPointVertexDots, scale=1.5)],
+                Beat([instantly(sixPointStar, "set_fill", FinalColor, opacity=0), create(sixPointStar)], run_time=5),
+                Beat([fadeOut(sixPointVertexDots), fadeOut(arcA), fadeOut(arcB),
+                      fadeOut(tri1), fadeOut(tri2), dismissInstruction(),
+                      fadeOut(baseline), fadeOut(centralCircle), fadeOut(centralDot), fadeOut(plane),
+                      fadeIn(title), change(sixPointStar, "set_fill", FinalColor, opacity=1)], run_time=2),
+            ]),
+        ]
+        compileSteps(script, functools.partial(createInstruction, parent=plane), stage=self.mobjects).play(self)
 
 
 # ==============================================================================
-class EightPointStar(Scene):
+class EightPointStar(StarScene):
     def construct(self):
         # **********************************************************************
         # Configuration
         # **********************************************************************
         RADIUS: float = 2.0
+        points = eightPointConstruction(RADIUS)
 
-        background = ImageMobject("assets/paper-texture-02.jpg")
-        background.scale_to_fit_height(self.camera.frame_height)
-        background.set_z_index(-100)
-        self.add(background)
+        self.setBackground("assets/paper-texture-02.jpg")
 
         # **********************************************************************
         # Construction
         # **********************************************************************
-        plane = NumberPlane(
-            x_range=(-4, +4), y_range=(-4, +4),
-            axis_config={'stroke_color': GridColor},
-            background_line_style={
-                "stroke_color": GridColor,
-                "stroke_opacity": 0.25
-            })
+        plane = prototypes.numberPlane(PlaneRange, PlaneRange, GridColor, lineOpacity=0.25)
         baseline = Line(np.array([-4, 0, 0]), np.array([+4, 0, 0]),
                         color=ConstructionLineColor)
 
-        centralDot = (Dot(color=ReferenceDotColor)
-                      .move_to(np.array([0, 0, 0])))
-        centralCircle = (Circle(radius=RADIUS, color=ConstructionLineColor)
-                         .move_to(np.array([0, 0, 0])))
-        dashedCentralCircle = dashed(centralCircle, factor=1.0)
-
-        pointA = (+RADIUS, 0, 0)
-        dotA = Dot(color=ReferenceDotColor).move_to(pointA)
-        arcA = dashed(Arc(radius=RADIUS, arc_center=pointA,
-                          start_angle=(90 - 5) * DEGREES, angle=(180 + 10) * DEGREES,
-                          color=ConstructionLineColor), factor=0.5)
-
-        pointB = (-RADIUS, 0, 0)
-        dotB = Dot(color=ReferenceDotColor).move_to(pointB)
-        arcB = dashed(Arc(radius=RADIUS, arc_center=pointB,
-                          start_angle=(270 - 5) * DEGREES, angle=(180 + 10) * DEGREES,
-                          color=ConstructionLineColor), factor=0.5)
-
-        fourPoints = [spherical_to_cartesian([RADIUS, n * DEGREES, 90 * DEGREES])
-                      for n in [60, 120, 240, 300]]
-        fourDots = VGroup(*[Dot(p, color=ReferenceDotColor) for p in fourPoints])
-        enumeratedLocations: list[tuple[int, NDArray[np.float64]]] = [
-            (i, p) for i, p in enumerate(
-                spherical_to_cartesian([RADIUS + 0.5, n * DEGREES, 90 * DEGREES])
-                for n in [60, 120, 240, 300])
-        ]
-        fourLabels = VGroup(*[
-            LabeledDot(label=Text('abcd'[i], color=RED, font_size=16),
-                       point=p, fill_color=LabelFillColor)
-            for i, p in enumeratedLocations
-        ])
-
-        upperArcR = dashed(Arc(radius=RADIUS, arc_center=fourPoints[0],
-                               start_angle=(120 - 5) * DEGREES, angle=10*DEGREES,
-                               color=ConstructionLineColor), factor=0.1)
-        upperArcL = dashed(Arc(radius=RADIUS, arc_center=fourPoints[1],
-                               start_angle=(60 - 5) * DEGREES, angle=10*DEGREES,
-                               color=ConstructionLineColor), factor=0.1)
-        lowerArcL = dashed(Arc(radius=RADIUS, arc_center=fourPoints[2],
-                               start_angle=(300 - 5) * DEGREES, angle=10*DEGREES,
-                               color=ConstructionLineColor), factor=0.1)
-        lowerArcR = dashed(Arc(radius=RADIUS, arc_center=fourPoints[3],
-                               start_angle=(240 - 5) * DEGREES, angle=10*DEGREES,
-                               color=ConstructionLineColor), factor=0.1)
+        centralDot = prototypes.dot(ORIGIN, ReferenceDotColor)
+        centralCircle = prototypes.circle(RADIUS, ConstructionLineColor)
+        dashedCentralCircle = dashed(centralCircle)
+
+        pointA = points["A"]
+        dotA = prototypes.dot(pointA, ReferenceDotColor)
+        arcA = constructionArc(points, "arcA")
+
+        pointB = points["B"]
+        dotB = prototypes.dot(pointB, ReferenceDotColor)
+        arcB = constructionArc(points, "arcB")
+
+        fourPoints = [points[name] for name in "abcd"]
+        fourDots = VGroup(*[prototypes.dot(p, ReferenceDotColor) for p in fourPoints])
+        fourLabels = LabelCloud("abcd", [p * (RADIUS + 0.5) / RADIUS for p in fourPoints],
+                                color=RED, fill_color=LabelFillColor, font_size=SmallLabelSize)
+
+        upperArcR, upperArcL, lowerArcL, lowerArcR = [constructionArc(points, name)
+                                                      for name in ("arcCa", "arcCb", "arcDc", "arcDd")]
         for a in (upperArcR, upperArcL, lowerArcL, lowerArcR):
             a.z_index = 10
 
-        pointC = pointA + spherical_to_cartesian([RADIUS * 2, 120 * DEGREES, 90 * DEGREES])
-        pointD = pointA + spherical_to_cartesian([RADIUS * 2, 240 * DEGREES, 90 * DEGREES])
-        dotC = Dot(color=ReferenceDotColor).move_to(pointC)
-        dotD = Dot(color=ReferenceDotColor).move_to(pointD)
-        perpendicularLine = dashed(Line(pointC, pointD, color=ConstructionLineColor), factor=0.8)
-
-        pointE = centralCircle.point_at_angle(90 * DEGREES)
-        pointF = centralCircle.point_at_angle(270 * DEGREES)
-        dotE = Dot(color=ReferenceDotColor).move_to(pointE)
-        dotF = Dot(color=ReferenceDotColor).move_to(pointF)
-        arcE = dashed(Arc(radius=RADIUS, arc_center=pointE,
-                          start_angle=(180 - 5) * DEGREES, angle=(180 + 10) * DEGREES,
-                          color=ConstructionLineColor), factor=0.5)
-        arcF = dashed(Arc(radius=RADIUS, arc_center=pointF,
-                          start_angle=(0 - 5) * DEGREES, angle=(180 + 10) * DEGREES,
-                          color=ConstructionLineColor), factor=0.5)
-
-        cornerPoints = []
-        for p in [pointA, pointB]:
-            c = Circle(radius=RADIUS).move_to(p)
-            for a in [90, 270]:
-                cornerPoints.append(c.point_at_angle(a * DEGREES))
-        cornerPoints.append(cornerPoints.pop(1))
-        cornerDots = VGroup(*[Dot(p, color=ReferenceDotColor) for p in cornerPoints])
-        crossLineA = dashed(Line(cornerPoints[0], cornerPoints[2], color=ConstructionLineColor), factor=0.8)
-        crossLineB = dashed(Line(cornerPoints[1], cornerPoints[3], color=ConstructionLineColor), factor=0.8)
-
-        eightPoints = [spherical_to_cartesian([RADIUS, n * DEGREES, 90 * DEGREES]) for n in range(0, 360, 45)]
-        eightDots = [Dot(p, color=ReferenceDotColor) for p in eightPoints]
+        pointC = points["C"]
+        pointD = points["D"]
+        dotC = prototypes.dot(pointC, ReferenceDotColor)
+        dotD = prototypes.dot(pointD, ReferenceDotColor)
+        perpendicularLine = dashed(Line(pointC, pointD, color=ConstructionLineColor))
+
+        pointE = points["E"]
+        pointF = points["F"]
+        dotE = prototypes.dot(pointE, ReferenceDotColor)
+        dotF = prototypes.dot(pointF, ReferenceDotColor)
+        arcE = constructionArc(points, "arcE")
+        arcF = constructionArc(points, "arcF")
+
+        cornerPoints = [points[f"corner{i}"] for i in range(4)]
+        cornerDots = VGroup(*[prototypes.dot(p, ReferenceDotColor) for p in cornerPoints])
+        crossLineA = dashed(Line(cornerPoints[0], cornerPoints[2], color=ConstructionLineColor))
+        crossLineB = dashed(Line(cornerPoints[1], cornerPoints[3], color=ConstructionLineColor))
+
+        geometry = starGeometry(8, 2, RADIUS)
+        eightPoints = list(geometry.ringPoints)
+        eightDots = VGroup(DotCloud(geometry.ringPoints[0::2], color=ReferenceDotColor),
+                           DotCloud(geometry.ringPoints[1::2], color=ReferenceDotColor))
 
         squarePoints = eightPoints[:]
         squarePoints.append(eightPoints[0])
 
-        sq1 = dashed(Polygon(*squarePoints[0::2], color=ConstructionLineColor), factor=0.8)
-        sq2 = dashed(Polygon(*squarePoints[1::2], color=ConstructionLineColor), factor=0.8)
+        sq1 = dashed(Polygon(*squarePoints[0::2], color=ConstructionLineColor))
+        sq2 = dashed(Polygon(*squarePoints[1::2], color=ConstructionLineColor))
 
-        interPoints = intersections(eightPoints, interval=2, sides=8)
-        eightPointStarVertices = []
-        for a, b in zip(eightPoints, interPoints):
-            eightPointStarVertices.extend([a, b])
-        eightPointVertexDots = [Dot(p, radius=DEFAULT_DOT_RADIUS*0.75, color=FinalColor)
-                                for p in eightPointStarVertices]
+        eightPointStarVertices = list(geometry.vertices)
+        eightPointVertexDots = DotCloud(geometry.vertices, radius=DEFAULT_DOT_RADIUS*0.75, color=FinalColor)
         eightPointStar = Polygon(*eightPointStarVertices, color=FinalColor, fill_opacity=1)
 
         howto = (TexWrappedText('how to draw a', fontSize='Large', color=FinalColor, italic=True, bold=False)
@@ -396,151 +484,125 @@ class EightPointStar(Scene):
 
         # **********************************************************************
         # Animation
-        self.add(title, howto, eightPointStar)
-        self.wait(2)
-
-        self.play(FadeOut(title), FadeOut(howto), FadeOut(eightPointStar),
-                  FadeIn(plane))
-        self.wait(1)
-
-        # Step 1
-        ins1 = createInstruction('Draw a straight line', parent=plane)
-        self.play(FadeIn(ins1, shift=UP))
-        self.play(Create(baseline))
-
-        # Step 2
-        ins2 = createInstruction('Draw a circle on the line', parent=plane)
-        self.play(Transform(ins1, ins2))
-        self.play(Indicate(centralDot, color=IndicateDotColor, scale_factor=1.5))
-        self.play(Create(dashedCentralCircle))
-        self.wait(1)
-
-        # Step 3
-        ins3 = createInstruction('From the intersection of the line and circle, draw arcs cutting the circle.', parent=plane)
-        self.play(Transform(ins1, ins3), FadeIn(dotA), FadeIn(dotB))
-        self.play(Indicate(dotA, color=IndicateDotColor, scale_factor=1.5))
-        self.play(Create(arcA))
-        self.play(Indicate(dotB, color=IndicateDotColor, scale_factor=1.5))
-        self.play(Create(arcB))
-        self.wait(1)
-
-        # Step 4
-        ins4 = createInstruction('Draw perpendicular to the baseline.', parent=plane)
-        self.play(Transform(ins1, ins4), baseline.animate.fade(0.75), centralDot.animate.fade(0.75))
-        self.play(Indicate(fourDots[0], color=IndicateDotColor, scale_factor=1.5))
-        self.play(Create(upperArcR), run_time=0.3)
-        self.play(Indicate(fourDots[1], color=IndicateDotColor, scale_factor=1.5))
-        self.play(Create(upperArcL), run_time=0.3)
-        self.wait(0.5)
-        self.play(Indicate(fourDots[2], color=IndicateDotColor, scale_factor=1.5))
-        self.play(Create(lowerArcL), run_time=0.3)
-        self.play(Indicate(fourDots[3], color=IndicateDotColor, scale_factor=1.5))
-        self.play(Create(lowerArcR), run_time=0.3)
-        self.play(fourDots.animate.fade(0.75))
-        self.play(Indicate(dotC, color=IndicateDotColor, scale_factor=1.5),
-                  Indicate(dotD, color=IndicateDotColor, scale_factor=1.5))
-        self.play(Create(perpendicularLine))
-        self.wait(1)
-
-        # Step 5
-        ins5 = createInstruction('From the intersection of the perpendicular line '
-                                 'and the circle, draw arcs cutting the previous two arcs.',
-                                 parent=plane)
-        self.remove(fourDots)
-        self.play(Transform(ins1, ins5), FadeIn(dotE), FadeIn(dotF),
-                  *[arc.animate.fade(0.75) for arc in (upperArcR, upperArcL, lowerArcL, lowerArcR)],
-                  FadeOut(dotC), FadeOut(dotD))
-        self.play(Indicate(dotE, color=IndicateDotColor, scale_factor=1.5))
-        self.play(Create(arcE))
-        self.play(Indicate(dotF, color=IndicateDotColor, scale_factor=1.5))
-        self.play(Create(arcF))
-        self.wait(1)
-
-        # Step 6
-        ins6 = createInstruction('Draw diagonal lines intersecting the circle.',
-                                 parent=plane)
-        self.play(Transform(ins1, ins6), perpendicularLine.animate.fade(0.75),
-                  FadeIn(cornerDots),
-                  *[arc.animate.fade(0.75) for arc in (arcA, arcB, arcE, arcF)])
-        self.play(Indicate(cornerDots[0], color=IndicateDotColor, scale_factor=1.5),
-                  Indicate(cornerDots[2], color=IndicateDotColor, scale_factor=1.5))
-        self.play(Create(crossLineA))
-        self.play(Indicate(cornerDots[1], color=IndicateDotColor, scale_factor=1.5),
-                  Indicate(cornerDots[3], color=IndicateDotColor, scale_factor=1.5))
-        self.play(Create(crossLineB))
-        self.wait(1)
-
-        # Step 7
-        ins7 = createInstruction('Draw diagonal lines intersecting the circle.',
-                                 parent=plane)
-        self.play(Transform(ins1, ins7), FadeOut(cornerDots),
-                  *[line.animate.fade(0.75) for line in (crossLineA, crossLineB)],
-                  *[FadeIn(d) for d in eightDots])
-        self.remove(dotA, dotB, dotE, dotF)
-
-        # Step 8
-        ins8 = createInstruction('This creates eight equally spaced points '
-                                 'on the circle. Join alternate points to '
-                                 'create two overlapping squares.',
-                                 parent=plane)
-        self.play(Transform(ins1, ins8), dashedCentralCircle.animate.fade(0.5))
-        self.play(*[Indicate(d, color=IndicateDotColor, scale_factor=1.5)
-                    for d in eightDots[0::2]])
-        self.play(Create(sq1))
-
-        self.play(*[Indicate(d, color=IndicateDotColor, scale_factor=1.5)
-                    for d in eightDots[1::2]])
-        self.play(Create(sq2))
-
-        # Step 9
-        ins9 = createInstruction('Draw along the outline of the two squares '
-                                 'to create the 8-point star',
-                                 parent=plane)
-        self.play(Transform(ins1, ins9))
-        self.play(*[o.animate.fade(0.75) for o in eightDots],
-          *[o.animate.fade(0.50) for o in (sq1, sq2)],
-          *[FadeIn(d) for d in eightPointVertexDots])
-        eightPointStar.set_fill(FinalColor, opacity=0)
-        self.play(Create(eightPointStar), run_time=3)
-        self.play(FadeOut(sq1), FadeOut(sq2), FadeOut(ins1),
-                  *[FadeOut(d) for d in (*eightPointVertexDots, sq1, sq2, *eightDots)],
-                  *[FadeOut(d) for d in (arcA, arcB, arcE, arcF, crossLineA, crossLineB)],
-                  *[FadeOut(d) for d in (perpendicularLine, upperArcR, upperArcL, lowerArcL, lowerArcR)],
-                  *[FadeOut(d) for d in (baseline, centralDot, dashedCentralCircle, plane)],
-                  FadeIn(title),
-                  eightPointStar.animate.set_fill(FinalColor, opacity=1), run_time=2)
-        self.wait(1)
+        # **********************************************************************
+        # indicating a dot also shows it, the first time
+        indicate = functools.partial(animate, Indicate, color=IndicateDotColor, scale_factor=1.5, shows=True)
+        script = [
+            Step("Intro", objects=(title, howto, eightPointStar), beats=[
+                Hold(2),
+                [fadeOut(title), fadeOut(howto), fadeOut(eightPointStar), fadeIn(plane)],
+                Hold(1),
+            ]),
+            Step("Step 1", instruction='Draw a straight line', beats=[
+                [create(baseline)],
+            ]),
+            Step("Step 2", instruction='Draw a circle on the line', beats=[
+                [indicate(centralDot)],
+                [create(dashedCentralCircle)],
+                Hold(1),
+            ]),
+            Step("Step 3", instruction='From the intersection of the line and circle, draw arcs cutting the circle.',
+                 beats=[
+                [fadeIn(dotA), fadeIn(dotB)],
+                [indicate(dotA)],
+                [create(arcA)],
+                [indicate(dotB)],
+                [create(arcB)],
+                Hold(1),
+            ]),
+            Step("Step 4", instruction='Draw perpendicular to the baseline.', beats=[
+                [fade(baseline, 0.75), fade(centralDot, 0.75)],
+                [indicate(fourDots[0])],
+                Beat([create(upperArcR)], run_time=0.3),
+                [indicate(fourDots[1])],
+                Beat([create(upperArcL)], run_time=0.3),
+                Hold(0.5),
+                [indicate(fourDots[2])],
+                Beat([create(lowerArcL)], run_time=0.3),
+                [indicate(fourDots[3])],
+                Beat([create(lowerArcR)], run_time=0.3),
+                [fade(fourDots, 0.75)],
+                [indicate(dotC), indicate(dotD)],
+                [create(perpendicularLine)],
+                Hold(1),
+                [remove(fourDots)],
+            ]),
+            Step("Step 5", instruction='From the intersection of the perpendicular line '
+                                       'and the circle, draw arcs cutting the previous two arcs.', beats=[
+                [fadeIn(dotE), fadeIn(dotF), fadeOut(dotC), fadeOut(dotD),
+                 *[fade(arc, 0.75) for arc in (upperArcR, upperArcL, lowerArcL, lowerArcR)]],
+                [indicate(dotE)],
+                [create(arcE)],
+                [indicate(dotF)],
+                [create(arcF)],
+                Hold(1),
+            ]),
+            Step("Step 6", instruction='Draw diagonal lines intersecting the circle.', beats=[
+                [fade(perpendicularLine, 0.75), fadeIn(cornerDots),
+                 *[fade(arc, 0.75) for arc in (arcA, arcB, arcE, arcF)]],
+                [indicate(cornerDots[0]), indicate(cornerDots[2])],
+                [create(crossLineA)],
+                [indicate(cornerDots[1]), indicate(cornerDots[3])],
+                [create(crossLineB)],
+                Hold(1),
+            ]),
+            Step("Step 7", instruction='Draw diagonal lines intersecting the circle.', beats=[
+                [fadeOut(cornerDots), fade(crossLineA, 0.75), fade(crossLineB, 0.75), fadeIn(eightDots)],
+                [remove(dotA), remove(dotB), remove(dotE), remove(dotF)],
+            ]),
+            Step("Step 8", instruction='This creates eight equally spaced points on the circle. '
+                                       'Join alternate points to create two overlapping squares.', beats=[
+                [fade(dashedCentralCircle, 0.5)],
+                [animate(IndicateDots, eightDots[0], color=IndicateDotColor, scale_factor=1.5)],
+                [create(sq1)],
+                [animate(IndicateDots, eightDots[1], color=IndicateDotColor, scale_factor=1.5)],
+                [create(sq2)],
+            ]),
+            Step("Step 9", instruction='Draw along the outline of the two squares to create the 8-point star',
+                 beats=[
+                Beat([fade(eightDots, 0.75), fade(sq1, 0.5), fade(sq2, 0.5), fadeIn(eightPointVertexDots)],
+                     separate=True),
+                Beat([instantly(eightPointStar, "set_fill", FinalColor, opacity=0), create(eightPointStar)],
+                     run_time=3),
+                Beat([*[fadeOut(o) for o in (eightPointVertexDots, sq1, sq2, eightDots)],
+                      *[fadeOut(o) for o in (arcA, arcB, arcE, arcF, crossLineA, crossLineB)],
+                      *[fadeOut(o) for o in (perpendicularLine, upperArcR, upperArcL, lowerArcL, lowerArcR)],
+                      *[fadeOut(o) for o in (baseline, centralDot, dashedCentralCircle, plane)],
+                      dismissInstruction(), fadeIn(title),
+                      change(eightPointStar, "set_fill", FinalColor, opacity=1)], run_time=2),
+                Hold(1),
+            ]),
+        ]
+        compileSteps(script, functools.partial(createInstruction, parent=plane), stage=self.mobjects).play(self)
 
 
 # ==============================================================================
-class EightPointStarConcept(Scene):
+class EightPointStarConcept(StarScene):
     def construct(self):
         RADIUS = 2.0
 
-        plane = NumberPlane(x_range=(-4, +4), y_range=(-4, +4)).set_opacity(0.25)
-        baseline = dashed(Line((-3, 0, 0), (+3, 0, 0), color=YELLOW), factor=0.8)
+        plane = prototypes.numberPlane(PlaneRange, PlaneRange).set_opacity(0.25)
+        baseline = dashed(Line((-3, 0, 0), (+3, 0, 0), color=YELLOW))
 
-        centralDot = Dot(color=RED).move_to((0, 0, 0))
-        centralCircle = Circle(radius=RADIUS, color=YELLOW).move_to((0, 0, 0))
-        dashedCentralCircle = dashed(centralCircle, factor=1.0)
+        centralDot = prototypes.dot(ORIGIN, RED)
+        centralCircle = prototypes.circle(RADIUS, YELLOW)
+        dashedCentralCircle = dashed(centralCircle)
 
-        eightPoints = [spherical_to_cartesian([RADIUS, n * DEGREES, 90 * DEGREES]) for n in range(0, 360, 45)]
-        eightDots = [Dot(p, color=RED) for p in eightPoints]
-        eightLabels = VGroup(*[LabeledDot(label=Text(str(i+1), color=RED, font_size=16), point=p, fill_color=WHITE)
-                               for i, p in enumerate(spherical_to_cartesian([RADIUS + 0.5, n * DEGREES, 90 * DEGREES])
-                                                     for n in range(0, 360, 45))])
+        geometry = starGeometry(8, 2, RADIUS)
+        eightPoints = list(geometry.ringPoints)
+        eightDots = [prototypes.dot(p, RED) for p in eightPoints]
+        eightLabels = VGroup(*[prototypes.labeledDot(str(i+1), p, color=RED, fill_color=WHITE,
+                                                     font_size=SmallLabelSize)
+                               for i, p in enumerate(geometry.labelPoints)])
 
         squarePoints = eightPoints[:]
         squarePoints.append(eightPoints[0])
 
-        sq1 = dashed(Polygon(*squarePoints[0::2], color=BLUE), factor=0.8)
-        sq2 = dashed(Polygon(*squarePoints[1::2], color=BLUE), factor=0.8)
+        sq1 = dashed(Polygon(*squarePoints[0::2], color=BLUE))
+        sq2 = dashed(Polygon(*squarePoints[1::2], color=BLUE))
 
-        interPoints = intersections(eightPoints, interval=2, sides=8)
-        eightPointStarVertices = []
-        for a, b in zip(eightPoints, interPoints):
-            eightPointStarVertices.extend([a, b])
-        eightPointVertexDots = [Dot(p, color=BLUE) for p in eightPointStarVertices]
+        eightPointStarVertices = list(geometry.vertices)
+        eightPointVertexDots = [prototypes.dot(p, BLUE) for p in eightPointStarVertices]
         eightPointStar = Polygon(*eightPointStarVertices, color=BLUE, fill_opacity=1)
 
         title = Text('Core Concept', color=BLUE, slant='ITALIC').next_to(eightPointStar, UP)
@@ -571,3 +633,160 @@ class EightPointStarConcept(Scene):
         self.wait(5)
 
 # ==============================================================================
+class StarTessellation(StarScene):
+    """Eight-point stars on a square lattice, with six-point stars on a hexagonal
+    lattice below them."""
+    def construct(self):
+        RADIUS: float = 0.5
+
+        self.setBackground("assets/paper-texture-02.jpg")
+
+        eightPointStars = tessellate(starGeometry(8, 2, RADIUS), squareLattice(2 * RADIUS),
+                                     yRange=(+4 * RADIUS, config.frame_height / 2))
+        sixPointStars = tessellate(starGeometry(6, 2, RADIUS), hexLattice(2 * RADIUS),
+                                   yRange=(-config.frame_height / 2, -4 * RADIUS))
+        self.play(*[FadeIn(batch) for batch in (*eightPointStars, *sixPointStars)])
+        self.wait(2)
+
+# ==============================================================================
+_OrdinalNames: dict[int, str] = {
+    2: 'second', 3: 'third', 4: 'fourth', 5: 'fifth', 6: 'sixth',
+    7: 'seventh', 8: 'eighth', 9: 'ninth', 10: 'tenth', 11: 'eleventh',
+}
+_PolygonNames: dict[int, str] = {
+    3: 'triangles', 4: 'squares', 5: 'pentagons', 6: 'hexagons',
+    7: 'heptagons', 8: 'octagons', 9: 'nonagons', 10: 'decagons',
+}
+
+# ==============================================================================
+class NPointStar(StarScene):
+    """Tutorial for an `{N/INTERVAL}` star, drawn on a circle of radius `RADIUS`.
+
+    The star geometry comes from `starGeometry`, so every scene drawing the same
+    star shares one computation. Use `nPointStarScene` to create variants.
+    """
+    N: int = 12
+    INTERVAL: int = 3
+    RADIUS: float = 3.0
+
+    def construct(self):
+        # **********************************************************************
+        # Configuration
+        # **********************************************************************
+        n, interval, RADIUS = self.N, self.INTERVAL, self.RADIUS
+        geometry = starGeometry(n, interval, RADIUS)
+        count = len(geometry.polygons)
+        sides = n // count
+
+        self.setBackground("assets/paper-texture-02.jpg")
+
+        # **********************************************************************
+        # Construction
+        # **********************************************************************
+        plane = prototypes.numberPlane(PlaneRange, PlaneRange, GridColor, lineOpacity=0.25)
+
+        centralDot = prototypes.dot(ORIGIN, ReferenceDotColor)
+        centralCircle = prototypes.circle(RADIUS, ConstructionLineColor)
+
+        ringDots = DotCloud(geometry.ringPoints, color=ReferenceDotColor)
+        ringLabels = LabelCloud([str(i + 1) for i in range(n)], geometry.labelPoints,
+                                color=ReferenceDotColor, fill_color=LabelFillColor, font_size=LabelSize)
+
+        polygons = [dashed(Polygon(*corners, color=ConstructionLineColor))
+                    for corners in geometry.polygons]
+
+        starVertexDots = DotCloud(geometry.vertices, radius=DEFAULT_DOT_RADIUS*0.75, color=FinalColor)
+        star = Polygon(*geometry.vertices, color=FinalColor, fill_opacity=1)
+
+        name = starName(n)
+        howto = (TexWrappedText('how to draw a', fontSize='Large', color=FinalColor, italic=True, bold=False)
+                 .next_to(star, UP)).shift(np.array((0.0, 0.5, 0.0)))
+        title = (TexWrappedText(f'{name}-Point Star', fontSize='huge',
+                                color=FinalColor, italic=False, bold=True)
+                 .next_to(star, DOWN)).shift(np.array((0.0, -0.5, 0.0)))
+
+        if count > 1:
+            shapes = f"{starName(count).lower()} overlapping {_PolygonNames.get(sides, 'polygons')}"
+        else:
+            shapes = "a star polygon"
+
+        # **********************************************************************
+        # Animation
+        # **********************************************************************
+        ordinal = _OrdinalNames.get(interval, f"{interval}th")
+        script = [
+            Step("Intro", objects=(title, howto, star), beats=[
+                Hold(2),
+                [fadeOut(title), fadeOut(howto), fadeOut(star), fadeIn(plane)],
+                Hold(1),
+            ]),
+            Step("Step 1", instruction='Draw a circle', beats=[
+                [fadeIn(centralDot)],
+                [create(centralCircle)],
+                Hold(1),
+            ]),
+            Step("Step 2", instruction=f'Divide the circle into {n} equal parts', beats=[
+                [fadeIn(ringDots), fadeIn(ringLabels)],
+                [animate(FlashDots, ringDots, color=ReferenceDotColor)],
+                Hold(1),
+            ]),
+            Step("Step 3", instruction=f'Join every {ordinal} dot, creating {shapes}', beats=[
+                [fade(centralCircle, 0.75), fade(centralDot, 0.75)],
+                *[Beat([create(polygon)], run_time=2) for polygon in polygons],
+                Hold(1),
+            ]),
+            Step("Step 4", instruction=f'Draw along the outline to create the {n}-point star', beats=[
+                [*[fade(p, 0.5) for p in polygons], fadeOut(ringLabels), fadeOut(ringDots),
+                 introduce(FadeInDots, starVertexDots, scale=1.5)],
+                Beat([instantly(star, "set_fill", FinalColor, opacity=0), create(star)], run_time=5),
+                Beat([fadeOut(starVertexDots), *[fadeOut(p) for p in polygons], dismissInstruction(),
+                      fadeOut(centralCircle), fadeOut(centralDot), fadeOut(plane),
+                      fadeIn(title), change(star, "set_fill", FinalColor, opacity=1)], run_time=2),
+                Hold(2),
+            ]),
+        ]
+        compileSteps(script, functools.partial(createInstruction, parent=plane), stage=self.mobjects).play(self)
+
+# ******************************************************************************
+def nPointStarScene(n: int, interval: int, radius: float = 3.0,
+                    name: str | None = None) -> type[NPointStar]:
+    """Create an `NPointStar` scene class for an `{n/interval}` star.
+
+    Args:
+        n (int): The number of points of the star.
+        interval (int): The interval between the points to be joined.
+        radius (float, optional): The radius of the circle. Default is 3.0.
+        name (str, optional): Name of the scene class. Default is derived from
+            `n`, e.g. "TwelvePointStar".
+
+    Returns:
+        type[NPointStar]: A new scene class.
+    """
+    if not 2 <= interval < n / 2:
+        raise ValueError(f"Interval must be between 2 and {n}/2, got {interval}.")
+    if name is None:
+        name = (f"{NumberNames[n].replace('-', '')}PointStar" if n in NumberNames
+                else f"NPointStar{n}")
+    return type(name, (NPointStar,), {'N': n, 'INTERVAL': interval, 'RADIUS': radius})
+
+
+TenPointStar = nPointStarScene(10, 3)
+SixteenPointStar = nPointStarScene(16, 4)
+
+# ******************************************************************************
+def buildPrototypes() -> None:
+    """Build the mobjects shared by the scenes into the prototype pool.
+
+    Called by every `render.py` worker before its first scene, and by the
+    parent before it forks them, so the workers start with the planes,
+    reference dots and label glyphs already built.
+    """
+    prototypes.numberPlane(PlaneRange, PlaneRange, GridColor, lineOpacity=0.25)
+    prototypes.dot(ORIGIN, ReferenceDotColor)
+    # at the sizes the scenes ask for: the ring numbers, then the letters and
+    # numbers of the eight-point construction
+    for label, fontSize in [*((str(i + 1), LabelSize) for i in range(max(NumberNames))),
+                            *((label, SmallLabelSize) for label in [*"abcd", *(str(i + 1) for i in range(8))])]:
+        prototypes.glyphOutline(label, fontSize)
+
+# ==============================================================================
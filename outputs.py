@@ -0,0 +1,196 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import math
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from queue import Queue
+from threading import Thread
+
+import av
+import numpy as np
+from manim import config
+from numpy.typing import NDArray
+
+import streaming
+
+# ******************************************************************************
+@dataclass(frozen=True)
+class Output:
+    """One movie of a multi-output render: a framing of the scene at a pixel size.
+
+    Framings are measured in plane heights, so they follow the layout of the
+    scenes around their `NumberPlane` rather than the module's frame.
+
+    Attributes:
+        name (str): The name of the output, appended to the movie's file name.
+        size (tuple[int, int]): Width and height in pixels.
+        height (float): The height of the framing, in plane heights.
+        offset (float): The height of the framing's center above the plane's
+            center, in plane heights.
+    """
+    name: str
+    size: tuple[int, int]
+    height: float
+    offset: float = 0.0
+
+    def region(self, planeSize: float) -> tuple[float, float, float]:
+        """Get the center height, width and height of the framing in scene units."""
+        height = self.height * planeSize
+        return self.offset * planeSize, height * self.size[0] / self.size[1], height
+
+
+Outputs: dict[str, Output] = {o.name: o for o in (
+    Output("portrait", (1080, 1920), 2.0),
+    Output("portrait720", (720, 1280), 2.0),
+    Output("square", (1080, 1080), 1.5, -0.125),
+    Output("landscape", (1920, 1080), 1.5, -0.125),
+)}
+
+_planeSize: float = 8.0  # set by `configure`
+
+# ******************************************************************************
+def selected() -> list[Output]:
+    """Get the outputs named, comma separated, in the `ISLAMICART_OUTPUTS` environment variable.
+
+    Raises:
+        ValueError: If an output is not one of `Outputs`.
+    """
+    names = [n.strip() for n in os.environ.get("ISLAMICART_OUTPUTS", "").split(",") if n.strip()]
+    unknown = [n for n in names if n not in Outputs]
+    if unknown:
+        raise ValueError(f"Unknown outputs {', '.join(unknown)}, use any of {', '.join(Outputs)}.")
+    return [Outputs[n] for n in names]
+
+# ******************************************************************************
+def enabled() -> bool:
+    """Check whether scenes render to several outputs at once, see `selected`.
+
+    `render.py --outputs` sets them. GIF and PNG output are never split.
+    """
+    if config.movie_file_extension not in (".mp4", ".mov", ".webm") or config.format in ("gif", "png"):
+        return False
+    return bool(selected())
+
+# ******************************************************************************
+def configure(planeSize: float) -> dict[str, float]:
+    """Frame the camera to cover every selected output at the finest resolution any of them needs.
+
+    The frame is centered on the plane, as the framings are, and stays at the
+    same scale, so each output is a crop of it, scaled down. The quality level
+    only sets the frame rate.
+
+    Args:
+        planeSize (float): The height of the scenes' plane in scene units.
+
+    Returns:
+        dict[str, float]: The pixel and frame sizes it replaced, to be restored
+            with `config.update` after the render.
+    """
+    global _planeSize
+    _planeSize = planeSize
+    previous = {name: config[name] for name in ("pixel_width", "pixel_height", "frame_width", "frame_height")}
+    regions = [(o, *o.region(planeSize)) for o in selected()]
+    density = max(o.size[1] / height for o, _, _, height in regions)  # pixels per unit
+    halfWidth = max(width / 2 for _, _, width, _ in regions)
+    halfHeight = max(abs(center) + height / 2 for _, center, _, height in regions)
+    config.pixel_width = 2 * math.ceil(halfWidth * density)
+    config.pixel_height = 2 * math.ceil(halfHeight * density)
+    config.frame_width = config.pixel_width / density
+    config.frame_height = config.pixel_height / density
+    return previous
+
+# ==============================================================================
+class OutputSink(streaming.MovieSink):
+    """Encodes a crop of the frames, scaled to the output's size.
+
+    Each distinct frame is scaled once, however often it is repeated.
+    """
+    def __init__(self, path: Path, output: Output):
+        super().__init__(path, output.size)
+        center, width, height = output.region(_planeSize)
+        density = config.pixel_height / config.frame_height
+        left = round((config.frame_width - width) / 2 * density)
+        top = round((config.frame_height / 2 - center - height / 2) * density)
+        self.rows = slice(top, top + round(height * density))
+        self.columns = slice(left, left + round(width * density))
+
+    def write(self, frame: NDArray[np.uint8], count: int) -> None:
+        crop = av.VideoFrame.from_ndarray(np.ascontiguousarray(frame[self.rows, self.columns]), format="rgba")
+        scaled = crop.reformat(width=self.stream.width, height=self.stream.height, interpolation="AREA").to_ndarray()
+        for _ in range(count):
+            self.encode(av.VideoFrame.from_ndarray(scaled, format="rgba"))
+
+# ==============================================================================
+class FanOutSink:
+    """Feeds every frame to several sinks, each encoding on its own thread.
+
+    Each sink has a queue of at most `streaming.StreamBuffer` frames, so the
+    encoders run in parallel and the slowest one paces the render.
+    """
+    def __init__(self, sinks: list[streaming.MovieSink]):
+        self.sinks = sinks
+        self.errors: list[BaseException] = []
+        self.queues: list[Queue] = [Queue(maxsize=streaming.StreamBuffer) for _ in sinks]
+        self.threads = [Thread(target=self.drain, args=(sink, queue), daemon=True)
+                        for sink, queue in zip(sinks, self.queues)]
+        for thread in self.threads:
+            thread.start()
+
+    def drain(self, sink: streaming.MovieSink, queue: Queue) -> None:
+        while True:
+            count, frame = queue.get()
+            if frame is None:
+                break
+            if not self.errors:
+                try:
+                    sink.write(frame, count)
+                except BaseException as error:
+                    self.errors.append(error)
+
+    def write(self, frame: NDArray[np.uint8], count: int) -> None:
+        if self.errors:
+            raise self.errors[0]
+        for queue in self.queues:
+            queue.put((count, frame))
+
+    def join(self) -> None:
+        for queue in self.queues:
+            queue.put((-1, None))
+        for thread in self.threads:
+            thread.join()
+
+    def close(self) -> None:
+        self.join()
+        if self.errors:
+            self.abort()
+            raise self.errors[0]
+        for sink in self.sinks:
+            sink.close()
+
+    def abort(self) -> None:
+        self.join()
+        for sink in self.sinks:
+            sink.abort()
+
+# ==============================================================================
+class MultiOutputFileWriter(streaming.StreamingFileWriter):
+    """Streaming file writer encoding every selected output from the same frames.
+
+    The scene is rasterized once, framed by `configure`, and each output gets
+    its crop, scaled down, as `{scene}_{output}` next to the scene's movie.
+    """
+    def createSink(self) -> FanOutSink:
+        movie = Path(self.movie_file_path)
+        self.outputPaths = [movie.with_name(f"{movie.stem}_{o.name}{movie.suffix}") for o in selected()]
+        return FanOutSink([OutputSink(path, o) for path, o in zip(self.outputPaths, selected())])
+
+    def reportOutput(self) -> None:
+        for path in self.outputPaths:
+            self.print_file_ready_message(str(path))
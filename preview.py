@@ -0,0 +1,94 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import math
+import os
+
+import cairo
+from manim import Camera, ParsableManimColor, Rectangle, TexTemplate, VMobject, config
+from manim.mobject.types.image_mobject import AbstractImageMobject
+
+import texcache
+
+# ******************************************************************************
+PreviewFrameRate: int = 10
+PreviewStrokeWidth: float = 1.0
+
+# TeX font sizes in points, of the size commands of the standard classes
+_FontSizes: dict[str, float] = {
+    "tiny": 5.0, "small": 9.0, "normalsize": 10.0, "large": 12.0,
+    "Large": 14.4, "LARGE": 17.28, "huge": 20.74, "Huge": 24.88,
+}
+# scene units per TeX point, of `Tex` at its default font size
+_UnitsPerPoint: float = 0.045
+
+# ******************************************************************************
+def enabled() -> bool:
+    """Check whether scenes render as wireframe previews.
+
+    Previews are enabled by setting the `ISLAMICART_PREVIEW` environment
+    variable to "1", or with `render.py --preview`.
+    """
+    return os.environ.get("ISLAMICART_PREVIEW", "") == "1"
+
+# ******************************************************************************
+def configure() -> None:
+    """Lower the frame rate for previews; animations keep their run times."""
+    config.frame_rate = PreviewFrameRate
+
+# ==============================================================================
+class WireframeCamera(Camera):
+    """Camera drawing every VMobject as a thin outline, and no images.
+
+    Fills are outlined in their own color instead, so filled shapes such as
+    dots and glyphs keep their place on screen.
+    """
+    def display_vectorized(self, vmobject: VMobject, ctx: cairo.Context):
+        self.set_cairo_context_path(ctx, vmobject)
+        if vmobject.get_stroke_width() > 0 and vmobject.get_stroke_opacity() > 0:
+            rgbas = self.get_stroke_rgbas(vmobject)
+        else:
+            rgbas = self.get_fill_rgbas(vmobject)
+        self.set_cairo_context_color(ctx, rgbas, vmobject)
+        ctx.set_line_width(PreviewStrokeWidth * self.cairo_line_width_multiple)
+        ctx.stroke()
+        return self
+
+    def display_image_mobject(self, image_mobject: AbstractImageMobject, pixel_array):
+        pass
+
+# ******************************************************************************
+def textBox(texString: str, *, tex_template: TexTemplate, color: ParsableManimColor,
+            characters: int, fontSize: str = "normalsize", width: float = 170) -> VMobject:
+    """Create a placeholder box taking the place of a wrapped text.
+
+    The box has the size of the typeset text when it is in the TeX cache, and
+    is estimated from the font size, the number of characters and the wrapping
+    width otherwise, so no LaTeX is run.
+
+    Args:
+        texString (str): The TeX string the text would be typeset from.
+        tex_template (TexTemplate): The template it would be typeset with.
+        color (ParsableManimColor): The color of the text.
+        characters (int): The length of the text.
+        fontSize (str, optional): The TeX size command of the text. Default is "normalsize".
+        width (float, optional): The wrapping width in points. Default is 170.
+
+    Returns:
+        VMobject: A rectangle where the text would be.
+    """
+    bounds = texcache.cachedBounds(texString, tex_template=tex_template, color=color)
+    if bounds is not None:
+        (left, bottom, _), (right, top, _) = bounds
+        box = Rectangle(width=max(right - left, 0.01), height=max(top - bottom, 0.01), color=color)
+        return box.move_to(((left + right) / 2, (bottom + top) / 2, 0))
+    size = _FontSizes[fontSize]
+    lineWidth = characters * 0.5 * size
+    lines = max(1, math.ceil(lineWidth / width))
+    return Rectangle(width=min(lineWidth, width) * _UnitsPerPoint,
+                     height=lines * 1.2 * size * _UnitsPerPoint, color=color)
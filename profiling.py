@@ -0,0 +1,269 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import argparse
+import contextlib
+import functools
+import json
+import os
+import resource
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from manim import Scene, Tex, Text, config
+
+import texcache
+
+# ******************************************************************************
+active: "Profiler | None" = None  # profiler of the scene being rendered, if any
+
+# ==============================================================================
+class Profiler:
+    """Timeline of a scene render, written as a Chrome trace.
+
+    Spans are opened and closed around the construction, each step and each
+    `play`, `wait` and traced function. Every span records its wall and CPU
+    time, the frames written and the mobjects and points on screen when it
+    ends. It also records the peak resident memory of the process so far,
+    `processPeakRssMB`; being a high-water mark, it only shows the spans that
+    raised it. For the peak of each step on its own, trace the allocations.
+    Time spent rasterizing frames, queueing them for encoding, building TeX
+    and laying out Pango text is summed into every open span.
+
+    Args:
+        scene (Scene): The scene being rendered.
+        directory (Path): Where to write the trace.
+        traceMemory (bool, optional): If True, also trace Python allocations,
+            recording the peak of each step as `peakTracedMB`. Default is False.
+    """
+    def __init__(self, scene: Scene, directory: str | Path, traceMemory: bool = False):
+        self.scene = scene
+        self.directory = Path(directory)
+        self.traceMemory = traceMemory
+        self.origin = time.perf_counter()
+        self.frames = 0
+        self.events: list[dict] = []
+        self.stack: list[dict] = []
+        self.patches: list[tuple[object, str, Any]] = []
+
+    def begin(self, name: str, category: str) -> None:
+        """Open a span, nested in the spans already open."""
+        if self.traceMemory and category == "step":
+            tracemalloc.reset_peak()
+        self.stack.append({"name": name, "cat": category, "wall": time.perf_counter(),
+                           "cpu": time.process_time(), "frames": self.frames, "totals": {}})
+
+    def end(self) -> None:
+        """Close the innermost open span, recording it."""
+        span = self.stack.pop()
+        wall = time.perf_counter()
+        family = [m for top in self.scene.mobjects for m in top.get_family()]
+        args = {
+            "cpu": time.process_time() - span["cpu"],
+            "frames": self.frames - span["frames"],
+            "mobjects": len(family),
+            "points": sum(len(m.points) for m in family),
+            "processPeakRssMB": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            **{f"{name}Time": seconds for name, (seconds, _) in span["totals"].items()},
+            **{f"{name}Calls": calls for name, (_, calls) in span["totals"].items()},
+        }
+        if self.traceMemory and span["cat"] == "step":
+            args["peakTracedMB"] = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        self.events.append({"name": span["name"], "cat": span["cat"], "ph": "X", "pid": os.getpid(), "tid": 0,
+                            "ts": (span["wall"] - self.origin) * 1e6, "dur": (wall - span["wall"]) * 1e6,
+                            "args": args})
+
+    def endCategory(self, category: str) -> None:
+        """Close the open spans down to and including the innermost one of a category."""
+        if any(span["cat"] == category for span in self.stack):
+            while self.stack[-1]["cat"] != category:
+                self.end()
+            self.end()
+
+    def call(self, name: str, category: str, func: Callable, *args, **kwargs):
+        """Call a function inside a span."""
+        self.begin(name, category)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.end()
+
+    def accumulate(self, owner: object, attr: str, name: str) -> None:
+        """Sum the time spent in a method into the open spans, until the profiler is closed.
+
+        Nested calls of the same method are only counted once.
+        """
+        original = getattr(owner, attr)
+        depth = [0]
+
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            if depth[0]:
+                return original(*args, **kwargs)
+            depth[0] += 1
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                depth[0] -= 1
+                elapsed = time.perf_counter() - start
+                for span in self.stack:
+                    seconds, calls = span["totals"].get(name, (0.0, 0))
+                    span["totals"][name] = (seconds + elapsed, calls + 1)
+
+        self.patches.append((owner, attr, owner.__dict__.get(attr)))
+        setattr(owner, attr, wrapper)
+
+    def countFrames(self, frames: int) -> None:
+        self.frames += frames
+
+    def close(self) -> Path:
+        """Close all open spans, undo the patches and write the trace.
+
+        Returns:
+            Path: The trace file.
+        """
+        while self.stack:
+            self.end()
+        for owner, attr, original in reversed(self.patches):
+            if original is None:
+                delattr(owner, attr)
+            else:
+                setattr(owner, attr, original)
+        self.patches.clear()
+        if self.traceMemory:
+            tracemalloc.stop()
+
+        # split renders write one movie, and one trace, per section
+        name = Path(config.output_file).stem if config.output_file else type(self.scene).__name__
+        path = self.directory / f"{name}.trace.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": sorted(self.events, key=lambda e: e["ts"]),
+                                    "displayTimeUnit": "ms",
+                                    "otherData": {"scene": type(self.scene).__name__,
+                                                  "quality": config.quality,
+                                                  "frameRate": config.frame_rate}}),
+                        encoding="utf-8")
+        return path
+
+# ******************************************************************************
+def start(scene: Scene) -> Profiler | None:
+    """Start profiling a scene render, if asked to by the environment.
+
+    Profiling is enabled by the `ISLAMICART_PROFILE` environment variable,
+    either "1" to write the traces in "profiles" in the media directory, or
+    the directory to write them in. Setting `ISLAMICART_PROFILE_MEMORY` to "1"
+    also traces Python allocations, at a considerable cost.
+
+    Args:
+        scene (Scene): The scene about to be constructed.
+
+    Returns:
+        Profiler | None: The active profiler, or None if profiling is disabled.
+    """
+    global active
+    setting = os.environ.get("ISLAMICART_PROFILE", "")
+    if setting in ("", "0") or config.dry_run:
+        return None
+    directory = Path(config.media_dir) / "profiles" if setting == "1" else Path(setting)
+    traceMemory = os.environ.get("ISLAMICART_PROFILE_MEMORY", "") == "1"
+    if traceMemory:
+        tracemalloc.start()
+
+    profiler = active = Profiler(scene, directory, traceMemory)
+    renderer = scene.renderer
+    profiler.accumulate(renderer, "update_frame", "rasterize")
+    profiler.accumulate(renderer.file_writer, "write_frame", "encode")
+    profiler.accumulate(Tex, "__init__", "tex")
+    profiler.accumulate(texcache.CachedTex, "__init__", "tex")
+    profiler.accumulate(Text, "__init__", "text")
+    addFrame = renderer.add_frame
+
+    def countedAddFrame(frame, num_frames: int = 1):
+        profiler.countFrames(num_frames)
+        return addFrame(frame, num_frames)
+    profiler.patches.append((renderer, "add_frame", None))
+    renderer.add_frame = countedAddFrame
+    return profiler
+
+# ******************************************************************************
+def finish(profiler: Profiler | None) -> Path | None:
+    """Stop profiling and write the trace, if profiling."""
+    global active
+    if profiler is None:
+        return None
+    if active is profiler:
+        active = None
+    return profiler.close()
+
+# ******************************************************************************
+@contextlib.contextmanager
+def collapsed(profiler: Profiler | None, name: str, category: str):
+    """Record a block as one span, without the traced calls inside it.
+
+    For work that constructs another scene, such as collecting the TeX of the
+    scene, whose instructions would otherwise be recorded as this scene's.
+    Does nothing when not profiling.
+    """
+    global active
+    if profiler is None:
+        yield
+        return
+    previous, active = active, None
+    profiler.begin(name, category)
+    try:
+        yield
+    finally:
+        profiler.end()
+        active = previous
+
+# ******************************************************************************
+def traced(category: str) -> Callable[[Callable], Callable]:
+    """Record every call of a function as a span while a scene is being profiled.
+
+    When nothing is profiled, the call costs one extra global lookup.
+    """
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if active is None:
+                return func(*args, **kwargs)
+            return active.call(func.__name__, category, func, *args, **kwargs)
+        return wrapper
+    return decorate
+
+# ******************************************************************************
+def summarize(path: str | Path) -> str:
+    """Tabulate the steps of a trace, with the time spent in each part of the pipeline.
+
+    The "peak rss" column is the process high-water mark when each step ended,
+    "traced" the peak of the step's own allocations, when they were traced.
+    """
+    trace = json.loads(Path(path).read_text(encoding="utf-8"))
+    rows = [f"{'step':<12} {'wall':>8} {'cpu':>8} {'frames':>7} {'raster':>8} {'encode':>8} "
+            f"{'tex':>8} {'text':>8} {'mobjects':>9} {'points':>9} {'peak rss':>9} {'traced':>8}"]
+    for event in trace["traceEvents"]:
+        if event["cat"] not in ("step", "setup"):
+            continue
+        a = event["args"]
+        tracedPeak = f"{a['peakTracedMB']:8.1f}" if "peakTracedMB" in a else f"{'-':>8}"
+        rows.append(f"{event['name']:<12} {event['dur'] / 1e6:8.2f} {a['cpu']:8.2f} {a['frames']:7d} "
+                    f"{a.get('rasterizeTime', 0):8.2f} {a.get('encodeTime', 0):8.2f} "
+                    f"{a.get('texTime', 0):8.2f} {a.get('textTime', 0):8.2f} "
+                    f"{a['mobjects']:9d} {a['points']:9d} {a['processPeakRssMB']:9.0f} {tracedPeak}")
+    return "\n".join(rows)
+
+# ******************************************************************************
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize the steps of scene profiles.")
+    parser.add_argument("traces", nargs="+", type=Path, help="trace files written while profiling")
+    args = parser.parse_args()
+    for trace in args.traces:
+        print(f"{trace.name}\n{summarize(trace)}\n")
@@ -0,0 +1,125 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import functools
+
+import numpy as np
+from manim import (DEFAULT_DOT_RADIUS, ORIGIN, WHITE, Circle, Dot, ManimColor, NumberPlane, ParsableManimColor,
+                   Text, VGroup, VMobject)
+from numpy.typing import NDArray
+
+# ******************************************************************************
+# The mobjects every scene builds the same way are built once per process and
+# configuration, and each scene gets a copy. Copying a mobject is a deep copy of
+# its arrays, far cheaper than building a `NumberPlane` line by line or laying
+# out a `Text` with Pango. The render workers fill the pool before their first
+# scene, or inherit it filled when forked, see `render.py`.
+
+# ******************************************************************************
+def _colorKey(color: ParsableManimColor | None) -> str | None:
+    """Get a hashable key of a color, the same for every way of writing it."""
+    return None if color is None else ManimColor(color).to_hex(with_alpha=True)
+
+# ******************************************************************************
+@functools.lru_cache(maxsize=16)
+def _numberPlane(xRange: tuple[float, ...], yRange: tuple[float, ...], color: str | None,
+                 lineOpacity: float) -> NumberPlane:
+    if color is None:
+        return NumberPlane(x_range=xRange, y_range=yRange)
+    return NumberPlane(
+        x_range=xRange, y_range=yRange,
+        axis_config={'stroke_color': color},
+        background_line_style={
+            "stroke_color": color,
+            "stroke_opacity": lineOpacity
+        })
+
+# ******************************************************************************
+def numberPlane(xRange: tuple[float, ...], yRange: tuple[float, ...], color: ParsableManimColor | None = None,
+                lineOpacity: float = 1.0) -> NumberPlane:
+    """Get a `NumberPlane`, optionally with its axes and background lines in one color.
+
+    Args:
+        xRange (tuple[float, ...]): The `x_range` of the plane.
+        yRange (tuple[float, ...]): The `y_range` of the plane.
+        color (ParsableManimColor, optional): The color of the axes and the
+            background lines. Default is manim's style for both.
+        lineOpacity (float, optional): The opacity of the background lines,
+            if a color is given. Default is 1.
+
+    Returns:
+        NumberPlane: A copy of the plane built for these arguments.
+    """
+    return _numberPlane(tuple(xRange), tuple(yRange), _colorKey(color), lineOpacity).copy()
+
+# ******************************************************************************
+@functools.lru_cache(maxsize=32)
+def _dot(color: str, radius: float) -> Dot:
+    return Dot(radius=radius, color=color)
+
+# ******************************************************************************
+def dot(point: NDArray[np.float64] = ORIGIN, color: ParsableManimColor = WHITE,
+        radius: float = DEFAULT_DOT_RADIUS) -> Dot:
+    """Get a `Dot` of the given color and radius, centered at a point."""
+    return _dot(_colorKey(color), radius).copy().move_to(point)
+
+# ******************************************************************************
+@functools.lru_cache(maxsize=32)
+def _circle(radius: float, color: str) -> Circle:
+    return Circle(radius=radius, color=color)
+
+# ******************************************************************************
+def circle(radius: float, color: ParsableManimColor, center: NDArray[np.float64] = ORIGIN) -> Circle:
+    """Get a `Circle` of the given radius and color, centered at a point."""
+    return _circle(radius, _colorKey(color)).copy().move_to(center)
+
+# ******************************************************************************
+@functools.lru_cache(maxsize=1024)
+def glyphOutline(text: str, fontSize: float, font: str = "") -> tuple[NDArray[np.float64], float, float]:
+    """Get the outline of a text as a single path, laid out by Pango only the first time.
+
+    Args:
+        text (str): The text.
+        fontSize (float): The font size.
+        font (str, optional): The font family. Default is manim's.
+
+    Returns:
+        tuple: The read only control points of all the glyphs, centered at the
+            origin, and the width and height of the text.
+    """
+    glyphs = Text(text, font_size=fontSize, font=font)
+    outlines = [m.points for m in glyphs.family_members_with_points()]
+    points = np.concatenate(outlines) if outlines else np.zeros((0, 3))
+    if len(points):
+        points = points - (points.min(axis=0) + points.max(axis=0)) / 2
+    points.setflags(write=False)
+    return points, glyphs.width, glyphs.height
+
+# ******************************************************************************
+def glyphs(text: str, color: ParsableManimColor, fontSize: float,
+           point: NDArray[np.float64] = ORIGIN) -> VMobject:
+    """Get a text as one filled path, centered at a point, looking as a `Text` would."""
+    points, _, _ = glyphOutline(text, fontSize)
+    path = VMobject(fill_color=color, fill_opacity=1.0, stroke_width=0)
+    if len(points):
+        path.set_points(points + point)
+    return path
+
+# ******************************************************************************
+def labeledDot(label: str, point: NDArray[np.float64], *, color: ParsableManimColor,
+               fill_color: ParsableManimColor, font_size: float) -> VGroup:
+    """Get a dot with a label, looking as a `LabeledDot` with a `Text` label would.
+
+    The dot is sized to the label as `LabeledDot` sizes it.
+
+    Returns:
+        VGroup: The dot and the glyphs of the label.
+    """
+    _, width, height = glyphOutline(label, font_size)
+    return VGroup(dot(point, fill_color, radius=0.1 + max(width, height) / 2),
+                  glyphs(label, color, font_size, point))
@@ -0,0 +1,393 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from fractions import Fraction
+from pathlib import Path
+from types import ModuleType
+
+import av
+import numpy as np
+from manim import QUALITIES, Scene, config, tempconfig
+
+import preview
+import sectioncache
+import texcache
+
+# ******************************************************************************
+QualityFlags: dict[str, str] = {q["flag"]: name for name, q in QUALITIES.items() if q["flag"]}
+
+# ******************************************************************************
+def sceneClasses(module: ModuleType) -> list[type[Scene]]:
+    """Get the renderable scenes defined in a module, in definition order.
+
+    Base classes that do not define a `construct` of their own are left out.
+
+    Args:
+        module (ModuleType): The module holding the scenes.
+
+    Returns:
+        list[type[Scene]]: The scene classes.
+    """
+    return [obj for obj in vars(module).values()
+            if isinstance(obj, type) and issubclass(obj, Scene)
+            and obj.__module__ == module.__name__
+            and obj.construct is not Scene.construct]
+
+# ******************************************************************************
+def applyQuality(quality: str) -> None:
+    """Set the frame rate and resolution of a quality level, keeping the module's aspect ratio.
+
+    The scenes fix their own `config.frame_size`; the quality level then sets
+    the length of its shorter side, as `manim -q` does for landscape output.
+    Previews keep their own lower frame rate.
+
+    Args:
+        quality (str): A quality name, e.g. "low_quality", or its flag, e.g. "l".
+    """
+    quality = QualityFlags.get(quality, quality)
+    width, height = config.frame_size
+    config.quality = quality
+    scale = min(config.frame_size) / min(width, height)
+    config.frame_size = (2 * round(width * scale / 2), 2 * round(height * scale / 2))
+    if preview.enabled():
+        preview.configure()
+
+# ******************************************************************************
+def buildPrototypes(moduleName: str) -> None:
+    """Build the prototypes of a module, if it has any, see `prototypes`.
+
+    Runs as the initializer of every worker. Workers forked from a parent
+    that built them already start with the pool filled; spawned ones, the
+    default on macOS and Windows, build it once here for all their scenes.
+    """
+    module = importlib.import_module(moduleName)
+    if hasattr(module, "buildPrototypes"):
+        module.buildPrototypes()
+
+# ******************************************************************************
+def workerPool(moduleName: str, workers: int) -> ProcessPoolExecutor:
+    """Start a pool of render workers, each with the prototypes of a module built."""
+    if multiprocessing.get_start_method() == "fork":
+        buildPrototypes(moduleName)  # built once, the forked workers inherit the pool
+    return ProcessPoolExecutor(max_workers=workers, initializer=buildPrototypes, initargs=(moduleName,))
+
+# ******************************************************************************
+def renderScene(moduleName: str, sceneName: str, quality: str,
+                options: dict | None = None, sections: list[int] | None = None) -> dict:
+    """Render a single scene of a module, timing it.
+
+    Args:
+        moduleName (str): The module holding the scene.
+        sceneName (str): The name of the scene class.
+        quality (str): The quality name or flag.
+        options (dict, optional): Further manim config options for the render.
+        sections (list[int], optional): Indices of the sections to render, for
+            scenes with a `RENDER_SECTIONS` setting. Default is all of them.
+
+    Returns:
+        dict: The scene name, wall and CPU time in seconds, rendered output or error.
+    """
+    wall, cpu = time.perf_counter(), time.process_time()
+    result: dict = {"scene": sceneName, "pid": os.getpid()}
+    if sections is not None:
+        result["sections"] = sections
+    try:
+        module = importlib.import_module(moduleName)
+        sceneClass = getattr(module, sceneName)
+        with tempconfig({"input_file": module.__file__, **(options or {})}):
+            applyQuality(quality)
+            if sections is not None:
+                sceneClass.RENDER_SECTIONS = set(sections)
+            try:
+                scene = sceneClass()
+                scene.render()
+            finally:
+                if sections is not None:
+                    del sceneClass.RENDER_SECTIONS
+            result["output"] = str(scene.renderer.file_writer.movie_file_path)
+            if hasattr(scene.renderer.file_writer, "outputPaths"):
+                result["outputs"] = [str(p) for p in scene.renderer.file_writer.outputPaths]
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+        result["traceback"] = traceback.format_exc()
+    result["wall"] = time.perf_counter() - wall
+    result["cpu"] = time.process_time() - cpu
+    return result
+
+# ******************************************************************************
+def renderAll(moduleName: str = "npointstars", scenes: list[str] | None = None,
+              workers: int | None = None, quality: str = "l",
+              options: dict | None = None) -> dict:
+    """Render the scenes of a module across a pool of worker processes.
+
+    The workers share the TeX cache, whose directory is passed on through the
+    `ISLAMICART_TEX_CACHE` environment variable, and the manim media directory.
+    Each worker imports manim and the module once, for all the scenes it renders,
+    and builds the module's prototypes, see `prototypes`, before the first.
+
+    Args:
+        moduleName (str, optional): The module holding the scenes. Default is "npointstars".
+        scenes (list[str], optional): Names of the scenes to render. Default is all of them.
+        workers (int, optional): Number of worker processes. Default is the number of CPUs.
+        quality (str, optional): The quality name or flag. Default is "l".
+        options (dict, optional): Further manim config options for the renders.
+
+    Returns:
+        dict: Summary with the total wall time and the timing of each scene.
+    """
+    os.environ["ISLAMICART_TEX_CACHE"] = str(texcache.texCache.directory)
+
+    module = importlib.import_module(moduleName)
+    names = scenes or [s.__name__ for s in sceneClasses(module)]
+    workers = min(workers or os.cpu_count() or 1, len(names)) or 1
+
+    start = time.perf_counter()
+    results: dict[str, dict] = {}
+    with workerPool(moduleName, workers) as pool:
+        futures = [pool.submit(renderScene, moduleName, name, quality, options) for name in names]
+        for future in as_completed(futures):
+            result = future.result()
+            results[result["scene"]] = result
+            status = "failed" if "error" in result else "done"
+            print(f"{result['scene']}: {status} in {result['wall']:.1f}s", file=sys.stderr)
+    total = time.perf_counter() - start
+
+    sceneTime = sum(r["wall"] for r in results.values())
+    return {
+        "module": moduleName,
+        "quality": QualityFlags.get(quality, quality),
+        "workers": workers,
+        "wall": total,
+        "sceneTime": sceneTime,
+        "speedup": sceneTime / total if total else 0.0,
+        "scenes": [results[name] for name in names],
+    }
+
+# ******************************************************************************
+def joinMovies(inputs: list[str | Path], output: str | Path) -> None:
+    """Join movies end to end without re-encoding them.
+
+    The timestamps of each movie are shifted to start where the movie before
+    it ends, both presentation and decode times, so frames the encoder
+    reorders, such as x264's B-frames, keep their order across the joins.
+
+    Args:
+        inputs (list[Path]): The movies to join, in order. They must share codec and format.
+        output (Path): The joined movie.
+
+    Raises:
+        ValueError: If the decode times of the joined movie would not increase,
+            as when the movies reorder frames differently.
+    """
+    with av.open(str(output), mode="w") as target:
+        targetStream = None
+        offset = Fraction(0)  # seconds
+        lastDts: Fraction | None = None
+        for path in inputs:
+            with av.open(str(path)) as source:
+                sourceStream = source.streams.video[0]
+                if targetStream is None:
+                    targetStream = target.add_stream(template=sourceStream)
+                timeBase = sourceStream.time_base
+                shift = round(offset / timeBase) - (sourceStream.start_time or 0)
+                end = offset
+                for packet in source.demux(sourceStream):
+                    if packet.dts is None:
+                        continue
+                    packet.dts += shift
+                    packet.pts = packet.dts if packet.pts is None else packet.pts + shift
+                    if lastDts is not None and packet.dts * timeBase <= lastDts:
+                        raise ValueError(f"Cannot join {path} without re-encoding, its decode times "
+                                         f"overlap the movie before it.")
+                    lastDts = packet.dts * timeBase
+                    end = max(end, (packet.pts + packet.duration) * timeBase)
+                    packet.stream = targetStream
+                    target.mux(packet)
+                offset = end
+
+# ******************************************************************************
+def compareMovies(first: str | Path, second: str | Path) -> int | None:
+    """Compare two movies frame by frame.
+
+    Args:
+        first (Path): A movie.
+        second (Path): The movie to compare it with.
+
+    Returns:
+        int | None: Index of the first frame that differs, or where one movie
+            ends before the other; None if the movies match frame for frame.
+    """
+    with av.open(str(first)) as a, av.open(str(second)) as b:
+        framesA, framesB = a.decode(video=0), b.decode(video=0)
+        index = 0
+        while True:
+            frameA, frameB = next(framesA, None), next(framesB, None)
+            if frameA is None and frameB is None:
+                return None
+            if frameA is None or frameB is None:
+                return index
+            if not np.array_equal(frameA.to_ndarray(), frameB.to_ndarray()):
+                return index
+            index += 1
+
+# ******************************************************************************
+def renderSegments(moduleName: str, sceneName: str, workers: int | None = None,
+                   quality: str = "l", verify: bool = False, incremental: bool = False,
+                   options: dict | None = None) -> dict:
+    """Render a scene split at its sections, rendering the sections in parallel.
+
+    Each worker renders the scene with only one section enabled: the
+    animations before it are skipped, which rebuilds the starting state of the
+    section deterministically, and the scene ends after it. The section movies
+    are kept in a `sectioncache.SectionStore` under their section keys, and
+    joined without re-encoding into the scene's movie.
+
+    Args:
+        moduleName (str): The module holding the scene.
+        sceneName (str): The name of the scene class, a `StarScene`.
+        workers (int, optional): Number of worker processes. Default is the number of CPUs.
+        quality (str, optional): The quality name or flag. Default is "l".
+        verify (bool, optional): If True, also render the scene serially, without
+            caching, and check that the joined movie matches it frame for frame.
+        incremental (bool, optional): If True, only render the sections whose
+            key is not in the section store yet. Default is False.
+        options (dict, optional): Further manim config options for the renders.
+
+    Returns:
+        dict: Summary with the total wall time and the timing of each section.
+    """
+    os.environ["ISLAMICART_TEX_CACHE"] = str(texcache.texCache.directory)
+    options = options or {}
+    module = importlib.import_module(moduleName)
+    start = time.perf_counter()
+    with tempconfig({"input_file": module.__file__, **options}):
+        applyQuality(quality)
+        store = sectioncache.SectionStore()
+        sections = sectioncache.sectionKeys(getattr(module, sceneName))
+        output = (config.get_dir("video_dir", module_name=Path(module.__file__).stem, scene_name=sceneName)
+                  / f"{sceneName}{config.movie_file_extension}")
+    pending = [i for i, (_, key) in enumerate(sections) if not (incremental and store.has(key))]
+    workers = min(workers or os.cpu_count() or 1, len(pending)) or 1
+
+    results: dict[int, dict] = {}
+    if pending:
+        with workerPool(moduleName, workers) as pool:
+            futures = {i: pool.submit(renderScene, moduleName, sceneName, quality,
+                                      {**options, "output_file": f"{sceneName}_{i:02d}"}, [i])
+                       for i in pending}
+            results = {i: future.result() for i, future in futures.items()}
+    summary: dict = {
+        "module": moduleName,
+        "scene": sceneName,
+        "quality": QualityFlags.get(quality, quality),
+        "workers": workers,
+        "sections": [{"name": name, "key": key, "cached": i not in results, **results.get(i, {})}
+                     for i, (name, key) in enumerate(sections)],
+    }
+    failed = [r for r in results.values() if "error" in r]
+    if failed:
+        summary["error"] = failed[0]["error"]
+        summary["wall"] = time.perf_counter() - start
+        return summary
+
+    for i, result in results.items():
+        store.store(sections[i][1], result["output"])
+    output.parent.mkdir(parents=True, exist_ok=True)
+    joinMovies([store.path(key) for _, key in sections], output)
+    summary["output"] = str(output)
+    summary["wall"] = time.perf_counter() - start
+    summary["sceneTime"] = sum(r["wall"] for r in results.values())
+
+    if verify:
+        serial = renderScene(moduleName, sceneName, quality,
+                             {**options, "output_file": f"{sceneName}_serial", "disable_caching": True})
+        summary["serialWall"] = serial["wall"]
+        if "error" in serial:
+            summary["error"] = serial["error"]
+        else:
+            mismatch = compareMovies(output, serial["output"])
+            summary["matchesSerial"] = mismatch is None
+            if mismatch is not None:
+                summary["error"] = f"Joined movie differs from the serial render at frame {mismatch}"
+            Path(serial["output"]).unlink(missing_ok=True)
+    return summary
+
+# ******************************************************************************
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render all the scenes of a module in parallel.")
+    parser.add_argument("module", nargs="?", default="npointstars", help="module holding the scenes")
+    parser.add_argument("-s", "--scenes", nargs="+", help="scenes to render, default is all")
+    parser.add_argument("-j", "--workers", type=int, help="worker processes, default is the number of CPUs")
+    parser.add_argument("-q", "--quality", default="l", choices=[*QualityFlags, *QualityFlags.values()],
+                        help="render quality, default is l")
+    parser.add_argument("--split-steps", action="store_true",
+                        help="render each scene split at its steps, the steps in parallel")
+    parser.add_argument("--verify", action="store_true",
+                        help="with --split-steps, check the joined movie against a serial render")
+    parser.add_argument("--incremental", action="store_true",
+                        help="with --split-steps, only render the steps that changed since the last render")
+    parser.add_argument("--preview", action="store_true",
+                        help="render wireframe previews, with boxes for texts, at a lower frame rate")
+    parser.add_argument("--profile", nargs="?", const="1", metavar="DIR",
+                        help="write a timeline of each render, in DIR or the media directory's profiles")
+    parser.add_argument("--stream", nargs="?", const="1", metavar="PIPE",
+                        help="encode each movie in one pass without partial movie files, or write raw RGBA "
+                             "frames to the named pipe PIPE, rendering a single scene")
+    parser.add_argument("--outputs", nargs="+", metavar="OUTPUT",
+                        help="rasterize each scene once and encode these outputs from it, "
+                             "e.g. portrait square landscape; see outputs.Outputs")
+    parser.add_argument("--summary", type=Path, help="summary JSON file, default is render_summary.json in the media directory")
+    args = parser.parse_args()
+    if args.preview:
+        os.environ["ISLAMICART_PREVIEW"] = "1"
+    if args.profile is not None:
+        os.environ["ISLAMICART_PROFILE"] = args.profile
+    if args.stream is not None:
+        # frames from several scenes or workers would interleave in one pipe
+        if args.stream not in ("0", "1") and (args.split_steps or len(args.scenes or []) != 1 or args.workers != 1):
+            parser.error("--stream PIPE renders a single scene: select one with -s and -j 1, without --split-steps")
+        os.environ["ISLAMICART_STREAM"] = args.stream
+    if args.outputs:
+        os.environ["ISLAMICART_OUTPUTS"] = ",".join(args.outputs)
+        if args.split_steps:
+            parser.error("--outputs cannot be combined with --split-steps")
+
+    if args.split_steps:
+        module = importlib.import_module(args.module)
+        results = [renderSegments(args.module, name, args.workers, args.quality, args.verify, args.incremental)
+                   for name in args.scenes or [s.__name__ for s in sceneClasses(module)]]
+        summaryFile = args.summary or Path(config.media_dir) / "render_summary.json"
+        summaryFile.parent.mkdir(parents=True, exist_ok=True)
+        summaryFile.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        for r in results:
+            check = {True: ", matches serial render", False: ""}.get(r.get("matchesSerial"), "")
+            rendered = sum(not s["cached"] for s in r["sections"])
+            print(f"{r['scene']:<24} {r['wall']:8.1f}s wall, {rendered} of {len(r['sections'])} sections "
+                  f"rendered on {r['workers']} workers{check}  {r.get('error', r.get('output', ''))}")
+        sys.exit(1 if any("error" in r for r in results) else 0)
+
+    summary = renderAll(args.module, args.scenes, args.workers, args.quality)
+    summaryFile = args.summary or Path(config.media_dir) / "render_summary.json"
+    summaryFile.parent.mkdir(parents=True, exist_ok=True)
+    summaryFile.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+    for s in summary["scenes"]:
+        output = s.get("error", " ".join(s["outputs"]) if "outputs" in s else s.get("output", ""))
+        print(f"{s['scene']:<24} {s['wall']:8.1f}s wall {s['cpu']:8.1f}s cpu  {output}")
+    print(f"{'total':<24} {summary['wall']:8.1f}s wall on {summary['workers']} workers, "
+          f"{summary['speedup']:.1f}x over serial")
+    sys.exit(1 if any("error" in s for s in summary["scenes"]) else 0)
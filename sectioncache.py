@@ -0,0 +1,187 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import hashlib
+import os
+import weakref
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+from manim import Animation, AnimationGroup, ImageMobject, ManimColor, Mobject, Scene, VMobject, config
+
+import preview
+import texcache
+
+# ******************************************************************************
+SECTION_CACHE_VERSION: int = 3
+_imageDigests: dict[int, tuple[weakref.ref, bytes]] = {}
+
+# ******************************************************************************
+def _update(hasher: "hashlib._Hash", value: Any) -> None:
+    if isinstance(value, np.ndarray):
+        hasher.update(str(value.shape).encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    else:
+        hasher.update(repr(value).encode())
+    hasher.update(b"\0")
+
+# ******************************************************************************
+def _imageDigest(array: np.ndarray) -> bytes:
+    # entries hold the array weakly and go with it, so a reused id never finds a stale digest
+    key = id(array)
+    entry = _imageDigests.get(key)
+    if entry is None or entry[0]() is not array:
+        digest = hashlib.sha256(np.ascontiguousarray(array).tobytes()).digest()
+        entry = (weakref.ref(array, lambda _: _imageDigests.pop(key, None)), digest)
+        _imageDigests[key] = entry
+    return entry[1]
+
+# ******************************************************************************
+def mobjectDigest(mobject: Mobject, hasher: "hashlib._Hash") -> None:
+    """Feed the state of a mobject and its family into a hash.
+
+    Covers the point arrays, colors, opacities and stroke widths, the z-index
+    and the TeX or text strings. Image pixels are hashed once per array.
+
+    Args:
+        mobject (Mobject): The mobject.
+        hasher (hashlib._Hash): The hash to update.
+    """
+    for m in mobject.get_family():
+        _update(hasher, type(m).__name__)
+        _update(hasher, m.z_index)
+        _update(hasher, m.points)
+        for attr in ("tex_string", "text", "original_text"):
+            if isinstance(getattr(m, attr, None), str):
+                _update(hasher, getattr(m, attr))
+        if isinstance(m, VMobject):
+            _update(hasher, m.get_fill_rgbas())
+            _update(hasher, m.get_stroke_rgbas())
+            _update(hasher, m.get_stroke_width())
+            _update(hasher, m.get_stroke_rgbas(background=True))
+            _update(hasher, m.get_stroke_width(background=True))
+        elif isinstance(m, ImageMobject):
+            hasher.update(_imageDigest(m.pixel_array))
+            _update(hasher, m.fill_opacity)
+
+# ******************************************************************************
+def animationDigest(animation: Animation, hasher: "hashlib._Hash") -> None:
+    """Feed an animation, its timing and the mobjects it touches into a hash.
+
+    Args:
+        animation (Animation): The animation, before it is played.
+        hasher (hashlib._Hash): The hash to update.
+    """
+    _update(hasher, type(animation).__name__)
+    _update(hasher, animation.run_time)
+    _update(hasher, getattr(animation.rate_func, "__qualname__", repr(animation.rate_func)))
+    _update(hasher, animation.lag_ratio)
+    for name, value in sorted(vars(animation).items()):
+        if isinstance(value, (bool, int, float, str, ManimColor)) and not name.startswith("_"):
+            _update(hasher, (name, value))
+    if isinstance(animation, AnimationGroup):
+        for a in animation.animations:
+            animationDigest(a, hasher)
+        return
+    mobjectDigest(animation.mobject, hasher)
+    target = getattr(animation, "target_mobject", None) or getattr(animation.mobject, "target", None)
+    if isinstance(target, Mobject):
+        mobjectDigest(target, hasher)
+
+# ******************************************************************************
+def stateDigest(scene: Scene, hasher: "hashlib._Hash") -> None:
+    """Feed what is on screen into a section hash: the background and every mobject of the scene."""
+    hasher.update(_imageDigest(scene.camera.background))
+    _update(hasher, len(scene.mobjects))
+    for mobject in scene.mobjects:
+        mobjectDigest(mobject, hasher)
+
+# ******************************************************************************
+def playDigest(scene: Scene, animations: list[Animation], hasher: "hashlib._Hash") -> None:
+    """Feed a `play` call into a section hash: its animations and what is on screen."""
+    for animation in animations:
+        animationDigest(animation, hasher)
+    stateDigest(scene, hasher)
+
+# ******************************************************************************
+def waitDigest(scene: Scene, duration: float, stopCondition: Callable[[], bool] | None,
+               frozenFrame: bool | None, hasher: "hashlib._Hash") -> None:
+    """Feed a `wait` call into a section hash: its duration, stop condition, frozen
+    frame flag and what is on screen."""
+    _update(hasher, ("wait", float(duration), frozenFrame,
+                     None if stopCondition is None else getattr(stopCondition, "__qualname__", repr(stopCondition))))
+    stateDigest(scene, hasher)
+
+# ******************************************************************************
+def newSectionHash() -> "hashlib._Hash":
+    """Start the hash of a section, covering the output settings."""
+    hasher = hashlib.sha256()
+    for value in (SECTION_CACHE_VERSION, config.pixel_width, config.pixel_height, config.frame_rate,
+                  config.frame_width, config.frame_height, str(config.background_color),
+                  config.movie_file_extension, config.transparent, preview.enabled()):
+        _update(hasher, value)
+    return hasher
+
+# ******************************************************************************
+def sectionKeys(sceneClass: type[Scene]) -> list[tuple[str, str]]:
+    """Get the cache keys of the sections of a scene, without rendering it.
+
+    The scene is constructed with its animations skipped, hashing every `play`
+    and `wait` of each section: the animation types and timings, the mobjects
+    they touch, the length of every pause, and everything on screen at each
+    of them and at the end of the section, so changes made without an
+    animation, such as removals, count too. A section's key only changes when
+    its own frames would, not with its place in the scene, so editing,
+    inserting or reordering one step leaves the keys of the other steps as
+    they were. Sections that would render the same frames share a key.
+
+    Args:
+        sceneClass (type[Scene]): The scene, a `StarScene`.
+
+    Returns:
+        list[tuple[str, str]]: The name and key of each section, in order.
+    """
+    sceneClass.KEY_SECTIONS = True
+    try:
+        scene = texcache.constructScene(sceneClass)
+    finally:
+        del sceneClass.KEY_SECTIONS
+    if not hasattr(scene, "sectionHashes"):
+        raise TypeError(f"{sceneClass.__name__} is not split into sections")
+    stateDigest(scene, scene.sectionHashes[-1])
+    return [(name, hasher.hexdigest()) for name, hasher in zip(scene.sectionNames, scene.sectionHashes)]
+
+# ==============================================================================
+class SectionStore:
+    """Directory of rendered section movies, keyed on the section keys.
+
+    Args:
+        directory (Path, optional): The store directory. Default is taken from
+            the `ISLAMICART_SECTION_CACHE` environment variable, or "sections"
+            in the media directory.
+    """
+    def __init__(self, directory: str | Path | None = None):
+        if directory is None:
+            directory = os.environ.get("ISLAMICART_SECTION_CACHE", Path(config.media_dir) / "sections")
+        self.directory = Path(directory)
+
+    def path(self, key: str) -> Path:
+        """Get the movie file of the section with the given key."""
+        return self.directory / f"{key}{config.movie_file_extension}"
+
+    def has(self, key: str) -> bool:
+        """Check whether the section with the given key is rendered."""
+        return self.path(key).exists()
+
+    def store(self, key: str, movie: str | Path) -> Path:
+        """Move a rendered section movie into the store."""
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(movie, path)
+        return path
@@ -0,0 +1,409 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import dataclasses
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Sequence
+
+from manim import UP, Animation, Create, FadeIn, FadeOut, Mobject, Scene, Transform
+
+# ******************************************************************************
+Tolerance: float = 1e-6  # seconds
+
+_CuePattern = re.compile(r"^\d+\.\s+(?P<label>[^:]+):\s+\[(?P<start>[\d.]+)s\]"
+                         r"(?:\s+\+\s+(?P<duration>[\d.]+)s:\s*(?P<text>.*))?$")
+
+# ==============================================================================
+@dataclass(frozen=True)
+class Cue:
+    """One line of a video transcript: a span of the voiceover.
+
+    Attributes:
+        label (str): The label of the line, e.g. "Instruction 3A".
+        start (float): The start of the span in seconds.
+        duration (float): The length of the span in seconds.
+        text (str): The spoken text.
+    """
+    label: str
+    start: float
+    duration: float
+    text: str = ""
+
+# ******************************************************************************
+def transcript(path: str | Path) -> dict[str, Cue]:
+    """Read the timings of a video transcript, as in `video/SixPointStar.md`.
+
+    Timed lines read `1. Instruction 2: [6s] + 4s: Then draw a circle on the
+    line.` and an untimed `1. Total: [36s]` line ends the transcript.
+
+    Returns:
+        dict[str, Cue]: The cues by label, in order.
+
+    Raises:
+        ValueError: If a cue does not start where the one before it ends, or
+            the cues do not add up to the total.
+    """
+    cues: dict[str, Cue] = {}
+    end = 0.0
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        match = _CuePattern.match(line.strip())
+        if match is None:
+            continue
+        start = float(match["start"])
+        if abs(start - end) > Tolerance:
+            raise ValueError(f"{path}: {match['label']!r} starts at {start}s, not at {end}s.")
+        if match["duration"] is None:
+            break
+        cue = Cue(match["label"].strip(), start, float(match["duration"]), match["text"].strip())
+        cues[cue.label] = cue
+        end = start + cue.duration
+    return cues
+
+# ==============================================================================
+@dataclass(frozen=True, eq=False)
+class Action:
+    """One animation of a step, built only when it is played.
+
+    Built lazily, `.animate` changes start from the state the mobject is in
+    when they play, not when the script is written.
+
+    Attributes:
+        kind (str): "in" for animations introducing their mobject, "out" for
+            those removing it, "fade" for `mobject.animate.fade`, "change" for
+            other `mobject.animate` calls, "instant" for calls made without an
+            animation, "remove" for taking a mobject off the scene without an
+            animation, "show" for animations putting their mobject on screen
+            as they start, as manim does for `Indicate`, and "play" for any
+            other animation.
+        mobject (Mobject | None): The mobject animated; None for the current
+            instruction.
+        animation (type[Animation] | str | None): The animation class, or the
+            method name of a change or instant call.
+        args (tuple): Further positional arguments of the animation or method.
+        kwargs (dict): Keyword arguments of the animation or method.
+        mergeable (bool): Whether the action only changes how visible its
+            mobject is, so it can join the animations of the beat before it.
+    """
+    kind: str
+    mobject: Mobject | None
+    animation: type[Animation] | str | None = None
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    mergeable: bool = False
+
+    @property
+    def key(self) -> tuple:
+        """Identify the action, equal for repeats of the same animation of the same mobject."""
+        return (self.kind, id(self.mobject), self.animation, repr(self.args), repr(sorted(self.kwargs.items())))
+
+    def build(self) -> Animation | None:
+        """Build the animation, or make an instant call and return None.
+
+        A removal has nothing to build; `Timeline.play` removes the mobject
+        after the animations of the beat.
+        """
+        if self.kind == "fade":
+            return self.mobject.animate.fade(*self.args)
+        if self.kind == "change":
+            return getattr(self.mobject.animate, self.animation)(*self.args, **self.kwargs)
+        if self.kind == "instant":
+            getattr(self.mobject, self.animation)(*self.args, **self.kwargs)
+            return None
+        if self.kind == "remove":
+            return None
+        return self.animation(self.mobject, *self.args, **self.kwargs)
+
+# ******************************************************************************
+def fadeIn(mobject: Mobject, **kwargs) -> Action:
+    """Fade a mobject in, with `FadeIn`."""
+    return Action("in", mobject, FadeIn, kwargs=kwargs, mergeable=True)
+
+# ******************************************************************************
+def fadeOut(mobject: Mobject, **kwargs) -> Action:
+    """Fade a mobject out, with `FadeOut`."""
+    return Action("out", mobject, FadeOut, kwargs=kwargs, mergeable=True)
+
+# ******************************************************************************
+def create(mobject: Mobject, **kwargs) -> Action:
+    """Draw a mobject, with `Create`."""
+    return Action("in", mobject, Create, kwargs=kwargs)
+
+# ******************************************************************************
+def introduce(animation: type[Animation], mobject: Mobject, **kwargs) -> Action:
+    """Fade a mobject in with another introducing animation, such as `FadeInDots`."""
+    return Action("in", mobject, animation, kwargs=kwargs, mergeable=True)
+
+# ******************************************************************************
+def animate(animation: type[Animation], mobject: Mobject, *, shows: bool = False, **kwargs) -> Action:
+    """Play any other animation of a mobject, such as `Flash`.
+
+    Set `shows` for animations of the mobject itself, such as `Indicate`, which
+    manim adds to the scene if it is not on screen yet.
+    """
+    return Action("show" if shows else "play", mobject, animation, kwargs=kwargs)
+
+# ******************************************************************************
+def fade(mobject: Mobject, darkness: float) -> Action:
+    """Fade a mobject by a darkness, as `mobject.animate.fade(darkness)`."""
+    return Action("fade", mobject, args=(darkness,), mergeable=True)
+
+# ******************************************************************************
+def change(mobject: Mobject, method: str, *args, **kwargs) -> Action:
+    """Animate a method call, as `mobject.animate.method(*args, **kwargs)`."""
+    return Action("change", mobject, method, args, kwargs)
+
+# ******************************************************************************
+def instantly(mobject: Mobject, method: str, *args, **kwargs) -> Action:
+    """Call a method of a mobject when the beat starts, without animating it."""
+    return Action("instant", mobject, method, args, kwargs)
+
+# ******************************************************************************
+def remove(mobject: Mobject) -> Action:
+    """Take a mobject off the scene without animating it, once the beat has played.
+
+    Merged into the beat before, as a beat of removals alone is, the mobject
+    goes when that beat ends, where the script has it.
+    """
+    return Action("remove", mobject, mergeable=True)
+
+# ******************************************************************************
+def dismissInstruction(**kwargs) -> Action:
+    """Fade out the instruction on screen."""
+    return Action("out", None, FadeOut, kwargs=kwargs, mergeable=True)
+
+# ==============================================================================
+@dataclass
+class Beat:
+    """Animations played together, in one `play`.
+
+    Attributes:
+        actions (list[Action]): The animations.
+        run_time (float): The length of the beat in seconds. Default is 1.
+        separate (bool): If True, the beat is never merged into the one before it.
+    """
+    actions: list[Action]
+    run_time: float = 1.0
+    separate: bool = False
+
+    def mobjects(self) -> set[int]:
+        return {id(a.mobject) for a in self.actions}
+
+
+@dataclass
+class Hold:
+    """A pause, in one `wait`."""
+    seconds: float
+
+
+@dataclass
+class Step:
+    """One instruction step of a scene, played as a section of its own.
+
+    Attributes:
+        name (str): The name of the section.
+        beats (list): The beats of the step in order: `Beat`s, `Hold`s, or
+            lists of actions played as a beat of one second.
+        duration (float, optional): The length of the step in seconds, as the
+            voiceover has it. The step is padded to it with a pause at its end.
+        instruction (str, optional): The instruction shown at the start of the step.
+        continued (bool): Whether the instruction continues the one before it,
+            without a number of its own.
+        objects (Sequence[Mobject]): Construction objects shown at the start of
+            the step without an animation.
+    """
+    name: str
+    beats: list[Beat | Hold | Sequence[Action]]
+    duration: float | None = None
+    instruction: str | None = None
+    continued: bool = False
+    objects: Sequence[Mobject] = ()
+
+# ==============================================================================
+class Timeline:
+    """A compiled script: the beats and pauses of every step, ready to play.
+
+    Attributes:
+        steps (list[tuple[Step, list[Beat | Hold]]]): Each step with its
+            compiled beats.
+        dropped (int): The number of actions removed as no-ops or repeats.
+        merged (int): The number of beats merged into the one before them.
+    """
+    def __init__(self):
+        self.steps: list[tuple[Step, list[Beat | Hold]]] = []
+        self.dropped = 0
+        self.merged = 0
+
+    @property
+    def duration(self) -> float:
+        """The length of the timeline in seconds."""
+        return sum(_length(beats) for _, beats in self.steps)
+
+    @property
+    def animatedTime(self) -> float:
+        """The seconds of the timeline spent in animations, whose every frame is rendered."""
+        return sum(b.run_time for _, beats in self.steps for b in beats if isinstance(b, Beat))
+
+    def play(self, scene: Scene) -> None:
+        """Play the timeline in a scene, each step after the first in a section of its own.
+
+        The first step plays in the section the scene is in, the "Intro" of a
+        `StarScene`.
+        """
+        for index, (step, beats) in enumerate(self.steps):
+            if index:
+                scene.next_section(step.name)
+            if step.objects:
+                scene.add(*step.objects)
+            for beat in beats:
+                if isinstance(beat, Hold):
+                    scene.wait(beat.seconds)
+                    continue
+                # instant calls come first, so the animations start from their result
+                actions = sorted(beat.actions, key=lambda a: a.kind != "instant")
+                animations = [a for a in (action.build() for action in actions) if a is not None]
+                if animations:
+                    scene.play(*animations, run_time=beat.run_time)
+                removed = [a.mobject for a in beat.actions if a.kind == "remove"]
+                if removed:
+                    scene.remove(*removed)
+
+# ******************************************************************************
+def compileSteps(steps: Sequence[Step], instruct: Callable[[str, bool], Mobject] | None = None,
+                 stage: Sequence[Mobject] = ()) -> Timeline:
+    """Compile a script of steps into a timeline with fewer animations and the script's timing.
+
+    Stepping through the script and tracking what is on screen, the compiler:
+
+    - shows each instruction in a beat of its own, fading the first in and
+      transforming the one on screen into the later ones;
+    - drops no-ops and repeats: introducing a mobject already on screen,
+      removing one that is not, fading by 0, and the same action twice in a beat;
+    - folds a fade of a mobject into a fade of it in the beat before, so
+      `fade(0.5)` then `fade(0.75)` become one `fade(0.875)`, if the beats
+      take the same time;
+    - merges a beat of fades into the beat before it, if they take the same
+      time and animate different mobjects;
+    - plays beats without animations, of removals and instant calls alone,
+      in no time;
+    - pads every step with a pause to its duration.
+
+    A `separate` beat is neither folded nor merged into the one before.
+
+    Only animations are rendered frame by frame; the frame of a pause is
+    rendered once and repeated, so the timeline renders fewer frames while
+    every step still starts where the voiceover does.
+
+    Args:
+        steps (Sequence[Step]): The script.
+        instruct (Callable[[str, bool], Mobject], optional): Creates the mobject
+            of an instruction from its text and whether it is continued,
+            such as `createInstruction`. Required if any step has an instruction.
+        stage (Sequence[Mobject], optional): The mobjects on screen when the
+            timeline starts.
+
+    Returns:
+        Timeline: The compiled timeline.
+
+    Raises:
+        ValueError: If the beats of a step take longer than its duration.
+    """
+    timeline = Timeline()
+    onStage = {id(m) for m in stage}
+    instruction: Mobject | None = None
+    for step in steps:
+        onStage.update(id(m) for m in step.objects)
+        beats: list[Beat | Hold] = []
+        if step.instruction is not None:
+            shown = instruct(step.instruction, step.continued)
+            if instruction is None:
+                instruction = shown
+                beats.append(Beat([fadeIn(instruction, shift=UP)]))
+                onStage.add(id(instruction))
+            else:
+                beats.append(Beat([Action("play", instruction, Transform, (shown,))]))
+        for beat in step.beats:
+            if isinstance(beat, Hold):
+                beats.append(beat)
+                continue
+            if not isinstance(beat, Beat):
+                beat = Beat(list(beat))
+            previous = beats[-1] if beats and isinstance(beats[-1], Beat) else None
+            joinable = previous is not None and not beat.separate and previous.run_time == beat.run_time
+            actions = []
+            for action in beat.actions:
+                if action.mobject is None:
+                    action = dataclasses.replace(action, mobject=instruction)
+                if not _live(action, onStage) or any(action.key == a.key for a in actions):
+                    timeline.dropped += 1
+                    continue
+                if action.kind == "fade" and joinable and _foldFade(previous, action):
+                    continue
+                actions.append(action)
+                _updateStage(action, onStage)
+            if not actions:
+                continue
+            if joinable and all(a.mergeable for a in actions) and not previous.mobjects() & _ids(actions):
+                previous.actions.extend(actions)
+                timeline.merged += 1
+                continue
+            animated = any(a.kind not in ("remove", "instant") for a in actions)
+            beats.append(Beat(actions, beat.run_time if animated else 0.0, beat.separate))
+        if step.duration is not None:
+            slack = step.duration - _length(beats)
+            if slack < -Tolerance:
+                raise ValueError(f"{step.name} takes {_length(beats):g}s, longer than its {step.duration:g}s.")
+            if slack > Tolerance:
+                if beats and isinstance(beats[-1], Hold):
+                    beats[-1] = Hold(beats[-1].seconds + slack)
+                else:
+                    beats.append(Hold(slack))
+        timeline.steps.append((step, beats))
+    return timeline
+
+# ******************************************************************************
+def _length(beats: list[Beat | Hold]) -> float:
+    return sum(b.seconds if isinstance(b, Hold) else b.run_time for b in beats)
+
+# ******************************************************************************
+def _ids(actions: list[Action]) -> set[int]:
+    return {id(a.mobject) for a in actions}
+
+# ******************************************************************************
+def _live(action: Action, onStage: set[int]) -> bool:
+    """Check whether an action changes anything, given the mobjects on screen."""
+    if action.kind == "in":
+        return id(action.mobject) not in onStage
+    if action.kind in ("out", "remove"):
+        return id(action.mobject) in onStage
+    if action.kind == "fade":
+        return action.args[0] != 0
+    return True
+
+# ******************************************************************************
+def _updateStage(action: Action, onStage: set[int]) -> None:
+    if action.kind in ("out", "remove"):
+        onStage.discard(id(action.mobject))
+    elif action.kind in ("in", "fade", "change", "show"):
+        # playing an `.animate` change, or an animation of the mobject, also adds it to the scene
+        onStage.add(id(action.mobject))
+
+# ******************************************************************************
+def _foldFade(beat: Beat, action: Action) -> bool:
+    """Fold a fade into a fade of the same mobject in a beat, if it has one.
+
+    Only for the beat right before the fade's, taking the same time, and only
+    if the fade's beat is not separate; otherwise the fade would change pace.
+    """
+    for i, other in enumerate(beat.actions):
+        if other.kind == "fade" and other.mobject is action.mobject:
+            darkness = 1 - (1 - other.args[0]) * (1 - action.args[0])
+            beat.actions[i] = dataclasses.replace(other, args=(darkness,))
+            return True
+    return False
@@ -0,0 +1,223 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import os
+from fractions import Fraction
+from pathlib import Path
+from queue import Queue
+from threading import Thread
+from typing import Callable
+
+import av
+import numpy as np
+from manim import config, logger
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import write_to_movie
+from numpy.typing import NDArray
+
+# ******************************************************************************
+StreamBuffer: int = 8  # frames queued for the sink before rendering waits
+
+# A callable receiving every frame, `(height, width, 4)` RGBA, and the number of
+# times it is repeated. Setting it streams renders to it instead of a movie.
+FrameCallback = Callable[[NDArray[np.uint8], int], None]
+callback: FrameCallback | None = None
+
+# ******************************************************************************
+def enabled() -> bool:
+    """Check whether scenes stream their frames instead of writing partial movie files.
+
+    Streaming is enabled by setting `callback`, or the `ISLAMICART_STREAM`
+    environment variable: "1" encodes into the scene's movie file, any other
+    value is the path of a named pipe, or a file, to write raw RGBA frames to.
+    `render.py --stream` sets it. GIF and PNG output are never streamed.
+    """
+    if config.movie_file_extension not in (".mp4", ".mov", ".webm") or config.format in ("gif", "png"):
+        return False
+    return callback is not None or os.environ.get("ISLAMICART_STREAM", "") not in ("", "0")
+
+# ==============================================================================
+class MovieSink:
+    """Encodes frames into a movie, written under a temporary name and renamed when complete.
+
+    The codec and pixel format follow manim's partial movie files. The size is
+    the scene's pixel size unless given.
+    """
+    def __init__(self, path: Path, size: tuple[int, int] | None = None):
+        self.path = path
+        self.temporary = path.with_name(f".{path.stem}.streaming{path.suffix}")
+        self.temporary.parent.mkdir(parents=True, exist_ok=True)
+        codec, pixelFormat, options = "libx264", "yuv420p", {"an": "1", "crf": "23"}
+        if config.movie_file_extension == ".webm":
+            codec, options["-auto-alt-ref"] = "libvpx-vp9", "1"
+            if config.transparent:
+                pixelFormat = "yuva420p"
+        elif config.transparent:
+            codec, pixelFormat = "qtrle", "argb"
+        self.container = av.open(str(self.temporary), mode="w")
+        self.stream = self.container.add_stream(codec, rate=Fraction(config.frame_rate).limit_denominator(),
+                                                options=options)
+        self.stream.pix_fmt = pixelFormat
+        self.stream.width, self.stream.height = size or (config.pixel_width, config.pixel_height)
+
+    def write(self, frame: NDArray[np.uint8], count: int) -> None:
+        for _ in range(count):
+            # a frame cannot be encoded twice, so each repeat gets its own
+            self.encode(av.VideoFrame.from_ndarray(frame, format="rgba"))
+
+    def encode(self, frame: av.VideoFrame) -> None:
+        for packet in self.stream.encode(frame):
+            self.container.mux(packet)
+
+    def close(self) -> None:
+        for packet in self.stream.encode():
+            self.container.mux(packet)
+        self.container.close()
+        os.replace(self.temporary, self.path)
+
+    def abort(self) -> None:
+        self.container.close()
+        self.temporary.unlink(missing_ok=True)
+
+# ==============================================================================
+class PipeSink:
+    """Writes raw RGBA frames, `pixel_height` rows of `pixel_width` pixels, to a named pipe or file."""
+    def __init__(self, path: Path):
+        self.path = path
+        self.file = open(path, "wb")
+
+    def write(self, frame: NDArray[np.uint8], count: int) -> None:
+        data = np.ascontiguousarray(frame).data
+        for _ in range(count):
+            self.file.write(data)
+
+    def close(self) -> None:
+        self.file.close()
+
+    abort = close
+
+# ==============================================================================
+class CallbackSink:
+    """Hands the frames to a callable."""
+    def __init__(self, func: FrameCallback):
+        self.func = func
+
+    def write(self, frame: NDArray[np.uint8], count: int) -> None:
+        self.func(frame, count)
+
+    def close(self) -> None:
+        pass
+
+    abort = close
+
+# ==============================================================================
+class StreamingFileWriter(SceneFileWriter):
+    """Scene file writer streaming the frames of the whole scene to one sink.
+
+    Instead of encoding each `play` into its own partial movie file and joining
+    them at the end, the frames go to one persistent encoder, a named pipe or
+    `callback`, see `enabled`. A background thread drains a queue of at most
+    `StreamBuffer` frames into the sink; rendering waits when it is full. A
+    movie only appears under its name once it is complete, so a failed render
+    leaves no file behind. Partial movies are neither read nor written, and
+    sections are not saved as separate movies.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sink: MovieSink | PipeSink | CallbackSink | None = None
+        self.error: BaseException | None = None
+        self.streamedFrames = 0
+
+    def is_already_cached(self, hash_invocation: str) -> bool:
+        return False
+
+    def add_partial_movie_file(self, hash_animation: str) -> None:
+        pass
+
+    def begin_animation(self, allow_write: bool = False, file_path=None) -> None:
+        if write_to_movie() and allow_write and self.sink is None:
+            self.openStream()
+
+    def end_animation(self, allow_write: bool = False) -> None:
+        pass
+
+    def createSink(self) -> MovieSink | PipeSink | CallbackSink:
+        """Create the sink the frames are streamed to."""
+        setting = os.environ.get("ISLAMICART_STREAM", "")
+        if callback is not None:
+            return CallbackSink(callback)
+        if setting == "1":
+            return MovieSink(Path(self.movie_file_path))
+        return PipeSink(Path(setting))
+
+    def openStream(self) -> None:
+        """Open the sink and start the thread writing to it."""
+        self.sink = self.createSink()
+        self.queue: Queue[tuple[int, NDArray[np.uint8] | None]] = Queue(maxsize=StreamBuffer)
+        self.writer_thread = Thread(target=self.listen_and_write, daemon=True)
+        self.writer_thread.start()
+
+    def listen_and_write(self) -> None:
+        while True:
+            count, frame = self.queue.get()
+            if frame is None:
+                break
+            if self.error is None:  # after an error keep draining, so rendering never blocks
+                try:
+                    self.sink.write(frame, count)
+                except BaseException as error:
+                    self.error = error
+
+    def write_frame(self, frame_or_renderer: NDArray[np.uint8], num_frames: int = 1) -> None:
+        if not write_to_movie():
+            super().write_frame(frame_or_renderer, num_frames)
+            return
+        if self.error is not None:
+            raise self.error
+        self.queue.put((num_frames, frame_or_renderer))
+        self.streamedFrames += num_frames
+
+    def closeStream(self) -> None:
+        """Wait for the queued frames, then close the sink."""
+        self.queue.put((-1, None))
+        self.writer_thread.join()
+        if self.error is not None:
+            sink, self.sink = self.sink, None
+            sink.abort()
+            raise self.error
+        self.sink.close()
+
+    def abort(self) -> None:
+        """Stop streaming after a failed render, discarding the unfinished output."""
+        if self.sink is not None:
+            # stop writing the frames still queued
+            self.error = self.error or RuntimeError("The render was aborted.")
+            self.queue.put((-1, None))
+            self.writer_thread.join()
+            self.sink.abort()
+            self.sink = None
+
+    def finish(self) -> None:
+        if not write_to_movie():
+            super().finish()
+            return
+        if self.sink is None:
+            logger.info("No animations are contained in this scene.")
+            return
+        if self.includes_sound:
+            logger.warning("Sounds are not streamed, the output is silent.")
+        self.closeStream()
+        self.reportOutput()
+        if self.subcaptions:
+            self.write_subcaption_file()
+
+    def reportOutput(self) -> None:
+        if isinstance(self.sink, MovieSink):
+            self.print_file_ready_message(str(self.movie_file_path))
+        else:
+            logger.info("Streamed %(frames)d frames", {"frames": self.streamedFrames})
@@ -0,0 +1,33 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+
+# ******************************************************************************
+# The palette and names shared by the scenes and the exporter. Kept free of
+# manim so the exporter, and anything else drawing without a scene, can use
+# them without loading it.
+
+# ******************************************************************************
+GridColor: str = "#003049"
+ConstructionLineColor: str = "#FF9911"
+ReferenceDotColor: str = "#D62828"
+IndicateDotColor: str = "#9DD9D2"
+LabelFillColor: str = "#EAE2B7"
+FinalColor: str = "#392F5A"
+
+# ******************************************************************************
+NumberNames: dict[int, str] = {
+    3: 'Three', 4: 'Four', 5: 'Five', 6: 'Six', 7: 'Seven', 8: 'Eight',
+    9: 'Nine', 10: 'Ten', 11: 'Eleven', 12: 'Twelve', 14: 'Fourteen',
+    16: 'Sixteen', 18: 'Eighteen', 20: 'Twenty', 24: 'Twenty-Four',
+}
+
+# ******************************************************************************
+def starName(n: int) -> str:
+    """Get the name of the number of points of a star, as used in its title."""
+    return NumberNames.get(n, str(n))
@@ -0,0 +1,76 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import math
+
+import numpy as np
+import pytest
+
+from arrangement import mergePoints, starArrangement
+from geometry import starGeometry
+
+Families = [((5, 2),), ((6, 2),), ((8, 2),), ((8, 3),), ((12, 5),), ((16, 4),),
+            ((12, 5), (12, 3)), ((12, 2), (8, 3)), ((10, 3), (10, 2), (5, 2))]
+
+# ******************************************************************************
+def _shoelace(corners: np.ndarray) -> float:
+    x, y = corners[:, 0], corners[:, 1]
+    return float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y)) / 2
+
+# ******************************************************************************
+@pytest.mark.parametrize("families", Families)
+def test_euler_characteristic(families):
+    # a connected planar graph has V - E + F = 2, the unbounded face included
+    result = starArrangement(families, 2.0)
+    assert len(result.vertices) - len(result.edges) + len(result.faces) == 1
+
+
+@pytest.mark.parametrize("families", Families)
+def test_faces_are_counterclockwise_and_contain_their_centroids(families):
+    result = starArrangement(families, 2.0)
+    assert np.all(result.areas > 0)
+    for face, (area, centroid) in enumerate(zip(result.areas, result.centroids)):
+        assert _shoelace(result.polygon(face)) == pytest.approx(area)
+        assert result.faceAt(centroid) == face
+
+
+@pytest.mark.parametrize("n, interval", [(5, 2), (6, 2), (8, 2), (8, 3), (12, 5), (16, 4)])
+def test_face_areas_sum_to_the_star(n, interval):
+    # the bounded faces tile the star whose outline is the ring points and the outermost crossings
+    star = starGeometry(n, interval, 2.0)
+    assert starArrangement(((n, interval),), 2.0).areas.sum() == pytest.approx(_shoelace(star.vertices))
+
+
+def test_face_areas_sum_to_the_polygon():
+    result = starArrangement(((9, 1),), 1.5)
+    assert len(result.faces) == 1
+    assert result.areas.sum() == pytest.approx(9 / 2 * 1.5 ** 2 * math.sin(math.tau / 9))
+
+
+def test_concurrent_crossings_are_merged():
+    # all the diameters of a ring cross at the center, cutting its polygon into a fan of triangles
+    result = starArrangement(((12, 6), (12, 1)), 1.0)
+    assert len(result.vertices) == 12 + 1
+    assert len(result.edges) == 12 + 12
+    assert len(result.faces) == 12
+    assert all(len(face) == 3 for face in result.faces)
+
+
+def test_merge_points_transitively():
+    xy = np.array([[0.0, 0.0], [0.6e-7, 0.0], [1.2e-7, 0.0], [1.0, 1.0]])
+    merged, centers = mergePoints(xy)
+    assert merged.tolist() == [0, 0, 0, 1]
+    np.testing.assert_allclose(centers, [[0.6e-7, 0.0], [1.0, 1.0]])
+
+
+def test_merge_points_keeps_distant_cells_apart():
+    # cells (0, 2^32 - 6) and (2, -5), the same cell key as a single packed integer
+    xy = np.array([[0.5e-7, (2 ** 32 - 5.5) * 1e-7], [2.5e-7, -4.5e-7]])
+    merged, centers = mergePoints(xy)
+    assert merged.tolist() == [0, 1]
+    np.testing.assert_allclose(centers, xy)
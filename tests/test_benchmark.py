@@ -0,0 +1,73 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import benchmark
+
+# ******************************************************************************
+def _loaders(monkeypatch, *prefixes: str) -> list[str]:
+    """Replace the registered loaders with ones recording the prefixes they were run for."""
+    loaded = []
+    monkeypatch.setattr(benchmark, "Loaders", {prefix: (lambda prefix=prefix: loaded.append(prefix))
+                                               for prefix in prefixes})
+    return loaded
+
+
+def _results(**times: float) -> dict:
+    return {"meta": {}, "results": {name: {"min": t, "median": t, "number": 1, "repeat": 1}
+                                    for name, t in times.items()}}
+
+# ******************************************************************************
+@pytest.mark.parametrize("patterns, expected", [
+    (None, ["construct", "frame", "dashed"]),
+    (["*"], ["construct", "frame", "dashed"]),
+    (["construct[Six*"], ["construct"]),
+    (["c*", "f?ame*"], ["construct", "frame"]),
+    (["dashed.warm[circle]"], ["dashed"]),
+    (["intersections.*", "arrangement[8]"], []),
+])
+def test_load_runs_only_the_loaders_a_pattern_may_match(monkeypatch, patterns, expected):
+    loaded = _loaders(monkeypatch, "construct", "frame", "dashed")
+    benchmark.load(patterns)
+    assert loaded == expected
+
+
+def test_load_runs_each_loader_once(monkeypatch):
+    loaded = _loaders(monkeypatch, "construct", "frame")
+    benchmark.load(["construct*"])
+    benchmark.load(None)
+    assert loaded == ["construct", "frame"]
+
+
+def test_compare_reports_only_slow_downs_beyond_the_threshold():
+    baseline = _results(fast=1.0, same=1.0, slow=1.0, removed=1.0)
+    results = _results(fast=0.5, same=1.19, slow=1.5, added=9.0)
+    regressions = benchmark.compare(results, baseline, threshold=0.2)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("slow: 1000.000 ms -> 1500.000 ms")
+
+
+@pytest.mark.parametrize("baselineTime, exitCode", [(1e-12, 1), (1e3, 0)])
+def test_cli_exit_code_follows_the_baseline(tmp_path, baselineTime, exitCode):
+    # "[[]" matches the bracket itself; the ring of 6 is fast and needs no manim
+    name = "intersections.regular[6]"
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(_results(**{name: baselineTime})), encoding="utf-8")
+    output = tmp_path / "results.json"
+    result = subprocess.run([sys.executable, str(Path(benchmark.__file__)), "intersections.regular[[]6]",
+                             "-r", "1", "-o", str(output), "-b", str(baseline)],
+                            cwd=tmp_path, capture_output=True, text=True)
+    assert result.returncode == exitCode, result.stderr
+    assert list(json.loads(output.read_text(encoding="utf-8"))["results"]) == [name]
+    assert ("REGRESSION" in result.stdout) == bool(exitCode)
@@ -0,0 +1,96 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import math
+
+import numpy as np
+import pytest
+
+from construction import Construction, eightPointConstruction
+
+# ******************************************************************************
+def _eightPoints(r: float) -> dict[str, tuple[float, float, float]]:
+    """The points `EightPointStar` placed by hand before it was constructed."""
+    polar = lambda radius, degrees: (radius * math.cos(math.radians(degrees)),
+                                     radius * math.sin(math.radians(degrees)), 0.0)
+    return {
+        "A": (+r, 0.0, 0.0), "B": (-r, 0.0, 0.0),
+        **{name: polar(r, degrees) for name, degrees in zip("abcd", (60, 120, 240, 300))},
+        "C": tuple(np.add((r, 0.0, 0.0), polar(2 * r, 120))), "D": tuple(np.add((r, 0.0, 0.0), polar(2 * r, 240))),
+        "E": polar(r, 90), "F": polar(r, 270),
+        "corner0": (+r, +r, 0.0), "corner1": (-r, +r, 0.0), "corner2": (-r, -r, 0.0), "corner3": (+r, -r, 0.0),
+    }
+
+# the arcs `EightPointStar` drew by hand, as the center and the start and
+# sweep in degrees, without the 5 degrees it drew past each end
+_EightArcs: dict[str, tuple[str, float, float]] = {
+    "arcA": ("A", 90, 180), "arcB": ("B", 270, 180), "arcE": ("E", 180, 180), "arcF": ("F", 0, 180),
+    "arcCa": ("a", 120, 0), "arcCb": ("b", 60, 0), "arcDc": ("c", 300, 0), "arcDd": ("d", 240, 0),
+}
+
+# ******************************************************************************
+@pytest.mark.parametrize("radius", [2.0, 0.75])
+def test_eight_point_construction_matches_hand_placed_points(radius):
+    construction = eightPointConstruction(radius)
+    for name, expected in _eightPoints(radius).items():
+        np.testing.assert_allclose(construction[name], expected, atol=1e-12, err_msg=name)
+
+
+@pytest.mark.parametrize("radius", [2.0, 0.75])
+def test_eight_point_arcs_match_hand_drawn_arcs(radius):
+    construction = eightPointConstruction(radius)
+    for name, (center, start, sweep) in _EightArcs.items():
+        arcCenter, arcRadius, startAngle, angle = construction[name]
+        np.testing.assert_allclose(arcCenter, construction[center], atol=1e-12, err_msg=name)
+        assert arcRadius == pytest.approx(radius)
+        assert math.degrees(startAngle) % 360 == pytest.approx(start, abs=1e-9)
+        assert math.degrees(angle) == pytest.approx(sweep, abs=1e-9)
+
+
+def test_setting_radius_recomputes_the_construction():
+    construction = eightPointConstruction(2.0)
+    construction.evaluate()
+    construction.set("radius", 3.0)
+    assert construction.evaluate() > 0
+    for name, expected in _eightPoints(3.0).items():
+        np.testing.assert_allclose(construction[name], expected, atol=1e-12, err_msg=name)
+    assert construction.evaluate() == 0
+
+
+def test_set_recomputes_only_dependents():
+    construction = Construction()
+    left = construction.circle("left", construction.point("L", (-1, 0, 0)), 1.5)
+    right = construction.circle("right", construction.point("R", (1, 0, 0)), construction.parameter("r", 1.5))
+    construction.intersect("top", left, right, "upper")
+    construction.intersect("edge", construction.line("axis", "L", "R"), left, "left")
+    construction.evaluate()
+    edge = construction["edge"]
+
+    construction.set("r", 2.0)
+    assert construction.dirty == {"right", "top"}
+    assert construction.evaluate() == 2
+    assert construction["edge"] is edge
+    # the circles meet where (x + 1)^2 + y^2 = 1.5^2 and (x - 1)^2 + y^2 = 2^2
+    x = (1.5 ** 2 - 2.0 ** 2) / 4
+    np.testing.assert_allclose(construction["top"], (x, math.sqrt(1.5 ** 2 - (x + 1) ** 2), 0.0), atol=1e-12)
+
+
+def test_sweep_matches_each_value():
+    radii = np.array([0.5, 1.0, 2.0, 3.5])
+    sweep = eightPointConstruction(2.0)
+    sweep.set("radius", radii)
+    for name in _eightPoints(1.0):
+        assert sweep[name].shape == (len(radii), 3)
+        for radius, value in zip(radii, sweep[name]):
+            np.testing.assert_allclose(value, eightPointConstruction(radius)[name], atol=1e-12, err_msg=name)
+
+
+def test_set_rejects_constructed_nodes():
+    construction = eightPointConstruction(1.0)
+    with pytest.raises(ValueError):
+        construction.set("A", (0, 0, 0))
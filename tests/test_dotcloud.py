@@ -0,0 +1,64 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from dotcloud import DotCloud, LabelCloud  # noqa: E402
+from prototypes import glyphOutline  # noqa: E402
+
+Centers = np.array([[0.0, 0.0, 0.0], [1.5, -2.0, 0.0], [-3.0, 1.0, 0.0]])
+
+# ******************************************************************************
+def test_each_dot_is_the_outline_of_a_dot():
+    cloud = DotCloud(Centers, radius=np.array([0.1, 0.2, 0.3]))
+    dots = cloud.points.reshape(cloud.numDots, -1, 3)
+    assert cloud.numDots == 3
+    for dot, center, radius in zip(dots, Centers, (0.1, 0.2, 0.3)):
+        np.testing.assert_allclose(dot, manim.Dot(center, radius=radius).points, atol=1e-12)
+
+
+def test_single_radius_is_shared():
+    cloud = DotCloud(Centers, radius=0.25)
+    dots = cloud.points.reshape(cloud.numDots, -1, 3)
+    np.testing.assert_allclose(np.linalg.norm(dots[:, 0] - Centers, axis=1), 0.25)
+
+
+def test_dot_centers_follow_the_cloud():
+    cloud = DotCloud(Centers)
+    np.testing.assert_allclose(cloud.dotCenters(), Centers, atol=1e-12)
+    cloud.shift((1.0, 2.0, 0.0)).scale(2.0, about_point=manim.ORIGIN)
+    np.testing.assert_allclose(cloud.dotCenters(), 2 * (Centers + (1.0, 2.0, 0.0)), atol=1e-12)
+
+
+def test_scale_dots_keeps_their_centers():
+    cloud = DotCloud(Centers, radius=0.1)
+    cloud.scaleDots(np.array([1.0, 2.0, 3.0]))
+    dots = cloud.points.reshape(cloud.numDots, -1, 3)
+    np.testing.assert_allclose(cloud.dotCenters(), Centers, atol=1e-12)
+    np.testing.assert_allclose(np.linalg.norm(dots[:, 0] - Centers, axis=1), [0.1, 0.2, 0.3])
+
+
+def test_labels_are_centered_on_dots_sized_as_labeled_dots():
+    labels, fontSize = ["1", "12", "a"], 24
+    backgrounds, glyphs = LabelCloud(labels, Centers, color=manim.BLACK, fill_color=manim.WHITE,
+                                     font_size=fontSize)
+    for label, center, dot in zip(labels, Centers, backgrounds.points.reshape(len(labels), -1, 3)):
+        labeled = manim.LabeledDot(manim.Text(label, font_size=fontSize))
+        np.testing.assert_allclose(np.linalg.norm(dot[0] - center), labeled.width / 2, rtol=1e-6)
+    expected = np.concatenate([glyphOutline(label, fontSize)[0] + center for label, center in zip(labels, Centers)])
+    np.testing.assert_allclose(glyphs.points, expected)
+
+
+def test_blank_labels_have_no_glyphs():
+    backgrounds, glyphs = LabelCloud([" ", "7"], Centers[:2], color=manim.BLACK, fill_color=manim.WHITE,
+                                     font_size=24)
+    assert backgrounds.numDots == 2
+    np.testing.assert_allclose(glyphs.points, glyphOutline("7", 24)[0] + Centers[1])
@@ -0,0 +1,76 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import re
+import xml.etree.ElementTree as ET
+
+import pytest
+
+cairo = pytest.importorskip("cairo")
+
+from export import Palettes, exportCatalogue, exportStar  # noqa: E402
+
+# ******************************************************************************
+def _pixel(surface, x: int, y: int) -> tuple[int, int, int, int]:
+    """Get a pixel of an ARGB32 surface as (r, g, b, a)."""
+    data, offset = surface.get_data(), y * surface.get_stride() + 4 * x
+    b, g, r, a = data[offset:offset + 4]
+    return r, g, b, a
+
+
+def _rgba(color: str) -> tuple[int, int, int, int]:
+    digits = color.lstrip("#")
+    return tuple(int(digits[i:i + 2], 16) for i in range(0, 6, 2)) + (255,)
+
+
+def _length(value: str) -> float:
+    return float(re.match(r"[\d.]+", value).group())
+
+# ******************************************************************************
+def test_png_has_the_page_size_and_colors(tmp_path):
+    path = exportStar(tmp_path / "star.png", 8, 2, size=(400, 300))
+    surface = cairo.ImageSurface.create_from_png(str(path))
+    assert (surface.get_width(), surface.get_height()) == (400, 300)
+    # a margin of 24 and "how to draw a" 24 high above a star of radius 90
+    palette = Palettes["classic"]
+    assert _pixel(surface, 0, 0) == _rgba(palette.background)
+    assert _pixel(surface, 200, 24 + 24 + 90) == _rgba(palette.star)
+
+
+def test_clear_png_is_transparent_around_the_star(tmp_path):
+    path = exportStar(tmp_path / "star.png", 6, 2, size=(200, 200), palette="clear", title=False)
+    surface = cairo.ImageSurface.create_from_png(str(path))
+    assert _pixel(surface, 0, 0)[3] == 0
+    assert _pixel(surface, 100, 100) == _rgba(Palettes["clear"].star)
+
+
+def test_svg_has_the_page_size(tmp_path):
+    path = exportStar(tmp_path / "star.svg", 12, 5, size=(300, 200), construction=True)
+    root = ET.parse(path).getroot()
+    assert root.tag == "{http://www.w3.org/2000/svg}svg"
+    assert (_length(root.get("width")), _length(root.get("height"))) == (300, 200)
+    assert any(root.iter("{http://www.w3.org/2000/svg}path"))
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        exportStar(tmp_path / "star.jpg", 8, 2)
+
+
+def test_catalogue_writes_every_variant_in_every_format(tmp_path):
+    files = exportCatalogue([(8, 2, "classic"), (6, 2, Palettes["night"])], tmp_path / "stars", size=(64, 64))
+    assert [f.name for f in files] == ["star-8-2-classic.svg", "star-8-2-classic.png",
+                                       "star-6-2-night.svg", "star-6-2-night.png"]
+    for f in files:
+        assert f.stat().st_size > 0
+        if f.suffix == ".png":
+            surface = cairo.ImageSurface.create_from_png(str(f))
+            assert (surface.get_width(), surface.get_height()) == (64, 64)
+        else:
+            root = ET.parse(f).getroot()
+            assert (_length(root.get("width")), _length(root.get("height"))) == (64, 64)
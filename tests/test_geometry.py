@@ -0,0 +1,135 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import numpy as np
+import pytest
+
+from geometry import (circleIntersections, intersections, lineCircleIntersections, lineIntersections, ringPoints,
+                      starGeometry, starIntersections)
+
+# ******************************************************************************
+def _lineIntersection(a1, a2, b1, b2) -> np.ndarray:
+    """Intersect two lines one at a time, as manim's `line_intersection` does."""
+    d = np.linalg.det
+    xdiff = (a1[0] - a2[0], b1[0] - b2[0])
+    ydiff = (a1[1] - a2[1], b1[1] - b2[1])
+    div = d([xdiff, ydiff])
+    lines = (d([a1[:2], a2[:2]]), d([b1[:2], b2[:2]]))
+    return np.array([d([lines, xdiff]) / div, d([lines, ydiff]) / div, 0.0])
+
+
+def _loopIntersections(points, interval: int, sides: int) -> np.ndarray:
+    """The per-vertex loop `intersections` was before it was batched."""
+    n = len(points)
+    return np.array([_lineIntersection(points[i % n], points[(i + interval) % n],
+                                       points[(i + 1) % n], points[(i + 1 - interval) % n])
+                     for i in range(sides)])
+
+# ******************************************************************************
+@pytest.mark.parametrize("n, interval", [(5, 2), (6, 2), (8, 2), (8, 3), (10, 3), (12, 5), (16, 4), (24, 7)])
+def test_star_intersections_match_loop(n, interval):
+    points = ringPoints(2.5, n, startAngle=0.3)
+    expected = _loopIntersections(points, interval, n)
+    np.testing.assert_allclose(starIntersections(points, interval), expected, atol=1e-9)
+    np.testing.assert_allclose(intersections(list(points), interval, n), expected, atol=1e-9)
+
+
+def test_irregular_points_match_loop():
+    rng = np.random.default_rng(7)
+    points = ringPoints(3.0, 9) + rng.normal(scale=0.05, size=(9, 3)) * (1, 1, 0)
+    np.testing.assert_allclose(starIntersections(points, 3), _loopIntersections(points, 3, 9), atol=1e-9)
+
+
+def test_batched_stack_matches_each_star():
+    radii = np.array([1.0, 2.0, 3.5])
+    intervals = np.array([2, 3, 4])
+    stack = ringPoints(radii, 12)
+    batched = starIntersections(stack, intervals)
+    assert batched.shape == (3, 12, 3)
+    for points, interval, result in zip(stack, intervals, batched):
+        np.testing.assert_allclose(result, _loopIntersections(points, interval, 12), atol=1e-9)
+
+
+def test_fewer_sides():
+    points = ringPoints(1.0, 8)
+    np.testing.assert_allclose(starIntersections(points, 3, sides=4), _loopIntersections(points, 3, 4), atol=1e-9)
+
+
+def test_parallel_lines_raise():
+    with pytest.raises(ValueError):
+        starIntersections(ringPoints(1.0, 4), 3)
+
+
+# ******************************************************************************
+# The inner radius of a regular {n/k} star on the unit circle, cos(k pi/n) / cos((k - 1) pi/n)
+@pytest.mark.parametrize("n, interval, inner", [(5, 2, 0.3819660113), (6, 2, 0.5773502692), (8, 2, 0.7653668647),
+                                                (8, 3, 0.5411961001), (12, 3, 0.8164965809), (12, 5, 0.5176380902)])
+def test_star_intersections_pinned(n, interval, inner):
+    angles = (2 * np.arange(n) + 1) * np.pi / n
+    expected = inner * np.stack([np.cos(angles), np.sin(angles), np.zeros(n)], axis=1)
+    np.testing.assert_allclose(starIntersections(ringPoints(1.0, n), interval), expected, atol=1e-9)
+    # the same chords through the general line-line solve
+    points, i = ringPoints(1.0, n), np.arange(n)
+    general = lineIntersections(points[i], points[(i + interval) % n], points[(i + 1) % n],
+                                points[(i + 1 - interval) % n])
+    np.testing.assert_allclose(general, expected, atol=1e-9)
+
+
+def test_line_circle_intersections():
+    result = lineCircleIntersections(np.array([-3.0, 1.0, 0.0]), np.array([3.0, 1.0, 0.0]), np.zeros(3), 2.0)
+    np.testing.assert_allclose(result, [[-np.sqrt(3), 1.0, 0.0], [np.sqrt(3), 1.0, 0.0]], atol=1e-12)
+    # ordered from p1 to p2, against a shifted circle
+    result = lineCircleIntersections(np.array([1.0, 5.0, 0.0]), np.array([1.0, 4.0, 0.0]),
+                                     np.array([1.0, 1.0, 0.0]), 1.0)
+    np.testing.assert_allclose(result, [[1.0, 2.0, 0.0], [1.0, 0.0, 0.0]], atol=1e-12)
+
+
+def test_line_circle_intersections_batched_and_missing():
+    p1 = np.array([[0.0, -5.0, 0.0], [0.0, 3.0, 0.0]])
+    p2 = np.array([[0.0, 5.0, 0.0], [1.0, 3.0, 0.0]])
+    result = lineCircleIntersections(p1, p2, np.zeros((2, 3)), np.array([1.0, 2.0]))
+    assert result.shape == (2, 2, 3)
+    np.testing.assert_allclose(result[0], [[0.0, -1.0, 0.0], [0.0, 1.0, 0.0]], atol=1e-12)
+    assert np.isnan(result[1, :, :2]).all()
+
+
+def test_circle_intersections():
+    result = circleIntersections(np.array([0.0, 0.0, 0.0]), 5.0, np.array([8.0, 0.0, 0.0]), 5.0)
+    # the first to the right of the line from c1 to c2, the second to its left
+    np.testing.assert_allclose(result, [[4.0, -3.0, 0.0], [4.0, 3.0, 0.0]], atol=1e-12)
+    c1, c2 = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]), np.array([[0.0, 2.0, 0.0], [10.0, 0.0, 0.0]])
+    result = circleIntersections(c1, np.array([2.0, 1.0]), c2, np.array([2.0, 1.0]))
+    np.testing.assert_allclose(result[0], [[np.sqrt(3), 1.0, 0.0], [-np.sqrt(3), 1.0, 0.0]], atol=1e-12)
+    assert np.isnan(result[1, :, :2]).all()
+
+
+def test_star_geometry_is_cached_and_read_only():
+    geometry = starGeometry(8, 3, 2.0)
+    assert starGeometry(8, 3, 2.0) is geometry
+    assert starGeometry(8, 3, 2.5) is not geometry
+    for array in (geometry.ringPoints, geometry.labelPoints, geometry.intersectionPoints,
+                  geometry.vertices, *geometry.polygons):
+        assert not array.flags.writeable
+    with pytest.raises(ValueError):
+        geometry.vertices[0, 0] = 1.0
+    assert geometry.vertices.shape == (16, 3)
+    assert len(geometry.polygons) == 1 and geometry.polygons[0].shape == (8, 3)
+    np.testing.assert_allclose(geometry.vertices[0::2], ringPoints(2.0, 8))
+    np.testing.assert_allclose(geometry.vertices[1::2], starIntersections(ringPoints(2.0, 8), 3))
+    np.testing.assert_allclose(np.linalg.norm(geometry.labelPoints, axis=1), 2.5)
+
+
+@pytest.mark.parametrize("interval", [0, 1, 7, 8, 9, -1])
+def test_coinciding_lines_raise_on_both_paths(interval):
+    regular = ringPoints(1.0, 8)
+    irregular = regular + np.array([1e-3, 0.0, 0.0]) * (np.arange(8) == 0)[:, None]
+    for points in (regular, irregular):
+        with pytest.raises(ValueError, match="coincide"):
+            starIntersections(points, interval)
+    with pytest.raises(ValueError, match="coincide"):
+        starIntersections(ringPoints(np.array([1.0, 2.0]), 8), np.array([3, interval]))
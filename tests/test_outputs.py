@@ -0,0 +1,131 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import time
+
+import numpy as np
+import pytest
+
+av = pytest.importorskip("av")
+manim = pytest.importorskip("manim")
+
+import outputs  # noqa: E402
+import streaming  # noqa: E402
+from outputs import FanOutSink, Output, OutputSink  # noqa: E402
+
+# a tall framing of the whole plane and a wide one of its lower part, both at 4 pixels per unit
+Small: dict[str, Output] = {o.name: o for o in (
+    Output("tall", (32, 64), 2.0),
+    Output("wide", (64, 32), 1.0, -0.25),
+)}
+
+# ******************************************************************************
+@pytest.fixture
+def small(monkeypatch):
+    monkeypatch.setattr(outputs, "Outputs", Small)
+    monkeypatch.setenv("ISLAMICART_OUTPUTS", "tall,wide")
+    with manim.tempconfig({}):
+        yield outputs.configure(8.0)
+
+
+def _frame() -> np.ndarray:
+    """A 64x64 frame, red on the left half and green on the rows above row 40."""
+    frame = np.zeros((64, 64, 4), dtype=np.uint8)
+    frame[:, :32, 0] = 255
+    frame[:40, :, 1] = 255
+    frame[..., 3] = 255
+    return frame
+
+
+def _decode(path) -> np.ndarray:
+    with av.open(str(path)) as container:
+        return [frame.to_ndarray(format="rgb24") for frame in container.decode(video=0)]
+
+# ==============================================================================
+class _RecordingSink:
+    def __init__(self, fail: bool = False):
+        self.fail, self.frames, self.closed, self.aborted = fail, [], False, False
+
+    def write(self, frame, count):
+        if self.fail:
+            raise OSError("disk full")
+        self.frames.append((int(frame[0]), count))
+
+    def close(self):
+        self.closed = True
+
+    def abort(self):
+        self.aborted = True
+
+# ******************************************************************************
+def test_configure_covers_every_framing_at_the_finest_density(small):
+    # the tall framing is the plane, 16 units high; the wide one reaches down to -6
+    assert (manim.config.pixel_width, manim.config.pixel_height) == (64, 64)
+    assert (manim.config.frame_width, manim.config.frame_height) == pytest.approx((16.0, 16.0))
+
+
+def test_configure_returns_the_settings_it_replaced():
+    before = {name: manim.config[name] for name in ("pixel_width", "pixel_height", "frame_width", "frame_height")}
+    with manim.tempconfig({}):
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(outputs, "Outputs", Small)
+            monkeypatch.setenv("ISLAMICART_OUTPUTS", "tall,wide")
+            previous = outputs.configure(8.0)
+        assert previous == before
+        manim.config.update(previous)
+        assert {name: manim.config[name] for name in before} == before
+
+
+@pytest.mark.parametrize("name, rows, columns", [("tall", (0, 64), (16, 48)), ("wide", (24, 56), (0, 64))])
+def test_output_sink_crops_its_framing(small, tmp_path, name, rows, columns):
+    sink = OutputSink(tmp_path / f"{name}.mp4", Small[name])
+    assert (sink.rows.start, sink.rows.stop) == rows
+    assert (sink.columns.start, sink.columns.stop) == columns
+
+
+def test_output_sink_encodes_the_crop_at_the_output_size(small, tmp_path):
+    tall, wide = OutputSink(tmp_path / "tall.mp4", Small["tall"]), OutputSink(tmp_path / "wide.mp4", Small["wide"])
+    for sink in (tall, wide):
+        sink.write(_frame(), 3)
+        sink.close()
+    tallFrames, wideFrames = _decode(tmp_path / "tall.mp4"), _decode(tmp_path / "wide.mp4")
+    assert len(tallFrames) == len(wideFrames) == 3
+    assert tallFrames[0].shape == (64, 32, 3) and wideFrames[0].shape == (32, 64, 3)
+    # tall: frame columns 16 to 48, red up to its column 16 and green above its row 40
+    np.testing.assert_allclose(tallFrames[0][20, 8], (255, 255, 0), atol=40)
+    np.testing.assert_allclose(tallFrames[0][50, 24], (0, 0, 0), atol=40)
+    # wide: frame rows 24 to 56, green above its row 16
+    np.testing.assert_allclose(wideFrames[0][8, 8], (255, 255, 0), atol=40)
+    np.testing.assert_allclose(wideFrames[0][24, 56], (0, 0, 0), atol=40)
+
+
+def test_fan_out_feeds_every_sink_in_order(monkeypatch):
+    monkeypatch.setattr(streaming, "StreamBuffer", 2)
+    sinks = [_RecordingSink(), _RecordingSink()]
+    fanOut = FanOutSink(sinks)
+    for i in range(10):
+        fanOut.write(np.array([i]), i % 2 + 1)
+    fanOut.close()
+    for sink in sinks:
+        assert sink.frames == [(i, i % 2 + 1) for i in range(10)]
+        assert sink.closed and not sink.aborted
+
+
+def test_fan_out_error_aborts_every_sink(monkeypatch):
+    monkeypatch.setattr(streaming, "StreamBuffer", 2)
+    sinks = [_RecordingSink(), _RecordingSink(fail=True)]
+    fanOut = FanOutSink(sinks)
+    fanOut.write(np.array([0]), 1)
+    deadline = time.monotonic() + 5.0
+    while not fanOut.errors and time.monotonic() < deadline:
+        time.sleep(0.01)
+    with pytest.raises(OSError, match="disk full"):
+        fanOut.write(np.array([1]), 1)
+    with pytest.raises(OSError, match="disk full"):
+        fanOut.close()
+    assert all(sink.aborted and not sink.closed for sink in sinks)
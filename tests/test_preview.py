@@ -0,0 +1,45 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+
+import preview  # noqa: E402
+import texcache  # noqa: E402
+
+# ******************************************************************************
+def _box(monkeypatch, bounds, **kwargs):
+    monkeypatch.setattr(texcache, "cachedBounds", lambda *args, **kw: bounds)
+    return preview.textBox("text", tex_template=manim.TexTemplate(), color=manim.WHITE, **kwargs)
+
+# ******************************************************************************
+@pytest.mark.parametrize("characters, fontSize, width, height", [
+    # 20 characters of 5pt fit on one 100pt line
+    (20, "normalsize", 100 * 0.045, 1.2 * 10 * 0.045),
+    # 100 characters of 6pt wrap onto four 170pt lines
+    (100, "large", 170 * 0.045, 4 * 1.2 * 12 * 0.045),
+])
+def test_uncached_text_is_estimated(monkeypatch, characters, fontSize, width, height):
+    box = _box(monkeypatch, None, characters=characters, fontSize=fontSize)
+    assert box.width == pytest.approx(width)
+    assert box.height == pytest.approx(height)
+    np.testing.assert_allclose(box.get_center(), (0, 0, 0), atol=1e-9)
+
+
+def test_wrapping_width_is_respected(monkeypatch):
+    box = _box(monkeypatch, None, characters=100, fontSize="normalsize", width=250)
+    assert box.width == pytest.approx(250 * 0.045)
+    assert box.height == pytest.approx(2 * 1.2 * 10 * 0.045)
+
+
+def test_cached_text_takes_its_typeset_bounds(monkeypatch):
+    box = _box(monkeypatch, ((-1.0, -0.5, 0.0), (3.0, 1.5, 0.0)), characters=500)
+    assert (box.width, box.height) == pytest.approx((4.0, 2.0))
+    np.testing.assert_allclose(box.get_center(), (1.0, 0.5, 0.0), atol=1e-9)
@@ -0,0 +1,52 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("manim")
+
+import profiling  # noqa: E402
+
+# ******************************************************************************
+@profiling.traced("instruction")
+def _instruction() -> None:
+    pass
+
+# ******************************************************************************
+def test_collapsed_records_one_span_without_the_traced_calls_inside(tmp_path, monkeypatch):
+    profiler = profiling.Profiler(SimpleNamespace(mobjects=[]), tmp_path)
+    monkeypatch.setattr(profiling, "active", profiler)
+    profiler.begin("setup", "setup")
+    with profiling.collapsed(profiler, "prepare TeX", "setup"):
+        _instruction()
+    _instruction()
+    profiler.end()
+    assert profiling.active is profiler
+    assert [event["name"] for event in profiler.events] == ["prepare TeX", "_instruction", "setup"]
+
+
+def test_collapsed_does_nothing_without_a_profiler():
+    with profiling.collapsed(None, "prepare TeX", "setup"):
+        _instruction()
+    assert profiling.active is None
+
+
+def test_summary_shows_the_process_peak_and_the_traced_peak(tmp_path):
+    args = {"cpu": 0.5, "frames": 30, "mobjects": 4, "points": 100, "processPeakRssMB": 321.0}
+    events = [{"name": "Intro", "cat": "step", "dur": 1e6, "args": args},
+              {"name": "Step 1", "cat": "step", "dur": 2e6, "args": {**args, "peakTracedMB": 12.25}},
+              {"name": "play", "cat": "play", "dur": 1e6, "args": args}]
+    path = tmp_path / "scene.trace.json"
+    path.write_text(json.dumps({"traceEvents": events}), encoding="utf-8")
+    header, intro, step = profiling.summarize(path).splitlines()
+    assert header.split()[-3:] == ["peak", "rss", "traced"]
+    assert intro.split()[-2:] == ["321", "-"]
+    assert step.split()[-2:] == ["321", "12.2"]
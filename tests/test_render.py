@@ -0,0 +1,71 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+av = pytest.importorskip("av")
+pytest.importorskip("manim")
+
+import render  # noqa: E402
+
+Repository: Path = Path(__file__).resolve().parents[1]
+
+# ******************************************************************************
+def _writeMovie(path: Path, first: int, count: int) -> None:
+    """Encode frames of distinct gray levels, with x264's default B-frames."""
+    with av.open(str(path), mode="w") as container:
+        stream = container.add_stream("libx264", rate=15, options={"crf": "0"})
+        stream.width, stream.height, stream.pix_fmt = 64, 48, "yuv444p"
+        for i in range(first, first + count):
+            frame = av.VideoFrame.from_ndarray(np.full((48, 64, 3), i * 7 % 256, np.uint8), format="rgb24")
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+
+# ******************************************************************************
+def test_join_keeps_reordered_frames_in_order(tmp_path):
+    counts = [10, 7, 12]
+    movies = []
+    for i, count in enumerate(counts):
+        movies.append(tmp_path / f"part{i}.mp4")
+        _writeMovie(movies[-1], sum(counts[:i]), count)
+    joined = tmp_path / "joined.mp4"
+    render.joinMovies(movies, joined)
+    with av.open(str(joined)) as container:
+        frames = list(container.decode(video=0))
+    assert [int(f.to_ndarray(format="rgb24")[0, 0, 0]) for f in frames] == [i * 7 % 256 for i in range(sum(counts))]
+    assert all(a.pts < b.pts for a, b in zip(frames, frames[1:]))
+
+# ******************************************************************************
+def test_split_render_matches_serial(tmp_path, monkeypatch):
+    # previews draw boxes in place of TeX, so the scene renders without LaTeX
+    monkeypatch.chdir(Repository)
+    monkeypatch.setenv("ISLAMICART_PREVIEW", "1")
+    monkeypatch.setenv("ISLAMICART_SECTION_CACHE", str(tmp_path / "sections"))
+    summary = render.renderSegments("npointstars", "SixPointStar", workers=2, quality="l", verify=True,
+                                    options={"media_dir": str(tmp_path / "media")})
+    assert "error" not in summary
+    assert summary["matchesSerial"]
+
+
+@pytest.mark.parametrize("options", [[], ["-s", "SixPointStar"], ["-j", "1"],
+                                     ["-s", "SixPointStar", "EightPointStar", "-j", "1"],
+                                     ["-s", "SixPointStar", "-j", "2"],
+                                     ["-s", "SixPointStar", "-j", "1", "--split-steps"]])
+def test_streaming_to_a_pipe_needs_one_scene_and_one_worker(tmp_path, options):
+    result = subprocess.run([sys.executable, str(Repository / "render.py"), "--stream", str(tmp_path / "frames"),
+                             *options], cwd=tmp_path, capture_output=True, text=True)
+    assert result.returncode == 2
+    assert "--stream PIPE renders a single scene" in result.stderr
+    assert not (tmp_path / "frames").exists()
@@ -0,0 +1,54 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import pytest
+
+manim = pytest.importorskip("manim")
+
+import sectioncache  # noqa: E402
+from npointstars import StarScene  # noqa: E402
+
+# ******************************************************************************
+def _scene(steps: list[tuple[str, bool]]) -> type[StarScene]:
+    """A scene with a section for each step, showing a square of its color for a second.
+
+    Steps marked to keep their square leave it on screen, without an animation.
+    """
+    def construct(self):
+        self.wait(1)
+        for color, keep in steps:
+            self.next_section(color)
+            square = manim.Square(color=color)
+            self.add(square)
+            self.wait(1)
+            if not keep:
+                self.remove(square)
+    return type("Steps", (StarScene,), {"BATCH_TEX": False, "construct": construct})
+
+
+def _keys(steps: list[tuple[str, bool]]) -> dict[str, str]:
+    return dict(sectioncache.sectionKeys(_scene(steps)))
+
+# ******************************************************************************
+def test_reordering_steps_keeps_their_keys():
+    before = _keys([("#FF0000", False), ("#00FF00", False), ("#0000FF", False)])
+    after = _keys([("#00FF00", False), ("#FF0000", False), ("#0000FF", False)])
+    assert before == after
+
+
+def test_inserting_a_step_keeps_the_keys_after_it():
+    before = _keys([("#FF0000", False), ("#0000FF", False)])
+    after = _keys([("#FF0000", False), ("#00FF00", False), ("#0000FF", False)])
+    assert before["#0000FF"] == after["#0000FF"]
+
+
+def test_a_removal_changes_the_key():
+    before = _keys([("#FF0000", False), ("#0000FF", False)])
+    after = _keys([("#FF0000", True), ("#0000FF", False)])
+    assert before["#FF0000"] != after["#FF0000"]
+    assert before["#0000FF"] != after["#0000FF"]
@@ -0,0 +1,151 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+from pathlib import Path
+
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from steps import (Beat, Hold, Step, animate, compileSteps, create, fade, fadeIn, fadeOut,  # noqa: E402
+                   remove, transcript)
+
+Repository: Path = Path(__file__).resolve().parents[1]
+
+# ==============================================================================
+class _Scene:
+    """Records what a timeline does to a scene."""
+    def __init__(self):
+        self.calls: list[tuple] = []
+
+    def add(self, *mobjects):
+        self.calls.append(("add", *mobjects))
+
+    def remove(self, *mobjects):
+        self.calls.append(("remove", *mobjects))
+
+    def play(self, *animations, run_time: float):
+        self.calls.append(("play", *(a.mobject for a in animations)))
+
+    def wait(self, seconds: float):
+        self.calls.append(("wait", seconds))
+
+    def next_section(self, name: str):
+        self.calls.append(("section", name))
+
+# ******************************************************************************
+def _lengths(timeline) -> list[float]:
+    return [sum(b.seconds if isinstance(b, Hold) else b.run_time for b in beats) for _, beats in timeline.steps]
+
+
+def _instruct(text: str, continued: bool):
+    return manim.Square()
+
+# ******************************************************************************
+def test_transcript_reads_the_six_point_star_timings():
+    cues = transcript(Repository / "video" / "SixPointStar.md")
+    assert list(cues) == ["Video Title", "Instruction 1", "Instruction 2", "Instruction 3A",
+                          "Instruction 3B", "Instruction 4", "Instruction 5 + Closing"]
+    assert [cue.duration for cue in cues.values()] == [4, 2, 4, 5, 4, 7, 10]
+    assert [cue.start for cue in cues.values()] == [0, 4, 6, 10, 15, 19, 26]
+    assert cues["Instruction 1"].text == "Draw a straight line."
+
+
+def test_transcript_rejects_gaps(tmp_path):
+    path = tmp_path / "gap.md"
+    path.write_text("1. Title: [0s] + 4s: One.\n1. Next: [5s] + 2s: Two.\n1. Total: [7s]\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="'Next' starts at 5.0s, not at 4.0s"):
+        transcript(path)
+
+
+def test_steps_are_padded_to_the_transcript():
+    # the beats of SixPointStar, on stand-in mobjects
+    title, plane, line, dot, circle, a, b, arcA, arcB, dots, t1, t2, star = (manim.Square() for _ in range(13))
+    durations = [cue.duration for cue in transcript(Repository / "video" / "SixPointStar.md").values()]
+    script = [
+        Step("Intro", [Hold(2), [fadeOut(title), fadeIn(plane)]], durations[0], objects=(title,)),
+        Step("Step 1", [[create(line)]], durations[1], "Draw a straight line"),
+        Step("Step 2", [[fadeIn(dot)], [create(circle)]], durations[2], "Draw a circle"),
+        Step("Step 3A", [[fadeIn(a), fadeIn(b)], [animate(manim.Indicate, a)], [create(arcA), create(arcB)]],
+             durations[3], "Draw arcs"),
+        Step("Step 3B", [[fade(line, 0.5)], [fade(line, 0.75), fadeIn(dots)]], durations[4], "six points",
+             continued=True),
+        Step("Step 4", [[fade(circle, 0.5)], Beat([create(t1)], 2), Beat([create(t2)], 2)], durations[5],
+             "Join the dots"),
+        Step("Step 5", [[fadeOut(dots)], Beat([create(star)], 5), Beat([fadeOut(plane), fadeIn(title)], 2)],
+             durations[6], "Draw the star"),
+    ]
+    timeline = compileSteps(script, _instruct)
+    assert _lengths(timeline) == pytest.approx([4, 2, 4, 5, 4, 7, 10])
+    assert timeline.duration == pytest.approx(36)
+    # the fades of 3B fold into one, merged with the dots into the beat of the instruction
+    assert timeline.animatedTime == pytest.approx(1 + 2 + 2 + 3 + 1 + 5 + 8)
+    # the slack of a step is one pause at its end, added to a pause already there
+    assert [[b.seconds for b in beats if isinstance(b, Hold)] for _, beats in timeline.steps] == [
+        [2, 1], [], [2], [2], [3], [2], [2]]
+
+
+def test_steps_longer_than_their_duration_are_rejected():
+    with pytest.raises(ValueError, match="Step 1 takes 3s, longer than its 2s"):
+        compileSteps([Step("Step 1", [Beat([create(manim.Square())], 3)], 2)])
+
+
+def test_fade_folds_into_a_fade_of_the_beat_before():
+    square = manim.Square()
+    timeline = compileSteps([Step("Step 1", [[fade(square, 0.5)], [fade(square, 0.75)]])])
+    (_, beats), = timeline.steps
+    assert len(beats) == 1
+    assert beats[0].actions[0].args == (pytest.approx(0.875),)
+
+
+@pytest.mark.parametrize("pace", [{"run_time": 2}, {"separate": True}])
+def test_fade_of_a_beat_of_another_pace_is_not_folded(pace):
+    square = manim.Square()
+    timeline = compileSteps([Step("Step 1", [[fade(square, 0.5)], Beat([fade(square, 0.75)], **pace)])])
+    (_, beats), = timeline.steps
+    assert [[a.args for a in beat.actions] for beat in beats] == [[(0.5,)], [(0.75,)]]
+
+
+def test_separate_beats_are_not_merged():
+    a, b = manim.Square(), manim.Square()
+    timeline = compileSteps([Step("Step 1", [[fadeIn(a)], Beat([fadeIn(b)], separate=True)])])
+    (_, beats), = timeline.steps
+    assert len(beats) == 2 and timeline.merged == 0
+
+
+def test_merged_removals_follow_the_beat_they_join():
+    a, b = manim.Square(), manim.Square()
+    timeline = compileSteps([Step("Step 1", [[create(a)], [remove(b)]])], stage=[b])
+    scene = _Scene()
+    timeline.play(scene)
+    assert scene.calls == [("play", a), ("remove", b)]
+    assert timeline.merged == 1 and timeline.duration == pytest.approx(1)
+
+
+def test_removals_alone_take_no_time():
+    a, b = manim.Square(), manim.Square()
+    timeline = compileSteps([Step("Step 1", [[create(a)], Hold(1), [remove(b)]]),
+                             Step("Step 2", [[create(b)]])], stage=[b])
+    scene = _Scene()
+    timeline.play(scene)
+    assert scene.calls == [("play", a), ("wait", 1), ("remove", b), ("section", "Step 2"), ("play", b)]
+    assert timeline.duration == pytest.approx(3)
+
+
+def test_animations_showing_their_mobject_put_it_on_stage():
+    shown, played = manim.Square(), manim.Square()
+    timeline = compileSteps([Step("Step 1", [
+        [animate(manim.Indicate, shown, shows=True), animate(manim.Indicate, played)],
+        [fadeIn(shown)],
+        [fadeOut(shown), fadeOut(played)],
+    ])])
+    (_, beats), = timeline.steps
+    # showing makes fading in a no-op and fading out live; a plain animation does neither
+    assert [[(a.kind, a.mobject) for a in beat.actions] for beat in beats] == [
+        [("show", shown), ("play", played)], [("out", shown)]]
+    assert timeline.dropped == 2
@@ -0,0 +1,116 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import threading
+import time
+
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+
+import streaming  # noqa: E402
+from streaming import CallbackSink, StreamingFileWriter  # noqa: E402
+
+# ******************************************************************************
+def _frame(i: int) -> np.ndarray:
+    return np.full((2, 3, 4), i, dtype=np.uint8)
+
+
+def _waitFor(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def writer(tmp_path, monkeypatch):
+    """A streaming writer whose frames go to the callback set on `streaming`."""
+    monkeypatch.setattr(streaming, "StreamBuffer", 2)
+    with manim.tempconfig({"media_dir": str(tmp_path), "write_to_movie": True, "format": "mp4"}):
+        writer = StreamingFileWriter(None, "Streamed")
+        yield writer
+        writer.abort()
+
+# ******************************************************************************
+def test_frames_reach_the_sink_in_order(writer, monkeypatch):
+    received = []
+    monkeypatch.setattr(streaming, "callback", lambda frame, count: received.append((int(frame[0, 0, 0]), count)))
+    writer.begin_animation(allow_write=True)
+    assert isinstance(writer.sink, CallbackSink)
+    for i in range(10):
+        writer.write_frame(_frame(i), num_frames=i % 3 + 1)
+    writer.finish()
+    assert received == [(i, i % 3 + 1) for i in range(10)]
+    assert writer.streamedFrames == sum(i % 3 + 1 for i in range(10))
+
+
+def test_rendering_waits_while_the_queue_is_full(writer, monkeypatch):
+    release, received = threading.Event(), []
+
+    def slowSink(frame, count):
+        release.wait()
+        received.append(int(frame[0, 0, 0]))
+    monkeypatch.setattr(streaming, "callback", slowSink)
+    writer.begin_animation(allow_write=True)
+
+    # one frame held by the sink and two queued, the fourth has to wait
+    producer = threading.Thread(target=lambda: [writer.write_frame(_frame(i)) for i in range(4)])
+    producer.start()
+    assert _waitFor(lambda: writer.queue.full())
+    producer.join(0.2)
+    assert producer.is_alive()
+    assert writer.streamedFrames == 3
+
+    release.set()
+    producer.join(5.0)
+    assert not producer.is_alive()
+    writer.finish()
+    assert received == [0, 1, 2, 3]
+
+
+def test_sink_errors_reach_the_renderer(writer, monkeypatch):
+    received = []
+
+    def failingSink(frame, count):
+        if frame[0, 0, 0] == 1:
+            raise OSError("broken pipe")
+        received.append(int(frame[0, 0, 0]))
+    monkeypatch.setattr(streaming, "callback", failingSink)
+    writer.begin_animation(allow_write=True)
+    writer.write_frame(_frame(0))
+    writer.write_frame(_frame(1))
+    assert _waitFor(lambda: writer.error is not None)
+
+    # the frames queued after the error are drained, not written, and the next one raises
+    with pytest.raises(OSError, match="broken pipe"):
+        for i in range(2, 100):
+            writer.write_frame(_frame(i))
+    with pytest.raises(OSError, match="broken pipe"):
+        writer.finish()
+    assert received == [0]
+    assert writer.sink is None
+
+
+def test_abort_stops_writing_queued_frames(writer, monkeypatch):
+    release, received = threading.Event(), []
+
+    def slowSink(frame, count):
+        release.wait()
+        received.append(int(frame[0, 0, 0]))
+    monkeypatch.setattr(streaming, "callback", slowSink)
+    writer.begin_animation(allow_write=True)
+    for i in range(3):
+        writer.write_frame(_frame(i))
+    threading.Timer(0.1, release.set).start()
+    writer.abort()
+    assert writer.sink is None
+    assert received == [0]
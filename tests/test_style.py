@@ -0,0 +1,22 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import pytest
+
+from style import NumberNames, starName
+
+# ******************************************************************************
+@pytest.mark.parametrize("n, name", [(5, "Five"), (8, "Eight"), (12, "Twelve"), (24, "Twenty-Four")])
+def test_star_name_spells_out_known_numbers(n, name):
+    assert starName(n) == name
+
+
+@pytest.mark.parametrize("n", [13, 15, 30])
+def test_star_name_falls_back_to_digits(n):
+    assert n not in NumberNames
+    assert starName(n) == str(n)
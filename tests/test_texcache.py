@@ -0,0 +1,98 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from texcache import CachedTex, TexCache  # noqa: E402
+
+# ******************************************************************************
+def _tex(offset: float = 0.0) -> "manim.VMobject":
+    """A `Tex` shaped mobject: string parts holding glyphs, without running LaTeX."""
+    parts = []
+    for i in range(2):
+        glyphs = [manim.Square(side_length=0.5).shift((i + j + offset, 0, 0)) for j in range(2)]
+        parts.append(manim.VMobject().add(*glyphs))
+    return manim.VMobject().add(*parts)
+
+
+def _age(cache: TexCache, key: str, seconds: float) -> None:
+    stat = cache.path(key).stat()
+    os.utime(cache.path(key), (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+# ******************************************************************************
+def test_round_trip(tmp_path):
+    cache = TexCache(tmp_path)
+    tex = _tex()
+    cache.store("a" * 64, tex)
+    data = cache.load("a" * 64)
+    assert data is not None
+    rebuilt = CachedTex("x", data)
+    assert len(rebuilt.submobjects) == 2
+    original = [g.points for g in tex.family_members_with_points()]
+    restored = [g.points for g in rebuilt.family_members_with_points()]
+    assert len(original) == len(restored)
+    for a, b in zip(original, restored):
+        np.testing.assert_allclose(a, b, atol=1e-6)
+
+
+def test_missing_entry(tmp_path):
+    assert TexCache(tmp_path).load("b" * 64) is None
+
+
+def test_replaced_entry_is_reloaded(tmp_path):
+    cache = TexCache(tmp_path)
+    cache.store("c" * 64, _tex())
+    first = cache.load("c" * 64)["points"].copy()
+    cache.store("c" * 64, _tex(offset=5.0))
+    second = cache.load("c" * 64)["points"]
+    assert not np.allclose(first, second)
+
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    cache = TexCache(tmp_path)
+    keys = [c * 64 for c in "def"]
+    for age, key in zip((30, 20, 10), keys):
+        cache.store(key, _tex())
+        _age(cache, key, age)
+    assert cache.load(keys[0]) is not None  # loading marks it as recently used
+    cache.maxBytes = 2 * cache.path(keys[1]).stat().st_size
+    cache.evict()
+    assert cache.load(keys[1]) is None
+    assert cache.load(keys[0]) is not None
+    assert cache.load(keys[2]) is not None
+
+
+def test_cli_prewarms_the_given_directory(tmp_path):
+    # the scene module binds the cache at import, as npointstars does
+    (tmp_path / "cachedscenes.py").write_text(textwrap.dedent("""
+        from manim import Scene, Square
+        from texcache import texCache
+
+        class Stored(Scene):
+            def construct(self):
+                texCache.store("e" * 64, Square())
+    """), encoding="utf-8")
+    repository = Path(__file__).resolve().parent.parent
+    default, chosen = tmp_path / "default", tmp_path / "chosen"
+    env = {**os.environ, "ISLAMICART_TEX_CACHE": str(default),
+           "PYTHONPATH": os.pathsep.join([str(repository), str(tmp_path)])}
+    result = subprocess.run([sys.executable, str(repository / "texcache.py"), "cachedscenes",
+                             "--cache-dir", str(chosen), "--max-size", "1"],
+                            cwd=tmp_path, env=env, capture_output=True, text=True, check=True)
+    assert TexCache(chosen).path("e" * 64).exists()
+    assert not list(default.glob("*/*.npz"))
+    assert str(chosen) in result.stdout
@@ -0,0 +1,72 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import numpy as np
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+pytest.importorskip("manim")
+
+import textures  # noqa: E402
+from textures import TextureCache  # noqa: E402
+
+Background = (0x11, 0x22, 0x33, 0xFF)
+
+# ******************************************************************************
+def _image(tmp_path, name: str, size: tuple[int, int], rgba: tuple[int, int, int, int]):
+    path = tmp_path / name
+    Image.new("RGBA", size, rgba).save(path)
+    return path
+
+# ******************************************************************************
+def test_narrow_image_is_centered_at_full_height(tmp_path):
+    # a 2x4 texture in an 8x4 frame is drawn at full height, three pixels in from each side
+    image = _image(tmp_path, "narrow.png", (2, 4), (255, 0, 0, 255))
+    frame = TextureCache(tmp_path / "cache").frame(image, (8, 4), "#112233")
+    assert frame.shape == (4, 8, 4) and frame.dtype == np.uint8
+    np.testing.assert_array_equal(frame[:, 3:5], np.broadcast_to((255, 0, 0, 255), (4, 2, 4)))
+    np.testing.assert_array_equal(frame[:, :3], np.broadcast_to(Background, (4, 3, 4)))
+    np.testing.assert_array_equal(frame[:, 5:], np.broadcast_to(Background, (4, 3, 4)))
+
+
+def test_wide_image_is_cropped_to_the_frame(tmp_path):
+    image = _image(tmp_path, "wide.png", (8, 2), (0, 255, 0, 255))
+    frame = TextureCache(tmp_path / "cache").frame(image, (4, 4), "#112233")
+    assert frame.shape == (4, 4, 4)
+    np.testing.assert_array_equal(frame, np.broadcast_to((0, 255, 0, 255), (4, 4, 4)))
+
+
+def test_transparent_image_shows_the_background(tmp_path):
+    image = _image(tmp_path, "clear.png", (4, 4), (255, 255, 255, 0))
+    frame = TextureCache(tmp_path / "cache").frame(image, (4, 4), "#112233")
+    np.testing.assert_array_equal(frame, np.broadcast_to(Background, (4, 4, 4)))
+
+
+def test_frame_is_reused(tmp_path, monkeypatch):
+    image = _image(tmp_path, "narrow.png", (2, 4), (255, 0, 0, 255))
+    cache = TextureCache(tmp_path / "cache")
+    frame = cache.frame(image, (8, 4), "#112233")
+    assert isinstance(frame, np.memmap) and not frame.flags.writeable
+    assert cache.path(cache.key(image, (8, 4), "#112233")).exists()
+    assert cache.frame(image, (8, 4), "#112233") is frame
+
+    # another process opens the stored file instead of decoding the image again
+    def compose(*args):
+        raise AssertionError("the cached frame was composed again")
+    monkeypatch.setattr(textures, "_compose", compose)
+    again = TextureCache(tmp_path / "cache").frame(image, (8, 4), "#112233")
+    assert isinstance(again, np.memmap)
+    np.testing.assert_array_equal(again, frame)
+
+
+def test_frame_size_and_color_are_part_of_the_key(tmp_path):
+    image = _image(tmp_path, "narrow.png", (2, 4), (255, 0, 0, 255))
+    cache = TextureCache(tmp_path / "cache")
+    keys = {cache.key(image, (8, 4), "#112233"), cache.key(image, (8, 6), "#112233"),
+            cache.key(image, (8, 4), "#000000")}
+    assert len(keys) == 3
@@ -0,0 +1,87 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import math
+
+import numpy as np
+import pytest
+
+from tiling import Lattice, hexLattice, polygonPoints, squareLattice, tessellate, tilePoints
+
+Square = np.array([[0.5, 0.5, 0.0], [-0.5, 0.5, 0.0], [-0.5, -0.5, 0.0], [0.5, -0.5, 0.0]])
+
+# ******************************************************************************
+def _bruteForce(lattice: Lattice, xRange, yRange, extent: int = 40) -> set[tuple[float, float]]:
+    points = {tuple(np.round(i * lattice.a[:2] + j * lattice.b[:2], 9))
+              for i in range(-extent, extent + 1) for j in range(-extent, extent + 1)}
+    return {(x, y) for x, y in points if xRange[0] <= x <= xRange[1] and yRange[0] <= y <= yRange[1]}
+
+# ******************************************************************************
+def test_square_lattice_points_row_by_row():
+    points = squareLattice(1.0).points((-1.5, 1.5), (-1.0, 1.0))
+    expected = [(x, y, 0.0) for y in (-1, 0, 1) for x in (-1, 0, 1)]
+    np.testing.assert_allclose(points, expected)
+
+
+@pytest.mark.parametrize("lattice", [squareLattice(0.7), hexLattice(0.7), hexLattice(1.3)])
+@pytest.mark.parametrize("xRange, yRange", [((-3.1, 2.9), (-2.0, 4.5)), ((0.2, 0.3), (0.2, 0.3)), ((-7.0, 7.0), (1.0, 1.2))])
+def test_lattice_points_are_all_inside_the_rectangle(lattice, xRange, yRange):
+    points = lattice.points(xRange, yRange)
+    assert {tuple(np.round(p[:2], 9)) for p in points} == _bruteForce(lattice, xRange, yRange)
+    assert len(points) == len(_bruteForce(lattice, xRange, yRange))
+
+
+def test_hex_lattice_has_six_neighbours_at_the_spacing():
+    points = hexLattice(0.5).points((-2.0, 2.0), (-2.0, 2.0))
+    distances = np.linalg.norm(points[:, None, :2] - points[None, :, :2], axis=2)
+    neighbours = np.isclose(distances, 0.5)
+    center = np.argmin(np.linalg.norm(points, axis=1))
+    assert neighbours[center].sum() == 6
+    assert distances[~np.eye(len(points), dtype=bool)].min() == pytest.approx(0.5)
+
+
+def test_polygon_points_are_straight_edges():
+    points = polygonPoints(Square)
+    assert points.shape == (16, 3)
+    for k, (start, first, second, end) in enumerate(points.reshape(-1, 4, 3)):
+        np.testing.assert_allclose(start, Square[k])
+        np.testing.assert_allclose(end, Square[(k + 1) % 4])
+        np.testing.assert_allclose(first, (2 * start + end) / 3)
+        np.testing.assert_allclose(second, (start + 2 * end) / 3)
+
+
+def test_tile_points_shift_each_copy():
+    offsets = np.array([[0.0, 0.0, 0.0], [2.0, -1.0, 0.0], [-3.0, 5.0, 0.0]])
+    tiles = tilePoints(Square, offsets).reshape(3, 4, 3)
+    for tile, offset in zip(tiles, offsets):
+        np.testing.assert_allclose(tile, Square + offset)
+
+
+def test_tile_points_rotate_about_the_motif_origin():
+    offsets = np.array([[0.0, 0.0, 0.0], [2.0, -1.0, 0.0]])
+    motif = np.array([[1.0, 0.0, 0.0], [0.0, 2.0, 0.0]])
+    tiles = tilePoints(motif, offsets, np.array([math.pi / 2, math.pi])).reshape(2, 2, 3)
+    np.testing.assert_allclose(tiles[0], [[0.0, 1.0, 0.0], [-2.0, 0.0, 0.0]], atol=1e-12)
+    np.testing.assert_allclose(tiles[1], [[1.0, -1.0, 0.0], [2.0, -3.0, 0.0]], atol=1e-12)
+
+
+def test_tessellate_rotates_each_tile_by_its_angle():
+    pytest.importorskip("manim")
+    given = []
+    def angles(offsets):
+        given.append(offsets)
+        return offsets[:, 0] + 2 * offsets[:, 1]
+
+    # the square reaches 0.71 from its center, so the tiles centered one unit outside the area are built too
+    batches = tessellate(Square, squareLattice(1.0), xRange=(-1.0, 1.0), yRange=(-1.0, 1.0),
+                         angles=angles, batchSize=4)
+    offsets, = given
+    np.testing.assert_allclose(offsets, [(x, y, 0.0) for y in (-1, 0, 1) for x in (-1, 0, 1)])
+    assert [len(batch.points) for batch in batches] == [4 * 16, 4 * 16, 1 * 16]
+    points = np.concatenate([batch.points for batch in batches])
+    np.testing.assert_allclose(points, tilePoints(polygonPoints(Square), offsets, angles(offsets)))
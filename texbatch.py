@@ -0,0 +1,199 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import json
+import os
+import re
+import subprocess
+import tempfile
+from pathlib import Path
+
+from manim import ParsableManimColor, Rectangle, Scene, Tex, TexTemplate, VMobject, logger
+from manim.mobject.text import tex_mobject
+from manim.utils.tex_file_writing import generate_tex_file, make_tex_compilation_command
+
+import texcache
+
+# ==============================================================================
+class _Captured(Exception):
+    """Raised to stop `Tex` construction once its LaTeX expression is known."""
+    def __init__(self, expression: str, environment: str | None):
+        super().__init__(expression)
+        self.expression = expression
+        self.environment = environment
+
+# ******************************************************************************
+def _texExpression(texString: str, texTemplate: TexTemplate) -> tuple[str, str | None]:
+    """Get the expression and environment `Tex` would hand to LaTeX for a string."""
+    def capture(expression, environment=None, tex_template=None):
+        raise _Captured(expression, environment)
+
+    original = tex_mobject.tex_to_svg_file
+    tex_mobject.tex_to_svg_file = capture
+    try:
+        Tex(texString, tex_template=texTemplate)
+    except _Captured as captured:
+        return captured.expression, captured.environment
+    finally:
+        tex_mobject.tex_to_svg_file = original
+    raise RuntimeError(f"Tex did not request compilation of {texString!r}")
+
+# ******************************************************************************
+_PageEnvironment: str = "texbatchpage"
+_StandaloneClass = re.compile(r"\\documentclass(?:\[(?P<options>[^\]]*)\])?\{standalone\}")
+
+# ******************************************************************************
+def _batchDocument(texTemplate: TexTemplate, expressions: list[str]) -> str:
+    """Typeset expressions as the pages of one document, built from a template's own class and preamble.
+
+    Each page is the document a per-string `Tex` would compile, so the glyphs
+    come out the same. A `standalone` class, manim's default, gets the `multi`
+    option and puts each page in an environment of its own; any other class
+    gets a tight `preview` environment per page.
+    """
+    standalone = _StandaloneClass.fullmatch(texTemplate.documentclass.strip())
+    if standalone:
+        options = ",".join(filter(None, [standalone["options"], "multi"]))
+        head = [rf"\documentclass[{options}]{{standalone}}", texTemplate.preamble,
+                rf"\newenvironment{{{_PageEnvironment}}}{{}}{{}}", rf"\standaloneenv{{{_PageEnvironment}}}"]
+        begin, end = rf"\begin{{{_PageEnvironment}}}", rf"\end{{{_PageEnvironment}}}"
+    else:
+        head = [texTemplate.documentclass, texTemplate.preamble, r"\usepackage[active,tightpage]{preview}"]
+        begin, end = r"\begin{preview}", r"\end{preview}"
+    return "\n".join(filter(None, [
+        *head,
+        r"\begin{document}",
+        texTemplate.post_doc_commands,
+        *[f"{begin}\n{e}\n{end}" for e in expressions],
+        r"\end{document}",
+    ]))
+
+# ==============================================================================
+class TexBatch:
+    """Collects the TeX requests made while active, to compile them in one LaTeX run.
+
+    While the batch is active, `cachedTex` records every string missing from the
+    TeX cache and returns a placeholder instead of compiling it. `compile` then
+    typesets all of them as pages of a single document, converts the pages to
+    SVG in one dvisvgm call, and fills the TeX cache from the pages.
+    """
+    def __init__(self):
+        self.keys: list[str] = []
+        self.requests: dict[str, tuple[str, TexTemplate, ParsableManimColor]] = {}
+
+    def __enter__(self) -> "TexBatch":
+        texcache.activeBatch = self
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        texcache.activeBatch = None
+
+    def request(self, key: str, texString: str, texTemplate: TexTemplate,
+                color: ParsableManimColor, cached: bool) -> VMobject:
+        """Record a TeX request and return a placeholder for it."""
+        if key not in self.keys:
+            self.keys.append(key)
+        if not cached:
+            self.requests.setdefault(key, (texString, texTemplate, color))
+        return Rectangle(width=1.0, height=0.25)
+
+    def compile(self) -> int:
+        """Compile the recorded requests, one LaTeX run for each template.
+
+        Returns:
+            int: The number of requests added to the TeX cache.
+        """
+        groups: dict[str, list[tuple[str, str, TexTemplate, ParsableManimColor]]] = {}
+        for key, (texString, texTemplate, color) in self.requests.items():
+            groups.setdefault(texTemplate.body, []).append((key, texString, texTemplate, color))
+        compiled = 0
+        for group in groups.values():
+            try:
+                compiled += self._compileGroup(group)
+            except (OSError, ValueError, subprocess.SubprocessError) as error:
+                logger.warning(f"Batched LaTeX run failed, compiling one by one: {error}")
+        self.requests.clear()
+        return compiled
+
+    def _compileGroup(self, group: list[tuple[str, str, TexTemplate, ParsableManimColor]]) -> int:
+        texTemplate = group[0][2]
+        if texTemplate.preamble not in texTemplate.body:
+            return 0
+        expressions = [_texExpression(texString, texTemplate) for _, texString, _, _ in group]
+        wrapper = TexTemplate()
+        wrapper.body = wrapper.placeholder_text
+        document = _batchDocument(texTemplate, [wrapper.get_texcode_for_expression_in_env(e, env) if env else e
+                                                for e, env in expressions])
+
+        with tempfile.TemporaryDirectory(prefix="texbatch-") as tmp:
+            tmpDir = Path(tmp)
+            texFile = tmpDir / "batch.tex"
+            texFile.write_text(document, encoding="utf-8")
+            subprocess.run(make_tex_compilation_command(texTemplate.tex_compiler, texTemplate.output_format,
+                                                        texFile, tmpDir),
+                           cwd=tmpDir, stdout=subprocess.DEVNULL, check=True)
+            subprocess.run(["dvisvgm", *(["--pdf"] if texTemplate.output_format == ".pdf" else []),
+                            "--page=1-", "--no-fonts", "--verbosity=0",
+                            f"--output={(tmpDir / 'page-%p.svg').as_posix()}",
+                            texFile.with_suffix(texTemplate.output_format).as_posix()],
+                           cwd=tmpDir, stdout=subprocess.DEVNULL, check=True)
+            svgPages = sorted(tmpDir.glob("page-*.svg"), key=lambda p: int(p.stem.split("-")[-1]))
+            if len(svgPages) != len(expressions):
+                raise ValueError(f"Expected {len(expressions)} pages, dvisvgm wrote {len(svgPages)}")
+            for svgPage, (expression, environment) in zip(svgPages, expressions):
+                svgFile = generate_tex_file(expression, environment, texTemplate).with_suffix(".svg")
+                os.replace(svgPage, svgFile)
+
+        for key, texString, texTemplate, color in group:
+            texcache.texCache.store(key, Tex(texString, tex_template=texTemplate, color=color))
+        return len(group)
+
+# ******************************************************************************
+def _manifestPath(sceneClass: type[Scene]) -> Path:
+    return texcache.texCache.directory / "scenes" / f"{sceneClass.__module__}.{sceneClass.__qualname__}.json"
+
+# ******************************************************************************
+def prepareScene(sceneClass: type[Scene]) -> int:
+    """Typeset all the TeX a scene needs in a single batched LaTeX run.
+
+    The scene is constructed once with its animations skipped and nothing
+    written, collecting its TeX requests. The keys are remembered in a manifest
+    next to the TeX cache, so later runs skip the collection while every entry
+    is still cached.
+
+    Args:
+        sceneClass (type[Scene]): The scene to prepare.
+
+    Returns:
+        int: The number of TeX strings compiled.
+    """
+    manifest = _manifestPath(sceneClass)
+    try:
+        keys = json.loads(manifest.read_text(encoding="utf-8"))
+        if all(texcache.texCache.path(key).exists() for key in keys):
+            return 0
+    except (OSError, ValueError):
+        pass
+
+    with TexBatch() as batch:
+        texcache.constructScene(sceneClass)
+    compiled = batch.compile()
+
+    manifest.parent.mkdir(parents=True, exist_ok=True)
+    manifest.write_text(json.dumps(batch.keys), encoding="utf-8")
+    return compiled
+
+# ******************************************************************************
+def forgetScene(sceneClass: type[Scene]) -> None:
+    """Drop the manifest of a scene, so its TeX requests are collected again."""
+    _manifestPath(sceneClass).unlink(missing_ok=True)
+
+# ******************************************************************************
+def collecting() -> bool:
+    """Check whether a `TexBatch` is currently collecting requests."""
+    return texcache.activeBatch is not None
@@ -0,0 +1,267 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import argparse
+import functools
+import hashlib
+import importlib
+import os
+import tempfile
+from pathlib import Path
+
+import manim
+import numpy as np
+from manim import ManimColor, ParsableManimColor, Scene, Tex, TexTemplate, VMobject, tempconfig
+from manim.utils.exceptions import EndSceneEarlyException
+from numpy.typing import NDArray
+
+# ******************************************************************************
+CACHE_VERSION: int = 1
+DefaultCacheDir: Path = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "islamicart" / "tex"
+DefaultCacheSize: int = 256 * 1024 * 1024
+
+# ==============================================================================
+class CachedTex(VMobject):
+    """A `Tex` look-alike rebuilt from cached glyph outlines, without running LaTeX.
+
+    Keeps the two level structure of `Tex`, string parts holding glyphs, so it
+    transforms into and out of real `Tex` mobjects the same way.
+    """
+    def __init__(self, texString: str, data: dict[str, NDArray], **kwargs):
+        super().__init__(**kwargs)
+        self.tex_string = texString
+        offsets = data["offsets"]
+        parts: dict[int, list[VMobject]] = {}
+        for i, part in enumerate(data["parts"]):
+            fill, stroke = data["fill"][i].tolist(), data["stroke"][i].tolist()
+            glyph = VMobject(fill_color=ManimColor(fill[:3]), fill_opacity=fill[3],
+                             stroke_color=ManimColor(stroke[:3]), stroke_opacity=stroke[3],
+                             stroke_width=float(data["strokeWidth"][i]))
+            glyph.set_points(data["points"][offsets[i]:offsets[i + 1]].astype(np.float64))
+            parts.setdefault(int(part), []).append(glyph)
+        self.add(*[VMobject().add(*glyphs) for _, glyphs in sorted(parts.items())])
+
+    def __repr__(self):
+        return f"{type(self).__name__}({repr(self.tex_string)})"
+
+# ==============================================================================
+class TexCache:
+    """Persistent, content-addressed store of the glyph outlines of compiled TeX.
+
+    Entries are keyed on a hash of the final TeX string, the template and the
+    color, and hold the parsed SVG path data as compressed NumPy archives. The
+    directory can be shared between processes and machines; writes are atomic
+    and the least recently used entries are evicted beyond `maxBytes`.
+
+    Args:
+        directory (Path, optional): The cache directory. Default is taken from
+            the `ISLAMICART_TEX_CACHE` environment variable, or the user cache
+            directory.
+        maxBytes (int, optional): Size limit of the cache. Default is taken from
+            the `ISLAMICART_TEX_CACHE_MB` environment variable, or 256 MB.
+    """
+    def __init__(self, directory: str | Path | None = None, maxBytes: int | None = None):
+        if directory is None:
+            directory = os.environ.get("ISLAMICART_TEX_CACHE", DefaultCacheDir)
+        if maxBytes is None:
+            megabytes = os.environ.get("ISLAMICART_TEX_CACHE_MB")
+            maxBytes = int(float(megabytes) * 1024 * 1024) if megabytes else DefaultCacheSize
+        self.directory = Path(directory)
+        self.maxBytes = maxBytes
+        self.misses = 0
+
+    def key(self, texString: str, texTemplate: TexTemplate, color: ParsableManimColor) -> str:
+        """Get the cache key of a TeX string typeset with the given template and color."""
+        hasher = hashlib.sha256()
+        for part in (str(CACHE_VERSION), manim.__version__, texString,
+                     texTemplate.body, ManimColor(color).to_hex(with_alpha=True)):
+            hasher.update(part.encode())
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Get the file holding the entry for the given key."""
+        return self.directory / key[:2] / f"{key}.npz"
+
+    def load(self, key: str) -> dict[str, NDArray] | None:
+        """Get the glyph data stored for the given key, or None if it is not cached."""
+        path = self.path(key)
+        try:
+            stat = path.stat()
+            # a replaced entry is a new file, so the memo never serves the old one
+            data = _loadEntry(path, stat.st_ino, stat.st_size)
+        except (OSError, ValueError, KeyError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def store(self, key: str, mobject: VMobject) -> None:
+        """Store the glyph outlines of a `Tex` mobject under the given key."""
+        parts, glyphs = [], []
+        for i, part in enumerate(mobject.submobjects or [mobject]):
+            for glyph in part.family_members_with_points():
+                parts.append(i)
+                glyphs.append(glyph)
+        offsets = np.cumsum([0] + [len(g.points) for g in glyphs])
+        points = (np.concatenate([g.points for g in glyphs]) if glyphs else np.zeros((0, 3)))
+        data = {
+            "points": points.astype(np.float32),
+            "offsets": offsets.astype(np.int64),
+            "parts": np.array(parts, dtype=np.int32),
+            "fill": np.array([g.get_fill_rgbas()[0] for g in glyphs], dtype=np.float32).reshape(-1, 4),
+            "stroke": np.array([g.get_stroke_rgbas()[0] for g in glyphs], dtype=np.float32).reshape(-1, 4),
+            "strokeWidth": np.array([g.get_stroke_width() for g in glyphs], dtype=np.float32),
+        }
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(f, **data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        _loadEntry.cache_clear()
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in `maxBytes`."""
+        entries = []
+        for path in self.directory.glob("*/*.npz"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        evicted = False
+        for _, size, path in sorted(entries):
+            if total <= self.maxBytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted = True
+        if evicted:
+            _loadEntry.cache_clear()
+
+
+texCache = TexCache()
+activeBatch = None  # texbatch.TexBatch collecting requests, if any
+
+# ******************************************************************************
+@functools.lru_cache(maxsize=256)
+def _loadEntry(path: Path, inode: int, size: int) -> dict[str, NDArray]:
+    # keyed on the file as well as the path, see `TexCache.load`
+    with np.load(path) as archive:
+        return {name: archive[name] for name in archive.files}
+
+# ******************************************************************************
+def cachedTex(texString: str, *, tex_template: TexTemplate,
+              color: ParsableManimColor) -> VMobject:
+    """Create a `Tex` mobject, reusing the glyph outlines from the TeX cache when possible.
+
+    Args:
+        texString (str): The TeX string to typeset.
+        tex_template (TexTemplate): The template to typeset the string with.
+        color (ParsableManimColor): The color of the text.
+
+    Returns:
+        VMobject: A `CachedTex` on a cache hit, otherwise the compiled `Tex`.
+            A placeholder while a `texbatch.TexBatch` is collecting requests.
+    """
+    key = texCache.key(texString, tex_template, color)
+    if activeBatch is not None:
+        return activeBatch.request(key, texString, tex_template, color,
+                                   cached=texCache.path(key).exists())
+    data = texCache.load(key)
+    if data is not None:
+        return CachedTex(texString, data)
+    texCache.misses += 1
+    tex = Tex(texString, tex_template=tex_template, color=color)
+    texCache.store(key, tex)
+    return tex
+
+# ******************************************************************************
+def cachedBounds(texString: str, *, tex_template: TexTemplate,
+                 color: ParsableManimColor) -> NDArray[np.float64] | None:
+    """Get the bounding box of a cached TeX string, without building its mobject.
+
+    Returns:
+        NDArray[np.float64] | None: `(2, 3)` lower and upper corners, or None
+            if the string is not cached.
+    """
+    data = texCache.load(texCache.key(texString, tex_template, color))
+    if data is None or len(data["points"]) == 0:
+        return None
+    points = data["points"].astype(np.float64)
+    return np.array([points.min(axis=0), points.max(axis=0)])
+
+# ******************************************************************************
+def constructScene(sceneClass: type[Scene]) -> Scene:
+    """Construct a scene with its animations skipped, without rendering or writing anything.
+
+    Args:
+        sceneClass (type[Scene]): The scene to construct.
+
+    Returns:
+        Scene: The constructed scene, holding its final mobjects.
+    """
+    with tempconfig({"dry_run": True}):
+        scene = sceneClass(skip_animations=True)
+        scene.setup()
+        try:
+            scene.construct()
+        except EndSceneEarlyException:
+            pass
+    return scene
+
+# ******************************************************************************
+def prewarm(moduleName: str = "npointstars") -> list[str]:
+    """Fill the TeX cache with every text of every scene in a module.
+
+    Each scene is constructed with its animations skipped and nothing written,
+    so only the mobjects, and the TeX they need, are created.
+
+    Args:
+        moduleName (str, optional): Module holding the scenes. Default is "npointstars".
+
+    Returns:
+        list[str]: Names of the scenes that were constructed.
+    """
+    module = importlib.import_module(moduleName)
+    scenes = [obj for obj in vars(module).values()
+              if isinstance(obj, type) and issubclass(obj, Scene)
+              and obj.__module__ == module.__name__]
+    for scene in scenes:
+        if hasattr(module, "createInstruction"):
+            module.createInstruction.instructionCount = 0
+        constructScene(scene)
+    return [scene.__name__ for scene in scenes]
+
+# ******************************************************************************
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-warm the shared TeX cache for all scenes of a module.")
+    parser.add_argument("module", nargs="?", default="npointstars", help="module holding the scenes")
+    parser.add_argument("--cache-dir", type=Path, help="cache directory, shared between workers")
+    parser.add_argument("--max-size", type=float, help="cache size limit in MB")
+    args = parser.parse_args()
+    # run as a script, this module is `__main__`; the scenes use the cache of
+    # the `texcache` module, so that is the one to configure and fill
+    import texcache
+    if args.cache_dir is not None:
+        texcache.texCache.directory = args.cache_dir
+        os.environ["ISLAMICART_TEX_CACHE"] = str(args.cache_dir)
+    if args.max_size is not None:
+        texcache.texCache.maxBytes = int(args.max_size * 1024 * 1024)
+        os.environ["ISLAMICART_TEX_CACHE_MB"] = str(args.max_size)
+    names = texcache.prewarm(args.module)
+    print(f"TeX cache at {texcache.texCache.directory} warmed for {', '.join(names)}")
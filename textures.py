@@ -0,0 +1,116 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import functools
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from manim import ManimColor, ParsableManimColor
+from numpy.typing import NDArray
+from PIL import Image
+
+# ******************************************************************************
+TEXTURE_CACHE_VERSION: int = 1
+DefaultCacheDir: Path = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "islamicart" / "textures"
+
+# ==============================================================================
+class TextureCache:
+    """Persistent store of textures decoded and scaled to a frame size.
+
+    A texture is decoded once for each frame size, scaled to the frame height
+    and centered over the background color the way a full height `ImageMobject`
+    would be drawn, and kept as a raw RGBA array. Entries are opened memory
+    mapped and read only, so every scene and worker process shares the same
+    pages without decoding or copying. Within a process, each frame is looked
+    up once: later scenes get the same array without hashing the image again.
+
+    Args:
+        directory (Path, optional): The cache directory. Default is taken from
+            the `ISLAMICART_TEXTURE_CACHE` environment variable, or the user
+            cache directory.
+    """
+    def __init__(self, directory: str | Path | None = None):
+        if directory is None:
+            directory = os.environ.get("ISLAMICART_TEXTURE_CACHE", DefaultCacheDir)
+        self.directory = Path(directory)
+        self.frames: dict[tuple, NDArray[np.uint8]] = {}
+
+    def key(self, image: str | Path, size: tuple[int, int], color: ParsableManimColor) -> str:
+        """Get the cache key of an image composed into a frame of the given size and color."""
+        hasher = hashlib.sha256()
+        hasher.update(f"{TEXTURE_CACHE_VERSION}\0{size[0]}x{size[1]}\0".encode())
+        hasher.update(ManimColor(color).to_hex(with_alpha=True).encode())
+        hasher.update(b"\0")
+        hasher.update(Path(image).read_bytes())
+        return hasher.hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Get the file holding the entry for the given key."""
+        return self.directory / f"{key}.npy"
+
+    def frame(self, image: str | Path, size: tuple[int, int],
+              color: ParsableManimColor = "#000000") -> NDArray[np.uint8]:
+        """Get an image composed into a frame, decoding it only if it is not cached.
+
+        Args:
+            image (Path): The image file.
+            size (tuple[int, int]): The frame size in pixels, width and height.
+            color (ParsableManimColor, optional): The background color around
+                the image. Default is black.
+
+        Returns:
+            NDArray[np.uint8]: Read only, memory mapped (height, width, 4) RGBA array.
+        """
+        stat = Path(image).stat()
+        memo = (str(Path(image).resolve()), stat.st_mtime_ns, stat.st_size, tuple(size),
+                ManimColor(color).to_hex(with_alpha=True))
+        if memo not in self.frames:
+            key = self.key(image, size, color)
+            path = self.path(key)
+            if not path.exists():
+                self._store(path, _compose(image, size, color))
+            self.frames[memo] = _loadFrame(path)
+        return self.frames[memo]
+
+    def _store(self, path: Path, frame: NDArray[np.uint8]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.lib.format.write_array(f, frame, allow_pickle=False)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+textureCache = TextureCache()
+
+# ******************************************************************************
+@functools.lru_cache(maxsize=16)
+def _loadFrame(path: Path) -> NDArray[np.uint8]:
+    return np.load(path, mmap_mode="r")
+
+# ******************************************************************************
+def _compose(image: str | Path, size: tuple[int, int], color: ParsableManimColor) -> NDArray[np.uint8]:
+    width, height = size
+    with Image.open(image) as source:
+        texture = source.convert("RGBA")
+    scaledWidth = max(round(texture.width * height / texture.height), 1)
+    texture = texture.resize((scaledWidth, height), resample=Image.BICUBIC)
+    rgba = tuple(int(round(255 * c)) for c in ManimColor(color).to_rgba())
+    frame = Image.new("RGBA", (width, height), rgba)
+    if scaledWidth <= width:
+        frame.alpha_composite(texture, dest=((width - scaledWidth) // 2, 0))
+    else:
+        left = (scaledWidth - width) // 2
+        frame.alpha_composite(texture.crop((left, 0, left + width, height)))
+    return np.asarray(frame, dtype=np.uint8)
@@ -0,0 +1,149 @@
+# ******************************************************************************
+# Copyright (c) 2025. All rights reserved.
+#
+# This work is licensed under the Creative Commons Attribution 4.0
+# International License. To view a copy of this license,
+# visit # http://creativecommons.org/licenses/by/4.0/.
+# Author: roximn <roximn@rixir.org>
+# ******************************************************************************
+import math
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from geometry import StarGeometry
+from style import FinalColor
+
+# ******************************************************************************
+@dataclass(frozen=True)
+class Lattice:
+    """A plane lattice, the points `i * a + j * b` for all integers `i` and `j`.
+
+    Attributes:
+        a (NDArray[np.float64]): The first basis vector, `(3,)`.
+        b (NDArray[np.float64]): The second basis vector, `(3,)`.
+    """
+    a: NDArray[np.float64]
+    b: NDArray[np.float64]
+
+    def points(self, xRange: tuple[float, float], yRange: tuple[float, float]) -> NDArray[np.float64]:
+        """Get the lattice points inside a rectangle.
+
+        Args:
+            xRange (tuple[float, float]): The horizontal extent of the rectangle.
+            yRange (tuple[float, float]): The vertical extent of the rectangle.
+
+        Returns:
+            NDArray[np.float64]: `(m, 3)` lattice points, row by row.
+        """
+        basis = np.array([self.a[:2], self.b[:2]]).T
+        corners = np.array([[x, y] for x in xRange for y in yRange]).T
+        indices = np.linalg.solve(basis, corners)
+        lo, hi = np.floor(indices.min(axis=1)).astype(int), np.ceil(indices.max(axis=1)).astype(int)
+        j, i = np.mgrid[lo[1]:hi[1] + 1, lo[0]:hi[0] + 1]
+        points = np.outer(i.ravel(), self.a) + np.outer(j.ravel(), self.b)
+        inside = ((points[:, 0] >= xRange[0]) & (points[:, 0] <= xRange[1])
+                  & (points[:, 1] >= yRange[0]) & (points[:, 1] <= yRange[1]))
+        return points[inside]
+
+# ******************************************************************************
+def squareLattice(spacing: float) -> Lattice:
+    """Get a square lattice with the given distance between neighbouring points."""
+    return Lattice(np.array([spacing, 0.0, 0.0]), np.array([0.0, spacing, 0.0]))
+
+# ******************************************************************************
+def hexLattice(spacing: float) -> Lattice:
+    """Get a hexagonal lattice with the given distance between neighbouring points."""
+    return Lattice(np.array([spacing, 0.0, 0.0]),
+                   np.array([spacing / 2, spacing * math.sqrt(3) / 2, 0.0]))
+
+# ******************************************************************************
+def polygonPoints(corners: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Get the Bezier control points of a closed polygon, as `Polygon` would set them.
+
+    Args:
+        corners (NDArray[np.float64]): `(k, 3)` corners of the polygon.
+
+    Returns:
+        NDArray[np.float64]: `(4k, 3)` control points, four for each straight edge.
+    """
+    start, end = corners, np.roll(corners, -1, axis=0)
+    t = np.array([0.0, 1 / 3, 2 / 3, 1.0])[None, :, None]
+    return (start[:, None] + t * (end - start)[:, None]).reshape(-1, 3)
+
+# ******************************************************************************
+def tilePoints(motif: NDArray[np.float64], offsets: NDArray[np.float64],
+               angles: NDArray[np.float64] | None = None) -> NDArray[np.float64]:
+    """Place copies of a motif, rotated about its origin and then shifted.
+
+    Args:
+        motif (NDArray[np.float64]): `(p, 3)` points of the motif, shared by all copies.
+        offsets (NDArray[np.float64]): `(m, 3)` position of each copy.
+        angles (NDArray[np.float64], optional): `(m,)` rotation of each copy.
+            Default is no rotation.
+
+    Returns:
+        NDArray[np.float64]: `(m * p, 3)` points of all the copies, copy by copy.
+    """
+    if angles is None:
+        tiles = motif[None, :, :] + offsets[:, None, :]
+    else:
+        cos, sin = np.cos(angles), np.sin(angles)
+        rotations = np.zeros((len(angles), 3, 3))
+        rotations[:, 0, 0], rotations[:, 0, 1], rotations[:, 1, 0], rotations[:, 1, 1] = cos, -sin, sin, cos
+        rotations[:, 2, 2] = 1.0
+        tiles = np.einsum("mij,pj->mpi", rotations, motif) + offsets[:, None, :]
+    return tiles.reshape(-1, 3)
+
+# ******************************************************************************
+def tessellate(motif: StarGeometry | NDArray[np.float64], lattice: Lattice, *,
+               xRange: tuple[float, float] | None = None,
+               yRange: tuple[float, float] | None = None,
+               angles: Callable[[NDArray[np.float64]], NDArray[np.float64]] | None = None,
+               batchSize: int = 1024,
+               **style) -> "VGroup":
+    """Tile a motif over a lattice, as a few batched VMobjects.
+
+    Only the tiles that reach into the given area are built; by default the
+    area is the frame. The motif's points are computed once and every tile is
+    a shifted, optionally rotated, copy of them. The tiles are grouped into
+    VMobjects of up to `batchSize` tiles each, every tile a closed subpath.
+
+    Args:
+        motif (StarGeometry | NDArray[np.float64]): A star, tiled by its outline,
+            or the `(k, 3)` corners of any polygon centered on the origin.
+        lattice (Lattice): The lattice the tiles are centered on.
+        xRange (tuple[float, float], optional): Horizontal extent of the area to
+            fill. Default is the frame width.
+        yRange (tuple[float, float], optional): Vertical extent of the area to
+            fill. Default is the frame height.
+        angles (Callable, optional): Rotation of the tiles, given the `(m, 3)`
+            offsets of all the tiles built, those reaching into the area, and
+            returning their `(m,)` angles. Default is no rotation.
+        batchSize (int, optional): The most tiles in one VMobject. Default is 1024.
+        **style: The style of the tiles, passed on to each `VMobject`. Default
+            is filled with `FinalColor` without a stroke.
+
+    Returns:
+        VGroup: The batches of tiles.
+    """
+    # manim is only needed to build the tiles; the lattices and points are plain numpy
+    from manim import VGroup, VMobject, config
+
+    corners = motif.vertices if isinstance(motif, StarGeometry) else np.asarray(motif, dtype=np.float64)
+    points = polygonPoints(corners)
+    reach = float(np.linalg.norm(corners, axis=1).max())
+    xRange = xRange or (-config.frame_width / 2, +config.frame_width / 2)
+    yRange = yRange or (-config.frame_height / 2, +config.frame_height / 2)
+    offsets = lattice.points((xRange[0] - reach, xRange[1] + reach), (yRange[0] - reach, yRange[1] + reach))
+    rotations = None if angles is None else np.asarray(angles(offsets), dtype=np.float64).reshape(len(offsets))
+
+    style = {"fill_color": FinalColor, "fill_opacity": 1.0, "stroke_width": 0.0, **style}
+    batches = VGroup()
+    for start in range(0, len(offsets), batchSize):
+        batch = slice(start, start + batchSize)
+        tiles = tilePoints(points, offsets[batch], None if rotations is None else rotations[batch])
+        batches.add(VMobject(**style).set_points(tiles))
+    return batches